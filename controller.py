@@ -15,19 +15,23 @@ Created: December 07, 2022
 # Imports #
 ###########
 # Standard library
+import argparse
 import datetime
 import importlib
 import logging.config
 import logging.handlers
+import multiprocessing
 import os
 import sys
+import time
 import tkinter as tk
+from tkinter import filedialog
 from tkinter import font
 from pathlib import Path
 from tkinter import messagebox
 
-# Third party
-import numpy as np
+# Start of the startup profile (see --profile-startup)
+IMPORT_START = time.perf_counter()
 
 # Add custom path
 try:
@@ -36,15 +40,18 @@ except KeyError:
     sys.path.append('C:\\Users\\MooTra\\Code\\Python')
 
 # Custom
-import app_assets
+# tmpy builds the window (settings model, logo, widgets), so it is
+# not deferred. Importing any part of it runs tmpy/__init__, which
+# also loads its audio and plotting helpers; --profile-startup
+# reports that time separately as 'tmpy imports'.
+import tmpy
+from tmpy import tkgui
+from tmpy.functions import helper_funcs as hf
+TMPY_IMPORTED = time.perf_counter()
 import menus
 import models
 import setup
-import tmpy
 import views
-import tmpy
-from tmpy import tkgui
-from tmpy.functions import helper_funcs as hf
 
 ##########
 # Logger #
@@ -57,8 +64,15 @@ logger = logging.getLogger(__name__)
 ###############
 class Application(tk.Tk):
     """ Application root window. """
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, profile=None, **kwargs):
+        """ Build the main window.
+
+        :param profile: Startup timings, started before the imports
+        :type profile: models.StartupProfile
+        """
         super().__init__(*args, **kwargs)
+        self.profile = profile or models.StartupProfile()
+        self.profile.mark('Tk root')
 
         #############
         # Constants #
@@ -94,6 +108,7 @@ class Application(tk.Tk):
             foreground='blue', 
             font=('TkDefaultFont', 13)
         )
+        self.profile.mark('window setup')
 
         ######################################
         # Initialize Models, Menus and Views #
@@ -106,27 +121,39 @@ class Application(tk.Tk):
             app_name=self.NAME
             )
         self._load_settings()
+        self.profile.mark('settings')
+        # Coalesce settings writes (see _save_settings)
+        self.settings_persister = models.SettingsPersister(
+            root=self,
+            settings=self.settings,
+            settings_model=self.settings_model,
+            delay_ms=self.settings['settings_save_ms'].get()
+        )
 
         # Set up custom logger as soon as config dir is created
         # (i.e., after settings model has been initialized)
         config = tmpy.functions.logging_funcs.setup_logging(self.NAME)
         logging.config.dictConfig(config)
+        # Write log records on a listener thread, not the Tk thread
+        self.log_listener = models.logqueue.start_queue_logging(
+            setup.settings_vars.log_levels)
         logger.info("Started custom logger")
+        self.profile.mark('logging')
 
-        # Default public attributes
-        self.level_data = []
-        logger.info("Setting controller 'start' flag to True")
-        self.start_flag = True
+        # Running session (created by on_start or a resume)
+        self.session = None
 
         # Assign custom quit function on window close
         self.protocol('WM_DELETE_WINDOW', self._quit)
 
-        # Load calibration model
-        self.calibration_model = tkgui.models.CalibrationModel(self.settings)
+        # Calibration model and stimulus cache (created on first use)
+        self._calibration_model = None
+        self._stimulus_cache = None
 
         # Load main view
         self.main_view = views.MainView(self, self.settings)
         self.main_view.grid(row=5, column=5)
+        self.profile.mark('main view')
 
         # Create menu settings dictionary
         self._app_info = {
@@ -137,12 +164,23 @@ class Application(tk.Tk):
         # Load menus
         self.menu = menus.MainMenu(self, self._app_info)
         self.config(menu=self.menu)
+        self.profile.mark('menus')
 
-        # Create data handler
-        self.dh = tmpy.handlers.DataHandler()
+        # Session data writer and journal (opened by on_start)
+        self.writer = None
+        self.journal = None
 
-        # Create score model
-        self.sm = models.ScoreModel()
+        self.bundle = None
+        self.conversions = None
+        self.matrix_cache = None
+        self.level_index = None
+        self.pipeline = None
+        self.engine = None
+        self._poll_id = None
+        self.last_presentation = None
+        self.trial_timing = None
+        # Tag of the last buffer queued (see play)
+        self._play_tag = 0
 
         # Create callback dictionary
         event_callbacks = {
@@ -150,6 +188,7 @@ class Application(tk.Tk):
             '<<FileImportMatrixFile>>': lambda _: self._import_mfile_view(),
             '<<FileCreateMatrixFile>>': lambda _: self._create_mfile_view(),
             '<<FileStart>>': lambda _: self.on_start(),
+            '<<FileResume>>': lambda _: self._resume_session_dialog(),
             '<<FileQuit>>': lambda _: self._quit(),
 
             # CreateView window
@@ -161,6 +200,7 @@ class Application(tk.Tk):
             # Tools menu
             '<<ToolsAudioSettings>>': lambda _: self._show_audio_dialog(),
             '<<ToolsCalibration>>': lambda _: self._show_calibration_dialog(),
+            '<<ToolsMatrixCache>>': lambda _: self._show_matrix_cache(),
 
             # Help menu
             '<<HelpREADME>>': lambda _: self._launch_browser_help('README'),
@@ -178,18 +218,62 @@ class Application(tk.Tk):
 
             # Main View
             '<<MainNext>>': lambda _: self.on_next(),
-            '<<MainRepeat>>': lambda _: self.play(),
+            '<<MainRepeat>>': lambda _: self.on_repeat(),
+
+            # Output engine
+            '<<PlaybackFinished>>': lambda _: self._on_playback_finished(),
         }
 
         # Bind callbacks to sequences
         logger.info("Binding callbacks to controller")
         for sequence, callback in event_callbacks.items():
             self.bind(sequence, callback)
+        self.profile.mark('bindings')
+
+        # Temporarily disable Help menu until documents are written
+        #self.menu.help_menu.entryconfig('README...', state='disabled')
+
+        # Destroy splash screen
+        if '_PYIBoot_SPLASH' in os.environ \
+            and importlib.util.find_spec("pyi_splash"):
+            import pyi_splash
+            pyi_splash.update_text('UI Loaded ...')
+            pyi_splash.close()
+            logger.info('Splash screen closed.')
+
+        # Center main window
+        tmpy.functions.tkgui_funcs.center_window(self)
+        self.profile.mark('show window')
+
+        # Finish startup once the window is on screen
+        self._print_profile = profile is not None
+        self.after_idle(self._after_startup)
+
+        # Initialization successful
+        logger.info('Application initialized successfully')
 
-        ###################
-        # Version Control #
-        ###################
-        # Check for updates
+    #####################
+    # Startup Functions #
+    #####################
+    def _after_startup(self):
+        """ Load the menu icons and check for updates after the
+        main window is shown, then report the startup timings.
+        """
+        self.update_idletasks()
+        self.profile.mark('first draw')
+        self.menu.load_icons()
+        self.profile.mark('menu icons')
+        if not self._check_for_updates():
+            return
+        self.profile.mark('update check')
+        self.profile.log()
+        if self._print_profile:
+            print(self.profile.report())
+
+    def _check_for_updates(self):
+        """ Check the version library for a newer version. Returns
+        False if the application was closed for a mandatory update.
+        """
         if self.settings['check_for_updates'].get() == 'yes':
             _filepath = self.settings['version_lib_path'].get()
             u = tkgui.models.VersionModel(_filepath, self.NAME, self.VERSION)
@@ -202,8 +286,9 @@ class Application(tk.Tk):
                         f"version {u.new_version} is available."
                 )
                 logger.error("Application failed to initialize")
-                self.destroy()
-                return
+                # Stop the log listener so queued records are written
+                self._quit()
+                return False
             elif u.status == 'optional':
                 messagebox.showwarning(
                     title="New Version Available",
@@ -226,23 +311,24 @@ class Application(tk.Tk):
                     message="The version library is unreachable!",
                     detail="Please check that you have access to Starfile."
                 )
+        return True
 
-        # Temporarily disable Help menu until documents are written
-        #self.menu.help_menu.entryconfig('README...', state='disabled')
+    @property
+    def calibration_model(self):
+        """ Calibration model, created on first use. """
+        if self._calibration_model is None:
+            self._calibration_model = tkgui.models.CalibrationModel(
+                self.settings)
+        return self._calibration_model
 
-        # Destroy splash screen
-        if '_PYIBoot_SPLASH' in os.environ \
-            and importlib.util.find_spec("pyi_splash"):
-            import pyi_splash
-            pyi_splash.update_text('UI Loaded ...')
-            pyi_splash.close()
-            logger.info('Splash screen closed.')
-
-        # Center main window
-        tmpy.functions.tkgui_funcs.center_window(self)
-
-        # Initialization successful
-        logger.info('Application initialized successfully')
+    @property
+    def stimulus_cache(self):
+        """ Cache of decoded stimuli, created on first use. """
+        if self._stimulus_cache is None:
+            self._stimulus_cache = models.StimulusCache(
+                max_bytes=self.settings['stimulus_cache_mb'].get() * 1024**2
+            )
+        return self._stimulus_cache
 
     #####################
     # General Functions #
@@ -259,6 +345,12 @@ class Application(tk.Tk):
     def _quit(self):
         """ Exit the application. """
         logger.info("User ended the session")
+        self._close_render_pipeline()
+        self._close_output_engine()
+        self._close_writer()
+        self._close_journal()
+        self._save_settings()
+        self.log_listener.stop()
         self.destroy()
 
     ###################
@@ -287,28 +379,425 @@ class Application(tk.Tk):
             'randomize': vals['Randomize'],
             'write': self.settings['write_matrix'].get()
         }
+        options = self._shuffle_options(vals)
+        if options is None:
+            return None
+        pars.update(options)
         # Create and write matrix CSV file
         mf = models.ImportSpeechTaskerMatrix(**pars)
-        return mf.import_matrix_file()
+        try:
+            return mf.import_matrix_file()
+        except ValueError as e:
+            logger.error("Cannot randomize trials: %s", e)
+            messagebox.showerror(
+                title="Cannot Randomize Trials",
+                message="The trials cannot be ordered to satisfy the "
+                    + "randomization constraints.",
+                detail=e
+            )
+            return None
+
+    def _shuffle_options(self, vals):
+        """ Return the shuffle seed and constraints from settings,
+        or None (after showing an error) if either is invalid.
+        """
+        try:
+            seed = int(vals['Seed']) if vals['Seed'].strip() else None
+            constraints = models.shuffleengine.parse_constraints(
+                vals['Constraints'])
+        except ValueError as e:
+            messagebox.showerror(
+                title="Invalid Randomization",
+                message="The seed must be a whole number (or blank), and "
+                    + "constraints must read like: max_run speaker 2; "
+                    + "no_repeat list_num; balance level 8",
+                detail=e
+            )
+            return None
+        return {'seed': seed, 'constraints': constraints}
 
     def on_start(self):
-        """ Import matrix file and create TrialHandler. """
+        """ Import matrix file and create the trial table. """
         logger.info("Start button pressed")
         # Create filename with time stamp
         self.filename = self._create_filename()
         # Prepare trials
         trials = self._prepare_trials()
-        # Create trial handler
-        self.th = tmpy.handlers.TrialHandler(
-            trials_df=trials
-            )
-        # Disable "Start" from File menu
+        if trials is None:
+            return
+        # Journal the realised trial order and calibration
+        if not self._open_journal():
+            return
+        self.session = models.SessionEngine(
+            trials,
+            settings=tmpy.functions.tkgui_funcs.get_tk_values(self.settings),
+            journal=self.journal,
+            slm_offset=self.settings['slm_offset'].get()
+        )
+        self.session.start(filename=self.filename)
+        self._journal_calibration()
+        self._begin_session(start_row=0)
+
+    def _begin_session(self, start_row, resume=False):
+        """ Open the session outputs and devices, then present the
+        trial at start_row.
+
+        :param start_row: Row index of the first trial to present
+        :type start_row: int
+        :param resume: Whether an interrupted session is continued
+        :type resume: bool
+        """
+        # Open the data file for the whole session
+        if not self._open_writer(resume=resume):
+            self._abort_session(discard_journal=not resume)
+            return
+        self.session.writer = self.writer
+        # Open stimulus directory or bundle
+        if not self._open_stimulus_source():
+            self._abort_session(discard_journal=not resume)
+            return
+        # Open the output device for the whole session
+        if not self._open_output_engine():
+            self._abort_session(discard_journal=not resume)
+            return
+        # Convert stimuli that do not match the output stream
+        self._prepare_conversions()
+        # Measure stimulus levels once per stimulus set
+        self._build_level_index()
+        # Scale the masker first: preflight adds its peak to trials
+        masker = None
+        if self.settings['Present Noise'].get() == 1:
+            masker = self._render_masker()
+            if masker is None:
+                self._abort_session(discard_journal=not resume)
+                return
+        # Validate every trial before the first presentation
+        if not self._preflight(masker):
+            self._abort_session(discard_journal=not resume)
+            return
+        if not self._start_masker(masker):
+            self._abort_session(discard_journal=not resume)
+            return
+        self._poll_playback()
+        # Checkpoint settings before the first trial
+        self._save_settings()
+        # Start rendering the first trials in the background
+        self.pipeline = models.RenderPipeline(
+            channels=self.engine.channels,
+            depth=self.settings['prefetch_depth'].get(),
+            cache_bytes=self.settings['stimulus_cache_mb'].get() * 1024**2
+        )
+        self._schedule_renders(start=start_row)
+        # Disable "Start" and "Resume Session..." from File menu
         self.menu.file_menu.entryconfig('Start', state='disabled')
+        self.menu.file_menu.entryconfig('Resume Session...', state='disabled')
         # Enable user controls
         self.main_view.enable_user_controls(text="Next")
         # Start first trial
         self.on_next()
 
+    def _abort_session(self, discard_journal=False):
+        """ Close everything opened by a session that failed to
+        start.
+
+        :param discard_journal: Delete the journal (a new session
+            that never presented a trial has nothing to resume)
+        :type discard_journal: bool
+        """
+        self._close_output_engine()
+        self._close_writer()
+        journal = self.journal
+        self._close_journal()
+        if discard_journal and journal is not None:
+            logger.info("Removing journal of aborted session: %s",
+                journal.filepath)
+            try:
+                journal.filepath.unlink()
+            except OSError as e:
+                logger.warning("Cannot remove session journal: %s", e)
+        self.session = None
+
+    def _stop_session(self):
+        """ Stop a running session that can no longer continue.
+        Scored trials are kept; the journal can be resumed.
+        """
+        logger.warning("Stopping session")
+        self._close_render_pipeline()
+        self._abort_session()
+        self.main_view.disable_user_controls(text="Next")
+        self.menu.file_menu.entryconfig('Start', state='normal')
+        self.menu.file_menu.entryconfig('Resume Session...', state='normal')
+
+    def _masker_routing(self):
+        """ Return the masker speakers as a list of ints. """
+        return hf.string_to_list(self.settings['Noise Speakers'].get(), 'int')
+
+    def _session_speakers(self):
+        """ Return every speaker used by sentences or the masker. """
+        speakers = [int(s) for s in self.session.trials['speaker'].unique()]
+        if self.settings['Present Noise'].get() == 1:
+            speakers += self._masker_routing()
+        return speakers
+
+    def _open_output_engine(self):
+        """ Open the audio device once for the session, with one
+        channel per speaker in the matrix. Returns False if the
+        device could not be opened.
+        """
+        logger.info("Opening output engine")
+        device = self.settings['audio_device'].get()
+        try:
+            # 0 means use the device's default rate
+            samplerate = self.settings['output_samplerate'].get()
+            if samplerate <= 0:
+                samplerate = models.OutputEngine.default_samplerate(device)
+            self.engine = models.OutputEngine(
+                device=device,
+                channels=max(self._session_speakers()),
+                samplerate=samplerate,
+                blocksize=self.settings['output_blocksize'].get()
+            )
+        except tmpy.audio_handlers.InvalidAudioDevice as e:
+            logger.error("Invalid audio device: %s", e)
+            messagebox.showerror(
+                title="Invalid Device",
+                message="Invalid audio device! Go to Tools>Audio Settings "
+                    + "to select a valid audio device.",
+                detail=e
+            )
+            self._show_audio_dialog()
+            return False
+        return True
+
+    def _cache_dir(self, name):
+        """ Return a cache subdirectory under 'cache_dir' (or the
+        user's home directory if it is not set).
+        """
+        root = self.settings['cache_dir'].get()
+        if not root:
+            root = Path.home() / '.speech_tasker'
+        return Path(root) / name
+
+    def _prepare_conversions(self):
+        """ Resample/remix every session stimulus that does not
+        match the output stream, once, before the first trial.
+        """
+        logger.info("Preparing stimulus conversions")
+        self.conversions = models.ConversionCache(
+            cache_dir=self._cache_dir('conversions'),
+            target_sr=self.engine.samplerate,
+            channels=1
+        )
+        names = self.session.trials['file'].unique()
+        if self.bundle is not None:
+            sources = {name: self.bundle.path for name in names}
+        else:
+            sources = {name: self._stimulus_path(name) for name in names}
+        self.config(cursor='watch')
+        self.update_idletasks()
+        try:
+            self.conversions.prepare(
+                sources, in_bundle=self.bundle is not None)
+        finally:
+            self.config(cursor='')
+        if self.conversions.downmixed:
+            logger.warning(
+                "Downmixed %d multichannel stimuli to mono: %s",
+                len(self.conversions.downmixed),
+                ', '.join(self.conversions.downmixed)
+            )
+
+    def _level_source(self, filename):
+        """ Return the (kind, path) a stimulus is played from. """
+        if filename in self.conversions:
+            return 'converted', self.conversions.converted[filename]
+        if self.bundle is not None:
+            return 'bundle', self.bundle.path
+        return 'file', self._stimulus_path(filename)
+
+    def _build_level_index(self):
+        """ Load the level index stored next to the stimuli and
+        measure any new or changed stimuli.
+        """
+        logger.info("Building level index")
+        if self.bundle is not None:
+            index_path = self.bundle.path.with_suffix('.levels.json')
+        else:
+            index_path = Path(
+                self.settings['import_audio_path'].get()) / 'levels.json'
+        self.level_index = models.LevelIndex(index_path)
+        sources = {
+            name: self._level_source(name) 
+            for name in self.session.trials['file'].unique()
+        }
+        self.config(cursor='watch')
+        self.update_idletasks()
+        try:
+            self.level_index.update(sources)
+        finally:
+            self.config(cursor='')
+
+    def _preflight(self, masker=None, start_row=0):
+        """ Check files, sampling rates, routing and clipping for
+        every trial. Returns False (after showing a single report)
+        if any trial would fail.
+
+        :param masker: Scaled masker mixed under every trial, if any
+        :type masker: np.ndarray
+        :param start_row: First trial to check (0-based)
+        :type start_row: int
+        """
+        report = models.preflight.check_trials(
+            trials=self.session.trials.iloc[start_row:],
+            level_index=self.level_index,
+            channels=self.engine.channels,
+            samplerate=self.engine.samplerate,
+            slm_offset=self.settings['slm_offset'].get(),
+            masker=masker,
+            masker_routing=self._masker_routing()
+        )
+        if report.ok:
+            return True
+        # The render pipeline only exists once the session is running
+        outcome = "was not started" if self.pipeline is None else "was stopped"
+        messagebox.showerror(
+            title="Pre-flight Check Failed",
+            message=f"Some trials cannot be presented. The session {outcome}.",
+            detail=report.summary()
+        )
+        return False
+
+    def _render_masker(self):
+        """ Load the masker and scale it to the calibrated 'Noise
+        Level'. Returns None (after showing an error) if the masker
+        cannot be loaded or would clip.
+
+        Like sentence levels, the noise level is converted to dB FS
+        by subtracting the SLM offset.
+        """
+        try:
+            audio, fs = self.stimulus_cache.get(
+                self.settings['masker_file_path'].get())
+        except (FileNotFoundError, RuntimeError):
+            logger.exception("Cannot load masker file!")
+            messagebox.showerror(
+                title="File Not Found",
+                message="Cannot load the masker file!",
+                detail="Please provide a valid masker file."
+            )
+            return None
+        level = (self.settings['Noise Level'].get() 
+            - self.settings['slm_offset'].get())
+        try:
+            # Match the output stream format
+            audio = models.conversioncache.convert(
+                audio, fs, self.engine.samplerate,
+                len(self._masker_routing()))
+            return models.audiorender.render_masker(audio, level)
+        except tmpy.audio_handlers.Clipping as e:
+            logger.error("Masker clipping has occurred - aborting!")
+            messagebox.showerror(
+                title="Clipping",
+                message="The noise level is too high and caused clipping.",
+                detail="The waveform will be plotted when this " 
+                    + "message is closed for visual inspection."
+            )
+            self._plot_waveform(e.buffer, fs, "Clipped Masker")
+            return None
+
+    def _start_masker(self, masker=None):
+        """ Loop the masker for the whole session. Returns False if
+        the masker could not be started.
+
+        :param masker: Masker from _render_masker (rendered here if
+            None)
+        :type masker: np.ndarray
+        """
+        if self.settings['Present Noise'].get() != 1:
+            return True
+        logger.info("Starting masker")
+        if masker is None:
+            masker = self._render_masker()
+            if masker is None:
+                return False
+        try:
+            self.engine.set_masker(masker, self._masker_routing())
+        except ValueError as e:
+            logger.error("Invalid masker routing: %s", e)
+            messagebox.showerror(
+                title="Invalid Routing",
+                message="Noise speakers must correspond with the "
+                    + "number of channels in the masker file!",
+                detail=e
+            )
+            return False
+        return True
+
+    def _poll_playback(self):
+        """ Collect finished buffers from the output engine and post
+        a <<PlaybackFinished>> event for each on the Tk thread.
+        """
+        for timing in self.engine.poll_finished():
+            logger.info("Presentation timing: %s", timing)
+            if timing.get('clipped_blocks'):
+                self._report_output_clipping(timing['clipped_blocks'])
+            # Only the last buffer queued ends the presentation
+            if timing['tag'] != self._play_tag:
+                logger.info("Ignoring finish of superseded buffer %s",
+                    timing['tag'])
+                continue
+            self.last_presentation = timing
+            self.event_generate('<<PlaybackFinished>>')
+        self._poll_id = self.after(10, self._poll_playback)
+
+    def _report_output_clipping(self, blocks):
+        """ Warn that the masker plus the last trial exceeded full
+        scale and was clipped in the output stream.
+        """
+        logger.error(
+            "Output clipping: %d block(s) of the last trial were clipped "
+            + "(%d this session)", blocks, self.engine.clipped_blocks
+        )
+        messagebox.showerror(
+            title="Clipping",
+            message="The sentence plus the noise exceeded full scale "
+                + "and was clipped during playback!",
+            detail=f"{blocks} block(s) of the last trial were clipped. "
+                + "The presented level was not the calibrated level. "
+                + "Lower the sentence or noise level."
+        )
+
+    def _on_playback_finished(self):
+        """ Keep the timing of the trial's first presentation and
+        re-enable user controls.
+        """
+        if self.trial_timing is None:
+            self.trial_timing = self.last_presentation
+        self.main_view.enable_user_controls(text="Next")
+
+    def _timing_fields(self):
+        """ Return measured presentation timing for the data file. """
+        timing = self.trial_timing or {}
+        start = timing.get('start')
+        queued = timing.get('queued')
+        latency = None
+        if start is not None and queued is not None:
+            latency = round((start - queued) * 1000, 3)
+        return {
+            'playback_start': start,
+            'playback_stop': timing.get('stop'),
+            'onset_latency_ms': latency
+        }
+
+    def _close_output_engine(self):
+        """ Close the session output stream, if open. """
+        if self._poll_id is not None:
+            self.after_cancel(self._poll_id)
+            self._poll_id = None
+        if self.engine is not None:
+            self.engine.close()
+            self.engine = None
+
     #######################
     # Main View Functions #
     #######################
@@ -321,120 +810,292 @@ class Application(tk.Tk):
 
             Do NOT use: self.settings['desired_level_dB'].get()
         """
-        self._calc_level(self.th.trial_info['level'])
-        # Add directory to file name
-        stim = Path(os.path.join(
+        self._calc_level(self.session.desired_level)
+        return self.session.trial['file']
+
+    def _open_stimulus_source(self):
+        """ Open 'import_audio_path' as a packed stimulus bundle if
+        it is one; otherwise it is treated as a directory. Returns
+        False if the bundle cannot be opened.
+        """
+        path = self.settings['import_audio_path'].get()
+        self.bundle = None
+        if not models.stimulusbundle.is_bundle(path):
+            logger.info("Reading stimuli from directory: %s", path)
+            return True
+        try:
+            self.bundle = models.StimulusBundle(path)
+        except (OSError, ValueError) as e:
+            logger.exception("Cannot open stimulus bundle")
+            messagebox.showerror(
+                title="Invalid Bundle",
+                message="Cannot open the stimulus bundle!",
+                detail=e
+            )
+            return False
+        logger.info("Reading %d stimuli from bundle: %s", 
+            len(self.bundle), path)
+        return True
+
+    def _stimulus_path(self, filename):
+        """ Return the full path to a stimulus file. """
+        return Path(os.path.join(
             self.settings['import_audio_path'].get(),
-            self.th.trial_info['file']
+            filename
             )
         )
-        return stim
+
+    def _render_spec(self, row):
+        """ Return the render job for a row of the trial matrix. """
+        return self.session.render_spec(
+            row, self.level_index, self._level_source)
+
+    def _schedule_renders(self, start):
+        """ Queue upcoming trials for rendering.
+
+        :param start: Row index of the first upcoming trial
+        :type start: int
+        """
+        stop = min(start + self.pipeline.depth, len(self.session.th))
+        self.pipeline.schedule(
+            [(row, self._render_spec(row)) for row in range(start, stop)])
+
+    def _close_render_pipeline(self):
+        """ Stop the render process, if running. """
+        if self.pipeline is not None:
+            logger.info("Render summary: %s", self.pipeline.stats)
+            self.pipeline.close()
+            self.pipeline = None
 
     def play(self):
-        """ Begin audio playback. """
+        """ Begin audio playback. Returns False if nothing was
+        queued for playback.
+        """
         # Prepare audio for playback
-        stim = self._prepare_stimulus()
-        # Present WGN
-        self.present_audio(
-            audio=stim,
-            pres_level=self.settings['adjusted_level_dB'].get()
-        )
+        self._prepare_stimulus()
+        # Fetch the pre-rendered buffer (Repeat reuses it)
+        row = self.session.th.trial_num - 1
+        try:
+            buffer = self.pipeline.get(row, self._render_spec(row))
+        except models.RenderError as e:
+            logger.error("Cannot render trial: %s", e)
+            messagebox.showerror(
+                title="Render Failed",
+                message="The trial stimulus could not be prepared!",
+                detail=e
+            )
+            return False
+        # Queue stimulus into the session output stream, tagged so
+        # its finish can be told apart from earlier buffers
+        self._play_tag += 1
+        self.engine.play(buffer, tag=self._play_tag)
+        return True
+
+    def on_repeat(self):
+        """ Present the current trial again. """
+        logger.info("Repeating trial")
+        # Disable user controls during playback
+        # (re-enabled by <<PlaybackFinished>>)
+        self.main_view.disable_user_controls(text="Presenting")
+        if not self.play():
+            self.main_view.enable_user_controls(text="Next")
 
     def _end_of_task(self):
         """ Present message to user and destroy root. """
+        self._close_render_pipeline()
+        self._close_output_engine()
+        self._close_writer()
+        self.session.finish()
+        self._close_journal()
+        self._save_settings()
         messagebox.showinfo(
             title="Task Complete",
             message="You have completed the task!"
         )
         logger.info("Closing application")
+        self.log_listener.stop()
         self.quit()
 
-    def _save(self, responses):
-        """ Save data to CSV, on a per trial basis, after scoring 
-        each trial. 
+    def _open_writer(self, resume=False):
+        """ Open the session output: a CSV file under 'Data', or the
+        session database if 'data_backend' is 'sqlite'. Returns False
+        if the output cannot be opened.
+
+        :param resume: Append to the database session of the data
+            file instead of starting a new one
+        :type resume: bool
+        """
+        try:
+            if self.settings['data_backend'].get() == 'sqlite':
+                self.writer = models.SessionStore(
+                    filepath=self._database_path(),
+                    subject=self.settings['Subject'].get(),
+                    condition=self.settings['Condition'].get(),
+                    data_file=self.filename,
+                    resume=resume
+                )
+            else:
+                self.writer = models.SessionWriter(
+                    filepath=os.path.join('Data', self.filename)
+                )
+        except OSError as e:
+            self._show_save_error(e)
+            return False
+        return True
+
+    def _database_path(self):
+        """ Return 'database_path', or Data/sessions.db if unset. """
+        path = self.settings['database_path'].get()
+        return Path(path) if path else Path('Data') / 'sessions.db'
+
+    def _open_journal(self, path=None):
+        """ Open the session journal (a new one next to the data
+        file, or an existing one when resuming). Returns False if
+        the journal cannot be opened.
         """
-        # Add directory to filename
-        directory = 'Data'
-        fullpath = os.path.join(directory, self.filename)
-        # Define items to include in CSV
-        order = [
-            'trial',
-            'Subject',
-            'Condition',
-            'file',
-            'list_num',
-            'sentence_num',
-            'speaker',
-            'desired_level_dB',
-            'correct',
-            'incorrect',
-            'total_words',
-            'num_correct'
-        ]
+        if path is None:
+            path = models.sessionjournal.journal_path('Data', self.filename)
         try:
-            self.dh.save_data(
-                filepath=fullpath,
-                dict_list=[self.settings, responses, self.th.trial_info],
-                order=order
+            self.journal = models.SessionJournal(path)
+        except OSError as e:
+            self._show_save_error(e)
+            return False
+        return True
+
+    def _journal_calibration(self):
+        """ Record the current calibration in the journal. """
+        self.session.calibrate(
+            slm_offset=self.settings['slm_offset'].get(),
+            slm_reading=self.settings['slm_reading'].get(),
+            cal_level_dB=self.settings['cal_level_dB'].get()
+        )
+
+    def _close_journal(self):
+        """ Write any queued records and close the journal. """
+        if self.journal is None:
+            return
+        try:
+            self.journal.close()
+        except OSError as e:
+            logger.exception("Cannot close session journal: %s", e)
+        self.journal = None
+
+    def _resume_session_dialog(self):
+        """ Ask for a session journal and resume it. """
+        path = filedialog.askopenfilename(
+            title="Resume Session",
+            initialdir='Data',
+            filetypes=[("Session journal", "*.journal")]
+        )
+        if path:
+            self._resume_session(path)
+
+    def _resume_session(self, path):
+        """ Rebuild the session state from a journal and continue
+        with the first unscored trial. Nothing is replayed or
+        re-scored.
+        """
+        logger.info("Resuming session from %s", path)
+        try:
+            state = models.sessionjournal.read_journal(path)
+        except (OSError, ValueError) as e:
+            logger.exception("Cannot read session journal")
+            messagebox.showerror(
+                title="Cannot Resume",
+                message="Cannot read the session journal!",
+                detail=e
+            )
+            return
+        if state['complete']:
+            messagebox.showinfo(
+                title="Session Complete",
+                message="This session has already been completed."
             )
-        except PermissionError as e:
-            logger.exception(e)
+            return
+        # Restore session settings, then the latest calibration
+        restored = dict(state['settings'], **state['calibration'])
+        for key, value in restored.items():
+            if key in self.settings:
+                self.settings[key].set(value)
+        # Rebuild trial state
+        self.filename = state['filename']
+        # The next call to on_next presents without scoring
+        self.session = models.SessionEngine.from_journal(
+            state,
+            settings=tmpy.functions.tkgui_funcs.get_tk_values(self.settings),
+            slm_offset=self.settings['slm_offset'].get()
+        )
+        scored = state['scored']
+        logger.info("Resuming at trial %d of %d", 
+            len(scored) + 1, len(self.session.trials))
+        if not self._open_journal(path):
+            self.session = None
+            return
+        self.session.journal = self.journal
+        self._begin_session(start_row=len(scored), resume=True)
+
+    def _close_writer(self):
+        """ Write any queued rows and close the data file. """
+        if self.writer is None:
+            return
+        try:
+            self.writer.close()
+        except OSError as e:
+            self._show_save_error(e)
+        self.writer = None
+
+    def _show_save_error(self, e):
+        """ Report a data file error. """
+        logger.exception(e)
+        if isinstance(e, PermissionError):
             messagebox.showerror(
                 title="Access Denied",
                 message="Data not saved! Cannot write to file!",
                 detail=e
             )
-            return
-        except OSError as e:
-            logger.exception(e)
+        else:
             messagebox.showerror(
                 title="File Not Found",
                 message="Cannot find file or directory!",
                 detail=e
             )
-            return
 
     def on_next(self):
         """ Get and present next trial. """
         logger.info("Fetching next trial")
-        # Score and save responses
-        if not self.start_flag:
-            # Score response
-            scored_words = self.sm.score(
-                words=self.main_view.words_dict,
-                button_states=self.main_view.buttonstates_dict
-            )
-            # Write response to CSV
-            self._save(scored_words)
-            # Append trial level to level_data
-            self.level_data.append(self.settings['desired_level_dB'].get())
-        if self.start_flag:
-            # Set start flag to False after intitial trial
-            logger.info("Setting 'start' flag to False")
-            self.start_flag = False
+        # Score and save responses (not before the first trial
+        # or the first trial after a resume)
+        if self.session.awaiting_response:
+            try:
+                self.session.score(
+                    marked=self.main_view.marked_words(),
+                    timing=self._timing_fields()
+                )
+            except OSError as e:
+                self._show_save_error(e)
         # Get next trial
-        try:
-            self.th.next()
-        except IndexError:
-            logger.warning("End of trials!")
+        trial = self.session.next()
+        if trial is None:
             self._end_of_task()
             return
         # Display sentence with checkbuttons
-        self.main_view.update_main_label(
-            sentence=self.th.trial_info['sentence'])
+        self.main_view.update_main_label(sentence=trial['sentence'])
         # Update trial label
         self.main_view.update_info_labels(
-            trial=self.th.trial_num,
-            speaker=self.th.trial_info['speaker']
+            trial=self.session.th.trial_num,
+            speaker=trial['speaker']
         )
         # Disable user controls during playback
+        # (re-enabled by <<PlaybackFinished>>)
         self.main_view.disable_user_controls(text="Presenting")
         # Present audio
-        self.play()
-        # Enable user controls after playback
-        self.after(int(np.ceil(self.a.dur*1000)), 
-                   lambda: self.main_view.enable_user_controls(text="Next")
-        )
+        self.trial_timing = None
+        if not self.play():
+            self.main_view.enable_user_controls(text="Next")
+        # Render upcoming trials while this one is scored
+        # (trial_num is 1-based, so it indexes the next row)
+        self.pipeline.release_before(self.session.th.trial_num - 1)
+        self._schedule_renders(start=self.session.th.trial_num)
 
     ########################
     # ImportView Functions #
@@ -478,12 +1139,60 @@ class Application(tk.Tk):
             'randomize': vals['Randomize'],
             'write': True
         }
+        options = self._shuffle_options(vals)
+        if options is None:
+            return
+        pars.update(options)
+        # Identical designs are loaded from the matrix cache
+        pars['cache'] = self._get_matrix_cache()
         # Create and write matrix CSV file
         mf = models.CreateSpeechTaskerMatrix(**pars)
-        mf.create_matrix_file()
+        if mf.create_matrix_file() is None:
+            messagebox.showerror(
+                title="Cannot Create Matrix File",
+                message="The matrix file could not be created. Check the "
+                    + "lists, levels, speakers and randomization constraints."
+            )
         # Save settings (controller does not call save for CreateView)
         self._save_settings()
 
+    def _get_matrix_cache(self):
+        """ Open the matrix cache on first use. """
+        if self.matrix_cache is None:
+            self.matrix_cache = models.MatrixCache(
+                cache_dir=self._cache_dir('matrices'),
+                max_bytes=self.settings['matrix_cache_mb'].get() * 1024**2
+            )
+        return self.matrix_cache
+
+    def _show_matrix_cache(self):
+        """ List cached matrices and offer to clear them. """
+        cache = self._get_matrix_cache()
+        entries = cache.entries()
+        if not entries:
+            messagebox.showinfo(
+                title="Matrix Cache",
+                message="The matrix cache is empty."
+            )
+            return
+        lines = []
+        for entry in entries[:10]:
+            pars = entry['pars'] or {}
+            lines.append(
+                f"Lists {pars.get('lists')}, {entry['trials']} trials"
+                + (f", seed {pars['seed']}" if pars.get('seed') is not None
+                   else "")
+            )
+        if len(entries) > 10:
+            lines.append(f"...and {len(entries) - 10} more")
+        if messagebox.askyesno(
+            title="Matrix Cache",
+            message=f"{len(entries)} cached matrices "
+                + f"({cache.nbytes / 1024**2:.1f} MB). Clear the cache?",
+            detail="\n".join(lines)
+        ):
+            cache.clear()
+
     ###########################
     # Settings View Functions #
     ###########################
@@ -505,11 +1214,9 @@ class Application(tk.Tk):
             "running settings dict")
 
     def _save_settings(self, *_):
-        """ Save current runtime parameters to file. """
-        logger.info("Calling settings model set and save funcs")
-        for key, variable in self.settings.items():
-            self.settings_model.set(key, variable.get())
-            self.settings_model.save()
+        """ Save changed runtime parameters to file now (checkpoint). """
+        logger.info("Saving changed settings")
+        self.settings_persister.flush()
 
     ########################
     # Tools Menu Functions #
@@ -552,13 +1259,40 @@ class Application(tk.Tk):
         self.calibration_model.calc_offset()
         # Save level - this must be called here!
         self._save_settings()
+        if self.pipeline is None:
+            if self.journal is not None:
+                self._journal_calibration()
+            return
+        # Check the remaining trials and masker at the new offset
+        # (the current trial may still be repeated)
+        start_row = self.session.th.trial_num - 1
+        masker = None
+        if self.settings['Present Noise'].get() == 1:
+            masker = self._render_masker()
+            if masker is None:
+                self._stop_session()
+                return
+        if not self._preflight(masker, start_row=start_row):
+            self._stop_session()
+            return
+        if not self._start_masker(masker):
+            self._stop_session()
+            return
+        # Only journal a calibration the session can run at, so a
+        # resumed session does not fail the same check
+        if self.journal is not None:
+            self._journal_calibration()
+        # Re-render pending trials at the new offset
+        self.pipeline.invalidate()
+        self._schedule_renders(start=start_row)
 
     def _calc_level(self, desired_spl):
         """ Calculate new dB FS level using slm_offset. """
         # Calculate new presentation level
         self.calibration_model.calc_level(desired_spl)
         # Save level - this must be called here!
-        self._save_settings()
+        # (debounced, as this runs on every trial)
+        self.settings_persister.request_save()
 
     #######################
     # Help Menu Functions #
@@ -571,6 +1305,9 @@ class Application(tk.Tk):
         :return: Opens file in browser
         :rtype: None
         """
+        # Imported here: only needed for the help documents
+        import app_assets
+
         # Determine which help doc to display
         if help_file == "README":
             markdown_file = app_assets.README.README_MD
@@ -622,13 +1359,14 @@ class Application(tk.Tk):
     
     def _play(self, pres_level):
         """ Format channel routing, present audio and catch exceptions. """
-        # Get routing either from a trial handler or settings
-        try:
-            routing=[self.th.trial_info['speaker']]
-        except AttributeError:
+        # Get routing from the current trial during a session,
+        # otherwise from settings
+        if self.session is not None and self.session.th.trial_num > 0:
+            routing = [self.session.trial['speaker']]
+        else:
             routing = hf.string_to_list(
                 self.settings['channel_routing'].get(), 'int')
-            
+
         # Attempt to present audio
         try:
             self.a.play(
@@ -691,9 +1429,24 @@ class Application(tk.Tk):
         # Play audio
         self._play(pres_level)
 
+    def _plot_waveform(self, buffer, fs, title):
+        """ Plot a rendered buffer for visual inspection. """
+        import matplotlib.pyplot as plt
+        import numpy as np
+        t = np.arange(buffer.shape[0]) / fs
+        plt.plot(t, buffer)
+        plt.title(title)
+        plt.xlabel("Time (s)")
+        plt.ylabel("Amplitude")
+        plt.axhline(y=1.0, color='k', linestyle='--')
+        plt.axhline(y=-1.0, color='k', linestyle='--')
+        plt.show()
+
     def stop_audio(self):
         """ Stop audio playback. """
         logger.info("User stopped audio playback")
+        if self.engine is not None:
+            self.engine.stop()
         try:
             self.a.stop()
         except AttributeError:
@@ -703,5 +1456,19 @@ class Application(tk.Tk):
 # Module Guard #
 ################
 if __name__ == "__main__":
-    app = Application()
+    # Required for process pools in the frozen (PyInstaller) app
+    multiprocessing.freeze_support()
+    parser = argparse.ArgumentParser(description="Speech Tasker")
+    parser.add_argument(
+        '--profile-startup',
+        action='store_true',
+        help="Print the time taken by each startup phase"
+    )
+    args, _ = parser.parse_known_args()
+    profile = None
+    if args.profile_startup:
+        profile = models.StartupProfile(start=IMPORT_START)
+        profile.mark('tmpy imports', at=TMPY_IMPORTED)
+        profile.mark('app imports')
+    app = Application(profile=profile)
     app.mainloop()
@@ -49,10 +49,12 @@ class MainMenu(tk.Menu):
         self.bind_all('<Control-q>', self._event('<<FileQuit>>'))
 
 
-    def _create_icons(self):
-        """ Create a dictionary of icons. Necessary because
-            PhotoImage objects cannot be created until an 
-            instance of Tk has been created.
+    def load_icons(self):
+        """ Create the menu icons and add them to their entries.
+            Called once the main window is shown, so the PNG files
+            are not read before the window appears. (PhotoImage
+            objects cannot be created until an instance of Tk has
+            been created.)
         """
         logger.info("Importing icons")
         self.icons = {
@@ -71,6 +73,8 @@ class MainMenu(tk.Menu):
             'help_help': tk.PhotoImage(file=images.HELP_ICON),
             'help_changelog': tk.PhotoImage(file=images.CHANGELOG_ICON)
         }
+        for menu, label, icon in self._icon_entries:
+            menu.entryconfig(label, image=self.icons[icon], compound=tk.LEFT)
 
 
     def __init__(self, parent, _app_info, **kwargs):
@@ -80,8 +84,8 @@ class MainMenu(tk.Menu):
         # Assign variables
         self._app_info = _app_info
 
-        # Create icons
-        self._create_icons()
+        # (menu, entry label, icon) for load_icons
+        self._icon_entries = []
 
         #############
         # File Menu #
@@ -90,22 +94,26 @@ class MainMenu(tk.Menu):
         self.file_menu = tk.Menu(self, tearoff=False)
         self.file_menu.add_command(
             label="Import Matrix File...",
-            command=self._event('<<FileImportMatrixFile>>'),
-            image=self.icons['file_upload'],
-            compound=tk.LEFT
+            command=self._event('<<FileImportMatrixFile>>')
         )
+        self._icon_entries.append(
+            (self.file_menu, 'Import Matrix File...', 'file_upload'))
         self.file_menu.add_command(
             label="Create Matrix File...",
-            command=self._event('<<FileCreateMatrixFile>>'),
-            image=self.icons['file_settings'],
-            compound=tk.LEFT
+            command=self._event('<<FileCreateMatrixFile>>')
         )
+        self._icon_entries.append(
+            (self.file_menu, 'Create Matrix File...', 'file_settings'))
         self.file_menu.add_separator()
         self.file_menu.add_command(
             label="Start",
-            command=self._event('<<FileStart>>'),
-            image=self.icons['file_start'],
-            compound=tk.LEFT
+            command=self._event('<<FileStart>>')
+        )
+        self._icon_entries.append(
+            (self.file_menu, 'Start', 'file_start'))
+        self.file_menu.add_command(
+            label="Resume Session...",
+            command=self._event('<<FileResume>>')
         )
         self.file_menu.add_separator()
         self.file_menu.add_command(
@@ -122,15 +130,19 @@ class MainMenu(tk.Menu):
         tools_menu = tk.Menu(self, tearoff=False)
         tools_menu.add_command(
             label='Audio Settings...',
-            command=self._event('<<ToolsAudioSettings>>'),
-            image=self.icons['tools_audio'],
-            compound=tk.LEFT,
+            command=self._event('<<ToolsAudioSettings>>')
         )
+        self._icon_entries.append(
+            (tools_menu, 'Audio Settings...', 'tools_audio'))
         tools_menu.add_command(
             label='Calibration...',
-            command=self._event('<<ToolsCalibration>>'),
-            image=self.icons['tools_calibration'],
-            compound=tk.LEFT,
+            command=self._event('<<ToolsCalibration>>')
+        )
+        self._icon_entries.append(
+            (tools_menu, 'Calibration...', 'tools_calibration'))
+        tools_menu.add_command(
+            label='Matrix Cache...',
+            command=self._event('<<ToolsMatrixCache>>')
         )
         # Add Tools menu to the menubar
         self.add_cascade(label="Tools", menu=tools_menu)
@@ -142,22 +154,22 @@ class MainMenu(tk.Menu):
         self.help_menu = tk.Menu(self, tearoff=False)
         self.help_menu.add_command(
             label='About...',
-            command=self.show_about,
-            image=self.icons['help_about'],
-            compound=tk.LEFT,
+            command=self.show_about
         )
+        self._icon_entries.append(
+            (self.help_menu, 'About...', 'help_about'))
         self.help_menu.add_command(
             label='README...',
-            command=self._event('<<HelpREADME>>'),
-            image=self.icons['help_help'],
-            compound=tk.LEFT,
+            command=self._event('<<HelpREADME>>')
         )
+        self._icon_entries.append(
+            (self.help_menu, 'README...', 'help_help'))
         self.help_menu.add_command(
             label="CHANGELOG...",
-            command=self._event('<<HelpCHANGELOG>>'),
-            image=self.icons['help_changelog'],
-            compound=tk.LEFT,
+            command=self._event('<<HelpCHANGELOG>>')
         )
+        self._icon_entries.append(
+            (self.help_menu, 'CHANGELOG...', 'help_changelog'))
         # Add help menu to the menubar
         self.add_cascade(label="Help", menu=self.help_menu)
 
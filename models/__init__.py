@@ -1,20 +1,75 @@
-""" Imports. """
+""" Imports.
 
-from models.scoremodel import (
-    ScoreModel
-)
+    Models are imported on first use (module __getattr__, PEP 562),
+    so importing the package does not load pandas, SciPy or the
+    audio device libraries before the main window is shown.
+"""
 
-__all__ = [
-    'ScoreModel'
-]
+import importlib
+from typing import TYPE_CHECKING
 
+# Never run, but lets PyInstaller and IDEs see the lazy imports
+if TYPE_CHECKING:
+    from models import (
+        audiorender, conversioncache, corpusindex, levelindex, logqueue,
+        matrixcache, matrixengine, matrixmodel, outputengine,
+        passagelayout, preflight, renderpipeline, scoremodel,
+        sessionengine, sessionjournal, sessionstore, sessionwriter,
+        settingspersister, shuffleengine, startupprofile,
+        stimulusbundle, stimuluscache, trialtable
+    )
 
-from models.matrixmodel import (
-    CreateSpeechTaskerMatrix,
-    ImportSpeechTaskerMatrix
-)
+# Public class -> module that defines it
+_CLASSES = {
+    'ScoreModel': 'models.scoremodel',
+    'CreateSpeechTaskerMatrix': 'models.matrixmodel',
+    'ImportSpeechTaskerMatrix': 'models.matrixmodel',
+    'StimulusCache': 'models.stimuluscache',
+    'RenderError': 'models.renderpipeline',
+    'RenderPipeline': 'models.renderpipeline',
+    'OutputEngine': 'models.outputengine',
+    'StimulusBundle': 'models.stimulusbundle',
+    'ConversionCache': 'models.conversioncache',
+    'LevelIndex': 'models.levelindex',
+    'SessionWriter': 'models.sessionwriter',
+    'SessionStore': 'models.sessionstore',
+    'SessionJournal': 'models.sessionjournal',
+    'SettingsPersister': 'models.settingspersister',
+    'CorpusIndex': 'models.corpusindex',
+    'MatrixCache': 'models.matrixcache',
+    'TrialTable': 'models.trialtable',
+    'PassageLayout': 'models.passagelayout',
+    'SessionEngine': 'models.sessionengine',
+    'StartupProfile': 'models.startupprofile'
+}
 
-__all__ += [
-    'CreateSpeechTaskerMatrix',
-    'ImportSpeechTaskerMatrix'
+# Modules re-exported for their functions
+_MODULES = [
+    'audiorender',
+    'stimulusbundle',
+    'conversioncache',
+    'preflight',
+    'sessionstore',
+    'sessionjournal',
+    'logqueue',
+    'matrixengine',
+    'shuffleengine'
 ]
+
+__all__ = list(_CLASSES) + _MODULES
+
+
+def __getattr__(name):
+    """ Import a model (or module) the first time it is used. """
+    if name in _CLASSES:
+        value = getattr(importlib.import_module(_CLASSES[name]), name)
+    elif name in _MODULES:
+        value = importlib.import_module(f"models.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,141 @@
+""" Functions for turning decoded stimuli into device-ready buffers.
+
+    Levels follow the AudioPlayer convention: the presentation level
+    is the RMS level of the signal in dB FS. Rendering scales the
+    signal to that level and routes each audio channel to its
+    speaker, producing a (frames, channels) float32 buffer sized for
+    the output stream.
+
+    Created: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import logging
+import os
+import sys
+
+# Third party
+import numpy as np
+
+# Add custom path
+try:
+    sys.path.append(os.environ['TMPY'])
+except KeyError:
+    sys.path.append('C:\\Users\\MooTra\\Code\\Python')
+
+# Custom
+from tmpy.audio_handlers import Clipping, InvalidRouting
+
+##########
+# Logger #
+##########
+# Create new logger
+logger = logging.getLogger(__name__)
+
+#############
+# Functions #
+#############
+def db_to_gain(level):
+    """ Convert a level in dB to a linear amplitude factor. """
+    return 10 ** (level / 20)
+
+
+def rms(audio):
+    """ Return the RMS of a signal across all channels. """
+    return float(np.sqrt(np.mean(np.square(audio, dtype=np.float64))))
+
+
+def as_2d(audio):
+    """ Return audio as a (frames, channels) view. """
+    if audio.ndim == 1:
+        return audio[:, np.newaxis]
+    return audio
+
+
+def route(audio, routing, channels, gain=1.0):
+    """ Route each channel of a signal to its speaker.
+
+    :param audio: Signal with one column per routed channel
+    :type audio: np.ndarray
+    :param routing: 1-based output channel for each audio channel
+    :type routing: list
+    :param channels: Number of output channels
+    :type channels: int
+    :param gain: Linear gain applied while routing
+    :type gain: float
+    :return: Buffer of shape (frames, channels)
+    :rtype: np.ndarray
+    :raises InvalidRouting: If routing does not match the signal
+    """
+    audio = as_2d(audio)
+    if audio.shape[1] != len(routing):
+        raise InvalidRouting(
+            f"{audio.shape[1]} audio channel(s) but {len(routing)} "
+            + "speaker(s) in routing."
+        )
+    if max(routing) > channels or min(routing) < 1:
+        raise InvalidRouting(
+            f"Routing {routing} exceeds the {channels} output channel(s)."
+        )
+    out = np.zeros((audio.shape[0], channels), dtype=np.float32)
+    for col, speaker in enumerate(routing):
+        np.multiply(audio[:, col], gain, out=out[:, speaker - 1],
+                    casting='unsafe')
+    return out
+
+
+def render_trial(audio, level, routing, channels, stats=None):
+    """ Scale a stimulus to a dB FS level and route it.
+
+    :param audio: Decoded stimulus
+    :type audio: np.ndarray
+    :param level: Presentation level in dB FS (RMS)
+    :type level: float
+    :param routing: 1-based output channel for each audio channel
+    :type routing: list
+    :param channels: Number of output channels
+    :type channels: int
+    :param stats: Precomputed 'rms' and 'peak' of the stimulus (e.g.,
+        a LevelIndex entry). Measured from the signal if omitted.
+    :type stats: dict
+    :return: Device-ready buffer of shape (frames, channels)
+    :rtype: np.ndarray
+    :raises Clipping: If the scaled signal exceeds full scale
+    """
+    if stats is None:
+        stats = {'rms': rms(audio), 'peak': float(np.max(np.abs(audio)))}
+    gain = db_to_gain(level) / stats['rms']
+    buffer = route(audio, routing, channels, gain)
+    if stats['peak'] * gain > 1.0:
+        error = Clipping(f"Level {level} dB FS exceeds full scale.")
+        # Keep the clipped buffer for visual inspection
+        error.buffer = buffer
+        raise error
+    return buffer
+
+def render_masker(audio, level):
+    """ Scale a masker to a dB FS level for looping playback.
+
+    :param audio: Decoded masker
+    :type audio: np.ndarray
+    :param level: Masker level in dB FS (RMS)
+    :type level: float
+    :return: Scaled masker of shape (frames, channels)
+    :rtype: np.ndarray
+    :raises Clipping: If the scaled masker exceeds full scale
+    """
+    masker = as_2d(audio) * np.float32(db_to_gain(level) / rms(audio))
+    if np.max(np.abs(masker)) > 1.0:
+        error = Clipping(f"Noise level {level} dB FS exceeds full scale.")
+        error.buffer = masker
+        raise error
+    return masker.astype(np.float32, copy=False)
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,291 @@
+""" On-disk cache of stimuli converted to the output format.
+
+    Stimuli whose sampling rate or channel count differ from the
+    output stream are resampled (polyphase filtering) and remixed
+    once, and stored on disk as .npy files keyed by the source
+    content hash, target sampling rate and channel layout. Cold
+    conversions run on a process pool before the first trial, so
+    the trial loop only reads pre-converted buffers.
+
+    A small JSON manifest maps each source (path, mtime, size) to
+    its sampling rate, channel count and (once converted) content
+    hash, so warm lookups never re-read the source. Stimuli that
+    already match the output format are recorded too; the process
+    pool is only started when real conversions are pending.
+
+    Created: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import hashlib
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from math import gcd
+from pathlib import Path
+
+# Third party
+import numpy as np
+import soundfile as sf
+from scipy import signal
+
+# Custom
+from models.stimulusbundle import StimulusBundle
+
+##########
+# Logger #
+##########
+# Create new logger
+logger = logging.getLogger(__name__)
+
+#############
+# Functions #
+#############
+def convert(audio, fs, target_sr, channels):
+    """ Resample and remix a signal.
+
+    :param audio: Signal of shape (frames,) or (frames, n)
+    :type audio: np.ndarray
+    :param fs: Sampling rate of the signal
+    :type fs: int
+    :param target_sr: Output sampling rate
+    :type target_sr: int
+    :param channels: Output channel count. Multichannel signals
+        are averaged down to mono; mono signals are duplicated.
+    :type channels: int
+    :return: Converted float32 signal (1-D if channels is 1)
+    :rtype: np.ndarray
+    :raises ValueError: If the channel layout cannot be converted
+    """
+    audio = np.asarray(audio, dtype=np.float32)
+    if audio.ndim == 1:
+        audio = audio[:, np.newaxis]
+    if audio.shape[1] != channels:
+        if channels == 1:
+            audio = audio.mean(axis=1, keepdims=True)
+        elif audio.shape[1] == 1:
+            audio = np.repeat(audio, channels, axis=1)
+        else:
+            raise ValueError(
+                f"Cannot convert {audio.shape[1]} channels to {channels}.")
+    if fs != target_sr:
+        factor = gcd(int(fs), int(target_sr))
+        audio = signal.resample_poly(
+            audio, int(target_sr) // factor, int(fs) // factor, axis=0)
+    audio = audio.astype(np.float32, copy=False)
+    if channels == 1:
+        audio = audio[:, 0]
+    return np.ascontiguousarray(audio)
+
+
+def _source_key(path, name=None):
+    """ Return the manifest key of a file (or a bundle entry). """
+    stat = Path(path).stat()
+    key = f"{Path(path).resolve()}|{stat.st_mtime_ns}|{stat.st_size}"
+    if name is not None:
+        key += f"|{name}"
+    return key
+
+
+@lru_cache(maxsize=4)
+def _open_bundle(path):
+    """ Worker: open each bundle (and parse its index) once per
+    process, not once per stimulus.
+    """
+    return StimulusBundle(path)
+
+
+def _convert(source, name, in_bundle, target_sr, channels, cache_dir):
+    """ Worker: convert one stimulus into the cache.
+
+    :return: (name, content hash of the source)
+    """
+    if in_bundle:
+        audio, fs = _open_bundle(source).get(name)
+        digest = hashlib.sha1(np.ascontiguousarray(audio).tobytes()
+                              ).hexdigest()
+    else:
+        digest = hashlib.sha1(Path(source).read_bytes()).hexdigest()
+        audio, fs = sf.read(source, dtype='float32')
+
+    dest = Path(cache_dir) / _cache_name(digest, target_sr, channels)
+    if not dest.exists():
+        converted = convert(audio, fs, target_sr, channels)
+        tmp = dest.with_suffix(f'.{os.getpid()}.tmp.npy')
+        np.save(tmp, converted)
+        tmp.replace(dest)
+    return name, digest
+
+
+def _cache_name(digest, target_sr, channels):
+    """ Return the cache file name for a conversion. """
+    return f"{digest}_{int(target_sr)}Hz_{int(channels)}ch.npy"
+
+###################
+# ConversionCache #
+###################
+class ConversionCache:
+    """ Disk cache of stimuli converted to the output format. """
+
+    MANIFEST = 'manifest.json'
+
+    def __init__(self, cache_dir, target_sr, channels=1):
+        """ Create a conversion cache.
+
+        :param cache_dir: Directory for converted files
+        :type cache_dir: str or Path
+        :param target_sr: Output stream sampling rate
+        :type target_sr: int
+        :param channels: Channels per stimulus (one per routed speaker)
+        :type channels: int
+        """
+        logger.info("Initializing ConversionCache")
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.target_sr = int(target_sr)
+        self.channels = int(channels)
+        self.converted = {}
+        # Stimuli with more channels than the output format
+        self.downmixed = []
+        self._manifest = self._load_manifest()
+
+    def _load_manifest(self):
+        """ Read the source-key -> {'sr', 'channels', 'hash'}
+        manifest. Entries in any other format are dropped (and
+        re-probed).
+        """
+        try:
+            with open(self.cache_dir / self.MANIFEST) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return {key: entry for key, entry in manifest.items()
+                if isinstance(entry, dict)}
+
+    def _save_manifest(self):
+        """ Atomically rewrite the manifest. """
+        tmp = self.cache_dir / (self.MANIFEST + '.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(self._manifest, f)
+        tmp.replace(self.cache_dir / self.MANIFEST)
+
+    def prepare(self, sources, in_bundle=False, max_workers=None):
+        """ Convert every stimulus that does not match the output
+        format, using a process pool for cold conversions.
+
+        Formats are read from the manifest, or else from the bundle
+        index or the file header (in this process); the pool is only
+        started if something needs converting.
+
+        :param sources: Mapping of matrix file name to source path
+            (the bundle path for every entry if in_bundle is True)
+        :type sources: dict
+        :param in_bundle: Whether the sources are bundle entries
+        :type in_bundle: bool
+        :param max_workers: Process pool size (None for CPU count)
+        :type max_workers: int
+        :return: Number of stimuli that need conversion
+        :rtype: int
+        """
+        start = time.perf_counter()
+        bundles = {}
+        changed = False
+        pending = {}
+        for name, source in sources.items():
+            try:
+                key = _source_key(source, name if in_bundle else None)
+                entry = self._manifest.get(key)
+                if entry is None:
+                    entry = self._probe(source, name, in_bundle, bundles)
+                    self._manifest[key] = entry
+                    changed = True
+            except (OSError, RuntimeError, ValueError) as e:
+                # Missing or unreadable files are reported when played
+                logger.warning("Cannot read stimulus %s: %s", name, e)
+                continue
+            if entry['channels'] > self.channels:
+                self.downmixed.append(name)
+            if (entry['sr'] == self.target_sr
+                    and entry['channels'] == self.channels):
+                continue
+            if entry['hash'] is not None:
+                path = self.cache_dir / _cache_name(
+                    entry['hash'], self.target_sr, self.channels)
+                if path.exists():
+                    self.converted[name] = path
+                    continue
+            pending[name] = (str(source), key)
+
+        if pending:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                futures = [
+                    pool.submit(_convert, source, name, in_bundle,
+                                self.target_sr, self.channels,
+                                str(self.cache_dir))
+                    for name, (source, _) in pending.items()
+                ]
+                for future in futures:
+                    try:
+                        name, digest = future.result()
+                    except (OSError, RuntimeError, ValueError) as e:
+                        # Unreadable files are reported when played
+                        logger.warning("Cannot convert stimulus: %s", e)
+                        continue
+                    self._manifest[pending[name][1]]['hash'] = digest
+                    self.converted[name] = self.cache_dir / _cache_name(
+                        digest, self.target_sr, self.channels)
+            changed = True
+
+        if changed:
+            self._save_manifest()
+        logger.info(
+            "Prepared %d stimuli (%d converted, %d cold) in %.2f s",
+            len(sources), len(self.converted), len(pending),
+            time.perf_counter() - start
+        )
+        return len(self.converted)
+
+    @staticmethod
+    def _probe(source, name, in_bundle, bundles):
+        """ Return a new manifest entry with the format of a
+        stimulus. Bundles are opened once per prepare() call.
+        """
+        if in_bundle:
+            if source not in bundles:
+                bundles[source] = StimulusBundle(source)
+            info = bundles[source].info(name)
+            sr, channels = info['sr'], info['channels']
+        else:
+            info = sf.info(str(source))
+            sr, channels = info.samplerate, info.channels
+        return {'sr': int(sr), 'channels': int(channels), 'hash': None}
+
+    def __contains__(self, name):
+        return name in self.converted
+
+    def get(self, name):
+        """ Return (samples, sampling rate) of a converted stimulus.
+        Samples are memory-mapped read-only.
+        """
+        return np.load(self.converted[name], mmap_mode='r'), self.target_sr
+
+    def clear(self):
+        """ Delete all converted files and the manifest. """
+        logger.info("Clearing conversion cache")
+        for path in self.cache_dir.glob('*.npy'):
+            path.unlink()
+        self._manifest = {}
+        self.converted = {}
+        self._save_manifest()
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
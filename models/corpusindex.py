@@ -0,0 +1,248 @@
+""" Indexed sentence corpus with a binary sidecar.
+
+    A corpus CSV is parsed once. The result is stored next to it in
+    a compact .npz sidecar:
+        - every column, in file order (text columns as one UTF-8
+          blob plus offsets, so only selected rows are decoded)
+        - a by-list row order with each list's start and length, so
+          selecting lists and truncating them to n sentences are
+          slices
+
+    The sidecar is reused while the CSV's size and mtime match; if
+    only the mtime changed (e.g., the file was copied), the content
+    hash decides, and the sidecar is updated with the new mtime.
+
+    Created: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+
+# Third party
+import numpy as np
+import pandas as pd
+
+##########
+# Logger #
+##########
+# Create new logger
+logger = logging.getLogger(__name__)
+
+#############
+# Constants #
+#############
+SIDECAR_SUFFIX = '.idx.npz'
+VERSION = 2
+
+#############
+# Functions #
+#############
+def file_hash(path):
+    """ Return the SHA-1 of a file's contents. """
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024**2), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _pack_strings(values):
+    """ Pack strings into (UTF-8 blob, offsets, null mask). """
+    null = pd.isna(values)
+    encoded = [b'' if n else str(v).encode('utf-8')
+               for v, n in zip(values, null)]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(e) for e in encoded], out=offsets[1:])
+    blob = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    return blob, offsets, np.asarray(null, dtype=bool)
+
+###############
+# CorpusIndex #
+###############
+class CorpusIndex:
+    """ Sentence corpus indexed by list number. """
+
+    def __init__(self, arrays, meta):
+        """ Use CorpusIndex.load to create an index. """
+        self.meta = meta
+        self.columns = meta['columns']
+        self.content_hash = meta['sha1']
+        self.from_sidecar = False
+        self._arrays = arrays
+        self.list_nums = arrays['col:list_num']
+        self.lists = arrays['list_keys']
+        self._starts = arrays['list_starts']
+        self._counts = arrays['list_counts']
+        self._by_list = arrays['by_list']
+        # Decode each text blob once, lazily per row afterwards
+        self._blobs = {}
+
+    def __len__(self):
+        return self.list_nums.size
+
+    @staticmethod
+    def sidecar_path(csv_path):
+        """ Return the sidecar file of a corpus CSV. """
+        return Path(str(csv_path) + SIDECAR_SUFFIX)
+
+    @classmethod
+    def load(cls, csv_path):
+        """ Return the index of a corpus CSV, from its sidecar if it
+        is still valid, otherwise by parsing the CSV (and writing a
+        new sidecar).
+
+        :param csv_path: Sentence corpus CSV
+        :type csv_path: str or Path
+        :rtype: CorpusIndex
+        """
+        csv_path = Path(csv_path)
+        stat = csv_path.stat()
+        sidecar = cls.sidecar_path(csv_path)
+        try:
+            with np.load(sidecar) as npz:
+                arrays = dict(npz)
+            meta = json.loads(arrays.pop('meta').tobytes())
+        except (OSError, ValueError, KeyError):
+            arrays, meta = None, None
+
+        if meta is not None and meta['version'] == VERSION:
+            same_stat = (meta['mtime_ns'] == stat.st_mtime_ns
+                         and meta['size'] == stat.st_size)
+            if same_stat or meta['sha1'] == file_hash(csv_path):
+                logger.info("Loaded corpus index from %s", sidecar)
+                index = cls(arrays, meta)
+                index.from_sidecar = True
+                if not same_stat:
+                    # Same content: record the new stat so later
+                    # loads do not hash the file again
+                    meta.update(mtime_ns=stat.st_mtime_ns,
+                                size=stat.st_size)
+                    index.save(sidecar)
+                return index
+
+        logger.info("Building corpus index for %s", csv_path)
+        index = cls.build(pd.read_csv(csv_path), file_hash(csv_path), stat)
+        index.save(sidecar)
+        return index
+
+    @classmethod
+    def build(cls, corpus, sha1, stat=None):
+        """ Index a corpus DataFrame.
+
+        :param corpus: Corpus with 'list_num' and 'sentence' columns
+        :type corpus: pd.DataFrame
+        :param sha1: Content hash of the source file
+        :type sha1: str
+        :param stat: os.stat of the source file
+        """
+        arrays = {}
+        kinds = {}
+        for name in corpus.columns:
+            values = corpus[name]
+            if pd.api.types.is_numeric_dtype(values) \
+                    or pd.api.types.is_bool_dtype(values):
+                arrays[f'col:{name}'] = values.to_numpy()
+                kinds[name] = 'num'
+            else:
+                blob, offsets, null = _pack_strings(values.to_numpy())
+                arrays[f'str:{name}:blob'] = blob
+                arrays[f'str:{name}:offsets'] = offsets
+                arrays[f'str:{name}:null'] = null
+                kinds[name] = 'str'
+
+        # Rows grouped by list, in file order within each list
+        list_nums = corpus['list_num'].to_numpy()
+        by_list = np.argsort(list_nums, kind='stable')
+        keys, starts, counts = np.unique(
+            list_nums[by_list], return_index=True, return_counts=True)
+        arrays.update({
+            'by_list': by_list,
+            'list_keys': keys,
+            'list_starts': starts,
+            'list_counts': counts
+        })
+
+        meta = {
+            'version': VERSION,
+            'columns': list(corpus.columns),
+            'kinds': kinds,
+            'sha1': sha1,
+            'mtime_ns': stat.st_mtime_ns if stat else None,
+            'size': stat.st_size if stat else None
+        }
+        return cls(arrays, meta)
+
+    def save(self, sidecar):
+        """ Atomically write the sidecar. Read-only corpus folders
+        are tolerated; the index is then rebuilt next time.
+        """
+        tmp = Path(str(sidecar) + f'.{os.getpid()}.tmp')
+        meta = np.frombuffer(json.dumps(self.meta).encode('utf-8'), np.uint8)
+        try:
+            with open(tmp, 'wb') as f:
+                np.savez(f, meta=meta, **self._arrays)
+            tmp.replace(sidecar)
+        except OSError as e:
+            logger.warning("Cannot save corpus index: %s", e)
+
+    def select_rows(self, lists, sentences_per_list):
+        """ Return the rows of the first ``sentences_per_list``
+        sentences of each selected list, in file order.
+
+        :param lists: List numbers to include
+        :type lists: list
+        :param sentences_per_list: Sentences to keep per list
+        :type sentences_per_list: int
+        :rtype: np.ndarray
+        """
+        slots = np.searchsorted(self.lists, lists)
+        slices = []
+        for slot, list_num in zip(slots, lists):
+            if slot < self.lists.size and self.lists[slot] == list_num:
+                start = self._starts[slot]
+                stop = start + min(self._counts[slot], sentences_per_list)
+                slices.append(self._by_list[start:stop])
+        if not slices:
+            return np.empty(0, dtype=np.int64)
+        return np.sort(np.unique(np.concatenate(slices)))
+
+    def _strings(self, name, rows):
+        """ Decode a text column for the given rows only. """
+        if name not in self._blobs:
+            self._blobs[name] = self._arrays[f'{name}:blob'].tobytes()
+        blob = self._blobs[name]
+        offsets = self._arrays[f'{name}:offsets']
+        return [blob[offsets[r]:offsets[r + 1]].decode('utf-8') for r in rows]
+
+    def take(self, rows):
+        """ Return the given rows as a DataFrame (columns in file
+        order). Each distinct row is decoded once.
+        """
+        unique, inverse = np.unique(rows, return_inverse=True)
+        data = {}
+        for name in self.columns:
+            if self.meta['kinds'][name] == 'num':
+                data[name] = self._arrays[f'col:{name}'][rows]
+                continue
+            values = np.array(self._strings(f'str:{name}', unique), dtype=object)
+            values[self._arrays[f'str:{name}:null'][unique]] = np.nan
+            data[name] = values[inverse]
+        return pd.DataFrame(data, columns=self.columns)
+
+    @property
+    def frame(self):
+        """ Return the whole corpus as a DataFrame. """
+        return self.take(np.arange(len(self)))
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,246 @@
+""" Per-stimulus level index for Speech Tasker.
+
+    Stores the RMS, peak, crest factor and length of every stimulus,
+    so the presentation gain for a trial is a table lookup plus a
+    multiply, and clipping can be predicted for any (file, level)
+    pair before it is presented. The index is built on a process
+    pool and saved as JSON next to the stimuli. Each entry carries
+    a validation tag (file mtime and size, or the converted file
+    name) and is only re-measured when the tag changes. Bundle
+    entries use the RMS and peak stored in the bundle index, so they
+    are not re-read.
+
+    Created: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import json
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Third party
+import numpy as np
+import soundfile as sf
+
+# Custom
+from models.audiorender import db_to_gain
+from models.stimulusbundle import StimulusBundle
+
+##########
+# Logger #
+##########
+# Create new logger
+logger = logging.getLogger(__name__)
+
+#############
+# Functions #
+#############
+def measure(audio):
+    """ Return the RMS, peak and crest factor (dB) of a signal. """
+    audio = np.asarray(audio)
+    rms = float(np.sqrt(np.mean(np.square(audio, dtype=np.float64))))
+    peak = float(np.max(np.abs(audio)))
+    return _level_stats(rms, peak)
+
+
+def _level_stats(rms, peak):
+    """ Return the level entry fields for an RMS and peak. """
+    crest = 20 * np.log10(peak / rms) if rms > 0 else 0.0
+    return {'rms': float(rms), 'peak': float(peak), 'crest_db': float(crest)}
+
+
+def source_tag(kind, path):
+    """ Return the validation tag of a level source.
+
+    :param kind: 'file', 'bundle' or 'converted'
+    :type kind: str
+    :param path: Source file (bundle or .npy for those kinds)
+    :type path: str or Path
+    """
+    if kind == 'converted':
+        return Path(path).name
+    stat = Path(path).stat()
+    return f"{kind}|{stat.st_mtime_ns}|{stat.st_size}"
+
+
+def bundle_stats(bundle, name):
+    """ Return the level entry of a bundle stimulus from the bundle
+    index. Bundles packed before peaks were stored are measured.
+
+    :param bundle: Open stimulus bundle
+    :type bundle: StimulusBundle
+    :param name: Matrix file name
+    :type name: str
+    :raises FileNotFoundError: If the name is not in the bundle
+    """
+    info = bundle.info(name)
+    if 'rms' in info and 'peak' in info:
+        stats = _level_stats(info['rms'], info['peak'])
+    else:
+        stats = measure(bundle.get(name)[0])
+    stats.update({
+        'sr': info['sr'],
+        'channels': info['channels'],
+        'frames': info['frames']
+    })
+    return stats
+
+
+def _measure_source(name, kind, path):
+    """ Worker: load one file (or converted file) and measure it. """
+    if kind == 'converted':
+        audio = np.load(path, mmap_mode='r')
+        fs = None
+        channels = 1 if audio.ndim == 1 else audio.shape[1]
+    else:
+        audio, fs = sf.read(path, dtype='float32')
+        channels = 1 if audio.ndim == 1 else audio.shape[1]
+    stats = measure(audio)
+    stats.update({'sr': fs, 'channels': channels, 'frames': audio.shape[0]})
+    return name, stats
+
+##############
+# LevelIndex #
+##############
+class LevelIndex:
+    """ RMS/peak table for a stimulus set. """
+
+    def __init__(self, index_path):
+        """ Load a level index, or start an empty one.
+
+        :param index_path: JSON file next to the stimuli
+        :type index_path: str or Path
+        """
+        logger.info("Initializing LevelIndex")
+        self.index_path = Path(index_path)
+        try:
+            with open(self.index_path) as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def __getitem__(self, name):
+        return self.entries[name]
+
+    def update(self, sources, max_workers=None):
+        """ Measure every stimulus that is missing or stale, in
+        parallel, and save the index.
+
+        :param sources: Mapping of matrix file name to (kind, path)
+        :type sources: dict
+        :param max_workers: Process pool size (None for CPU count)
+        :type max_workers: int
+        :return: Number of stimuli measured
+        :rtype: int
+        """
+        start = time.perf_counter()
+        jobs = {}
+        # Bundle entries are read from the index of the open bundle
+        bundles = {}
+        indexed = 0
+        for name, (kind, path) in sources.items():
+            try:
+                tag = source_tag(kind, path)
+            except OSError:
+                # Drop stale entries so missing files are reported
+                self.entries.pop(name, None)
+                continue
+            entry = self.entries.get(name)
+            if not (entry is None or entry.get('tag') != tag
+                    or 'frames' not in entry):
+                continue
+            if kind != 'bundle':
+                jobs[name] = (kind, str(path), tag)
+                continue
+            try:
+                if path not in bundles:
+                    bundles[path] = StimulusBundle(path)
+                stats = bundle_stats(bundles[path], name)
+            except (OSError, ValueError) as e:
+                logger.warning("Cannot measure stimulus: %s", e)
+                self.entries.pop(name, None)
+                continue
+            stats['tag'] = tag
+            self.entries[name] = stats
+            indexed += 1
+
+        if jobs:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                futures = [
+                    pool.submit(_measure_source, name, kind, path)
+                    for name, (kind, path, _) in jobs.items()
+                ]
+                for future in futures:
+                    try:
+                        name, stats = future.result()
+                    except (OSError, RuntimeError, ValueError) as e:
+                        logger.warning("Cannot measure stimulus: %s", e)
+                        continue
+                    stats['tag'] = jobs[name][2]
+                    self.entries[name] = stats
+        if jobs or indexed:
+            self.save()
+
+        measured = len(jobs) + indexed
+        logger.info(
+            "Level index: %d measured (%d from bundle index), %d up to "
+            "date (%.2f s)", measured, indexed, len(sources) - measured,
+            time.perf_counter() - start
+        )
+        return measured
+
+    def save(self):
+        """ Atomically write the index. Read-only stimulus folders
+        are tolerated; the index is then rebuilt next session.
+        """
+        tmp = self.index_path.with_suffix('.tmp')
+        try:
+            with open(tmp, 'w') as f:
+                json.dump(self.entries, f)
+            tmp.replace(self.index_path)
+        except OSError as e:
+            logger.warning("Cannot save level index: %s", e)
+
+    def gain(self, name, level):
+        """ Return the linear gain that presents a stimulus at a
+        dB FS (RMS) level.
+        """
+        return db_to_gain(level) / self.entries[name]['rms']
+
+    def would_clip(self, name, level):
+        """ Return True if a stimulus would clip at a dB FS level. """
+        return self.entries[name]['peak'] * self.gain(name, level) > 1.0
+
+    def clipping(self, names, levels, limit=1.0):
+        """ Vectorized clipping check for many (file, level) pairs.
+
+        :param names: Matrix file names
+        :type names: sequence
+        :param levels: dB FS levels, one per name
+        :type levels: sequence
+        :param limit: Largest allowed peak (full scale, less any
+            masker mixed on top), scalar or one per name
+        :type limit: float or sequence
+        :return: Boolean array, True where the pair would clip
+        :rtype: np.ndarray
+        """
+        # Look up each distinct file once
+        unique, inverse = np.unique(np.asarray(names), return_inverse=True)
+        peak = np.array([self.entries[n]['peak'] for n in unique])[inverse]
+        rms = np.array([self.entries[n]['rms'] for n in unique])[inverse]
+        gain = np.power(10.0, np.asarray(levels, dtype=float) / 20) / rms
+        return peak * gain > np.asarray(limit, dtype=float)
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,71 @@
+""" Non-blocking logging for Speech Tasker.
+
+    The handlers created by the logging configuration (file and
+    console) are moved off the root logger onto a QueueListener
+    thread. The root logger gets a single QueueHandler instead, so a
+    logging call on the Tk thread only formats the message and puts
+    the record on a queue; a slow disk or AV scanner delays the
+    listener thread, not the GUI.
+
+    Per-module levels (e.g., quieter word lists from the ScoreModel)
+    are applied from ``setup.settings_vars.log_levels``.
+
+    Created: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import logging
+import logging.handlers
+import queue
+
+##########
+# Logger #
+##########
+# Create new logger
+logger = logging.getLogger(__name__)
+
+#############
+# Functions #
+#############
+def apply_levels(levels):
+    """ Set the level of individual loggers.
+
+    :param levels: Logger name -> level name (e.g., 'WARNING')
+    :type levels: dict
+    """
+    for name, level in (levels or {}).items():
+        logging.getLogger(name).setLevel(level.upper())
+
+
+def start_queue_logging(levels=None):
+    """ Route all root logger output through a listener thread.
+
+    Call after the logging configuration has been applied. Stop the
+    returned listener on exit to flush queued records.
+
+    :param levels: Per-module levels, see ``apply_levels``
+    :type levels: dict
+    :return: The running listener
+    :rtype: logging.handlers.QueueListener
+    """
+    root = logging.getLogger()
+    handlers = list(root.handlers)
+    log_queue = queue.SimpleQueue()
+    for handler in handlers:
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    apply_levels(levels)
+    logger.info("Logging through a queue to %d handlers", len(handlers))
+    return listener
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,326 @@
+""" On-disk cache of generated matrix files.
+
+    Matrices are content-addressed: the key is a hash of the corpus
+    content hash and the normalised design parameters (plus the
+    seed and shuffle constraints when trials are randomized).
+    Repeated submissions of the same design load the stored matrix
+    instead of rebuilding it, and matrix_file.csv is only rewritten
+    if it no longer holds that matrix. Least-recently-used entries
+    are evicted once the cache exceeds its size budget.
+
+    Randomized designs without a seed are never cached, since each
+    submission is meant to produce a new order.
+
+    Matrices are stored as .npz column arrays (text columns as
+    fixed-width strings) with their column names and dtypes in the
+    JSON manifest, and are loaded with allow_pickle=False. The cache
+    directory may be shared, so nothing in it is ever unpickled.
+
+    Created: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+
+# Third party
+import numpy as np
+import pandas as pd
+
+##########
+# Logger #
+##########
+# Create new logger
+logger = logging.getLogger(__name__)
+
+#############
+# Functions #
+#############
+def normalize_pars(pars):
+    """ Return the design parameters that determine a matrix, in a
+    canonical form (e.g., level 70 and 70.0 are the same design).
+
+    :param pars: CreateSpeechTaskerMatrix arguments
+    :type pars: dict
+    :rtype: dict
+    """
+    randomize = int(pars.get('randomize', 0))
+    seed = pars.get('seed') if randomize == 1 else None
+    return {
+        'lists': [int(x) for x in pars['lists']],
+        'sentences_per_list': int(pars['sentences_per_list']),
+        'levels': [float(x) for x in pars['levels']],
+        'speakers': [int(x) for x in pars['speakers']],
+        'presentations': int(pars.get('presentations', 1)),
+        'randomize': randomize,
+        'seed': None if seed is None else int(seed),
+        'constraints': [repr(c) for c in pars.get('constraints') or []
+                        if randomize == 1]
+    }
+
+
+def matrix_key(corpus_hash, pars):
+    """ Return the cache key of a design, or None if the design is
+    randomized without a seed (and so must not be cached).
+
+    :param corpus_hash: Content hash of the sentence corpus
+    :type corpus_hash: str
+    :param pars: CreateSpeechTaskerMatrix arguments
+    :type pars: dict
+    :rtype: str
+    """
+    pars = normalize_pars(pars)
+    if pars['randomize'] == 1 and pars['seed'] is None:
+        return None
+    text = json.dumps([corpus_hash, pars], sort_keys=True)
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def save_matrix(file, matrix):
+    """ Write a matrix as .npz column arrays, without pickling.
+
+    :param file: Open binary file (or path) to write
+    :param matrix: Matrix to store
+    :type matrix: pd.DataFrame
+    :return: [name, dtype] of each column, for load_matrix
+    :rtype: list
+    """
+    index = matrix.index.to_numpy()
+    arrays = {'index': index if index.dtype.kind in 'biu' else
+              index.astype(str)}
+    columns = []
+    for ii, name in enumerate(matrix.columns):
+        values = matrix[name].to_numpy()
+        if values.dtype.kind not in 'biuf':
+            values = values.astype(str)
+        arrays[f'c{ii}'] = values
+        columns.append([str(name), str(matrix[name].dtype)])
+    np.savez(file, **arrays)
+    return columns
+
+
+def load_matrix(path, columns):
+    """ Read a matrix written by save_matrix.
+
+    :param columns: [name, dtype] list returned by save_matrix
+    :type columns: list
+    :raises ValueError: If the file holds anything that needs
+        unpickling
+    :rtype: pd.DataFrame
+    """
+    with np.load(path, allow_pickle=False) as data:
+        index = data['index']
+        matrix = pd.DataFrame(
+            {name: data[f'c{ii}'] for ii, (name, _) in enumerate(columns)})
+    for name, dtype in columns:
+        if str(matrix[name].dtype) != dtype:
+            matrix[name] = matrix[name].astype(dtype)
+    if not np.array_equal(index, np.arange(len(index))):
+        matrix.index = index
+    return matrix
+
+###############
+# MatrixCache #
+###############
+class MatrixCache:
+    """ Size-bounded, content-addressed cache of matrices. """
+
+    MANIFEST = 'manifest.json'
+
+    def __init__(self, cache_dir, max_bytes=64 * 1024**2):
+        """ Open (or create) a matrix cache.
+
+        :param cache_dir: Directory for cached matrices
+        :type cache_dir: str or Path
+        :param max_bytes: Disk budget for cached matrices, in bytes
+        :type max_bytes: int
+        """
+        logger.info("Initializing MatrixCache")
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = int(max_bytes)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._manifest = self._load_manifest()
+
+    def __len__(self):
+        return len(self._manifest['entries'])
+
+    def __contains__(self, key):
+        return key in self._manifest['entries']
+
+    def _load_manifest(self):
+        """ Read the manifest, dropping entries whose file is gone. """
+        try:
+            with open(self.cache_dir / self.MANIFEST) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = {}
+        manifest.setdefault('entries', {})
+        manifest.setdefault('written', {})
+        manifest['entries'] = {
+            key: entry for key, entry in manifest['entries'].items()
+            if self._path(key).exists() and 'columns' in entry
+        }
+        return manifest
+
+    def _save_manifest(self):
+        """ Atomically rewrite the manifest. """
+        tmp = self.cache_dir / (self.MANIFEST + '.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(self._manifest, f)
+        tmp.replace(self.cache_dir / self.MANIFEST)
+
+    def _path(self, key):
+        """ Return the file of a cached matrix. """
+        return self.cache_dir / f"{key}.npz"
+
+    @property
+    def nbytes(self):
+        """ Total size of the cached matrices. """
+        return sum(e['bytes'] for e in self._manifest['entries'].values())
+
+    def get(self, key):
+        """ Return the cached matrix for a key, or None.
+
+        :param key: Key from matrix_key
+        :type key: str
+        :rtype: pd.DataFrame
+        """
+        entry = self._manifest['entries'].get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        try:
+            matrix = load_matrix(self._path(key), entry['columns'])
+        except (OSError, ValueError, KeyError, EOFError) as e:
+            logger.warning("Dropping unreadable cached matrix: %s", e)
+            self._remove(key)
+            self._save_manifest()
+            self.misses += 1
+            return None
+        entry['last_used'] = time.time()
+        self._save_manifest()
+        self.hits += 1
+        logger.info("Matrix cache hit (%d trials)", len(matrix))
+        return matrix
+
+    def put(self, key, matrix, pars=None):
+        """ Store a matrix, then evict least-recently-used entries
+        until the cache fits its budget.
+
+        :param key: Key from matrix_key
+        :type key: str
+        :param matrix: Generated matrix
+        :type matrix: pd.DataFrame
+        :param pars: Design parameters, kept for listing
+        :type pars: dict
+        """
+        path = self._path(key)
+        tmp = path.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp, 'wb') as f:
+            columns = save_matrix(f, matrix)
+        tmp.replace(path)
+        self._manifest['entries'][key] = {
+            'pars': normalize_pars(pars) if pars is not None else None,
+            'columns': columns,
+            'trials': len(matrix),
+            'bytes': path.stat().st_size,
+            'created': time.time(),
+            'last_used': time.time()
+        }
+        self._evict(keep=key)
+        self._save_manifest()
+
+    def _evict(self, keep=None):
+        """ Remove least-recently-used entries over the budget. """
+        entries = self._manifest['entries']
+        by_age = sorted(entries, key=lambda k: entries[k]['last_used'])
+        total = self.nbytes
+        for key in by_age:
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            total -= entries[key]['bytes']
+            self._remove(key)
+            self.evictions += 1
+
+    def _remove(self, key):
+        """ Delete one entry. """
+        self._manifest['entries'].pop(key, None)
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def write_csv(self, key, matrix, path):
+        """ Write a matrix to CSV, unless the file already holds it
+        (unchanged since this cache last wrote it).
+
+        :return: True if the file was written
+        :rtype: bool
+        """
+        path = Path(path).resolve()
+        written = self._manifest['written'].get(str(path))
+        if key is not None and written is not None and written['key'] == key:
+            try:
+                stat = path.stat()
+                if (stat.st_mtime_ns, stat.st_size) == \
+                        (written['mtime_ns'], written['size']):
+                    logger.info("%s is up to date", path.name)
+                    return False
+            except FileNotFoundError:
+                pass
+        matrix.to_csv(path, index=False)
+        stat = path.stat()
+        self._manifest['written'][str(path)] = {
+            'key': key,
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size
+        }
+        self._save_manifest()
+        return True
+
+    def entries(self):
+        """ Return the cached matrices, most recently used first.
+
+        :return: One dict per entry (key, pars, trials, bytes,
+            created, last_used)
+        :rtype: list
+        """
+        entries = [dict(key=key, **entry)
+                   for key, entry in self._manifest['entries'].items()]
+        return sorted(entries, key=lambda e: e['last_used'], reverse=True)
+
+    def clear(self):
+        """ Delete all cached matrices. """
+        logger.info("Clearing matrix cache")
+        for key in list(self._manifest['entries']):
+            self._remove(key)
+        self._manifest['written'] = {}
+        self._save_manifest()
+
+    def stats(self):
+        """ Return cache counters. """
+        return {
+            'entries': len(self),
+            'bytes': self.nbytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
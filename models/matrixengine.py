@@ -0,0 +1,142 @@
+""" Vectorized matrix construction for Speech Tasker.
+
+    Builds the same trials as the MatrixFile chain used by
+    CreateSpeechTaskerMatrix (subset_lists -> truncate_lists ->
+    assign_values (level, speaker) -> repeat_trials -> randomize),
+    but as NumPy index arrays over the sentence corpus. Levels and
+    speakers are computed per selected row, and the corpus is
+    gathered once at the end, so no intermediate DataFrame copies
+    are made, even for designs with millions of rows. The corpus may
+    also be a CorpusIndex, in which case lists are selected as slices
+    and only the selected rows are decoded.
+
+    Created: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import logging
+
+# Third party
+import numpy as np
+import pandas as pd
+
+# Custom
+from models.corpusindex import CorpusIndex
+from models.shuffleengine import constrained_order
+
+##########
+# Logger #
+##########
+# Create new logger
+logger = logging.getLogger(__name__)
+
+#############
+# Functions #
+#############
+def select_rows(list_nums, lists, sentences_per_list):
+    """ Return the corpus rows of the selected lists, keeping the
+    first ``sentences_per_list`` rows of each list in file order.
+
+    :param list_nums: The corpus 'list_num' column
+    :type list_nums: np.ndarray
+    :param lists: List numbers to include
+    :type lists: list
+    :param sentences_per_list: Sentences to keep per list
+    :type sentences_per_list: int
+    :return: Corpus row indexes, in file order
+    :rtype: np.ndarray
+    """
+    rows = np.flatnonzero(np.isin(list_nums, lists))
+    if rows.size == 0:
+        return rows
+    # Rank of each row within its list (a vectorized cumcount)
+    selected = list_nums[rows]
+    order = np.argsort(selected, kind='stable')
+    sorted_lists = selected[order]
+    starts = np.flatnonzero(np.r_[True, sorted_lists[1:] != sorted_lists[:-1]])
+    group_start = np.repeat(starts, np.diff(np.r_[starts, sorted_lists.size]))
+    rank = np.empty(rows.size, dtype=np.int64)
+    rank[order] = np.arange(rows.size) - group_start
+    return rows[rank < sentences_per_list]
+
+
+def list_values(list_nums, lists, values, name):
+    """ Return one value per row: a single value for every row, or
+    the value matching each row's position in ``lists``.
+
+    :raises ValueError: If there is neither one value nor one per list
+    """
+    values = np.asarray(values)
+    if values.size == 1:
+        return np.full(list_nums.size, values[0])
+    if values.size != len(lists):
+        raise ValueError(
+            f"Expected 1 or {len(lists)} {name} values, got {values.size}.")
+    return values[pd.Index(lists).get_indexer(list_nums)]
+
+
+def build_matrix(corpus, lists, sentences_per_list, levels, speakers,
+                 presentations=1, randomize=0, constraints=(), seed=None):
+    """ Build a matrix of trials from a sentence corpus.
+
+    :param corpus: Sentence corpus with a 'list_num' column
+    :type corpus: pd.DataFrame or CorpusIndex
+    :param lists: List numbers to include
+    :type lists: list
+    :param sentences_per_list: Sentences to keep per list
+    :type sentences_per_list: int
+    :param levels: One level for all lists, or one per list
+    :type levels: list
+    :param speakers: One speaker for all lists, or one per list
+    :type speakers: list
+    :param presentations: Number of times to present all trials
+    :type presentations: int
+    :param randomize: 1 to shuffle the trials
+    :type randomize: int
+    :param constraints: Shuffle constraints (see shuffleengine)
+    :type constraints: list
+    :param seed: Shuffle seed (a fresh one if None)
+    :type seed: int
+    :return: Trials, with 'level' and 'speaker' columns added (and
+        'seed' if shuffled)
+    :rtype: pd.DataFrame
+    """
+    if isinstance(corpus, CorpusIndex):
+        list_nums = corpus.list_nums
+        rows = corpus.select_rows(lists, sentences_per_list)
+    else:
+        list_nums = corpus['list_num'].to_numpy()
+        rows = select_rows(list_nums, lists, sentences_per_list)
+    level = list_values(list_nums[rows], lists, levels, 'level')
+    speaker = list_values(list_nums[rows], lists, speakers, 'speaker')
+
+    # Repeat all trials, then shuffle, as index arrays
+    order = np.tile(np.arange(rows.size), presentations)
+    if randomize == 1:
+        columns = {'list_num': list_nums[rows], 'level': level,
+                   'speaker': speaker}
+        for name in {c.column for c in constraints} - set(columns):
+            if name in corpus.columns:
+                columns[name] = corpus.take(rows)[name].to_numpy()
+        columns = {name: values[order] for name, values in columns.items()}
+        shuffled, seed = constrained_order(
+            order.size, columns, constraints, seed)
+        order = order[shuffled]
+
+    # Single gather
+    matrix = corpus.take(rows[order]).reset_index(drop=True)
+    matrix['level'] = level[order]
+    matrix['speaker'] = speaker[order]
+    if randomize == 1:
+        matrix['seed'] = seed
+    logger.info("Built matrix with %d trials", len(matrix))
+    return matrix
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
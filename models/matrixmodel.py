@@ -20,6 +20,10 @@ except KeyError:
 
 # Custom
 from tmpy.handlers import MatrixFile
+from models.corpusindex import CorpusIndex
+from models.matrixcache import matrix_key
+from models.matrixengine import build_matrix
+from models.shuffleengine import shuffle_frame
 
 ##########
 # Logger #
@@ -39,7 +43,12 @@ class ImportSpeechTaskerMatrix(MatrixFile):
         self.kwargs = kwargs
 
     def import_matrix_file(self):
-        """ Import matrix file. """
+        """ Import matrix file.
+
+        Optional kwargs: 'constraints' and 'seed' for randomizing
+        (see shuffleengine). Unsatisfiable constraints raise a
+        ValueError.
+        """
         logger.info("Preparing trials")
         try:
             # Import matrix file
@@ -49,7 +58,11 @@ class ImportSpeechTaskerMatrix(MatrixFile):
             # Randomize trials
             if self.kwargs['randomize'] == 1:
                 logger.info("Randomizing trials")
-                randomized = self.randomize(repeated)
+                randomized = shuffle_frame(
+                    repeated,
+                    constraints=self.kwargs.get('constraints', ()),
+                    seed=self.kwargs.get('seed')
+                )
                 if self.kwargs['write'] == 1:
                     randomized.to_csv("matrix_file.csv", index=False)
                 return randomized
@@ -73,32 +86,48 @@ class CreateSpeechTaskerMatrix(MatrixFile):
         self.kwargs = kwargs
 
     def create_matrix_file(self):
-        """ Create the final matrix file dataframe. """
+        """ Create the final matrix file dataframe.
+
+        Optional kwargs: 'cache' (a MatrixCache) to reuse matrices
+        of identical designs, and 'constraints' and 'seed' for
+        randomizing (see shuffleengine).
+        """
         logger.info("Creating matrix file")
         try:
-            # Import speech task stimuli
-            stimulus_file = self.import_file(self.kwargs['filepath'])
-            # Grab only selected lists
-            subset = self.subset_lists(stimulus_file, self.kwargs['lists'])
-            # Grab only n sentences per list
-            truncated = self.truncate_lists(subset, self.kwargs['sentences_per_list'])
-            # Add level column
-            added_levels = self.assign_values(truncated, self.kwargs['levels'], 'level')
-            # Add speaker column
-            added_speakers = self.assign_values(added_levels, self.kwargs['speakers'], 'speaker')
-            # Repeat trials
-            repeated = self.repeat_trials(added_speakers, self.kwargs['presentations'])
-            # Randomize trials
-            if self.kwargs['randomize'] == 1:
-                randomized = self.randomize(repeated)
-                if self.kwargs['write'] == True:
-                    randomized.to_csv("matrix_file.csv", index=False)
-                return randomized
-            else:
-                if self.kwargs['write'] == True:
-                    repeated.to_csv("matrix_file.csv", index=False)
-                return repeated
-        except TypeError as e:
+            # Load the indexed speech task stimuli (parsed once per
+            # file and kept in a sidecar)
+            corpus = CorpusIndex.load(self.kwargs['filepath'])
+            # Reuse the matrix of an identical design
+            cache = self.kwargs.get('cache')
+            key = None
+            matrix = None
+            if cache is not None:
+                key = matrix_key(corpus.content_hash, self.kwargs)
+                if key is not None:
+                    matrix = cache.get(key)
+            if matrix is None:
+                # Select lists/sentences, add levels and speakers,
+                # repeat and randomize as index arrays, then gather once
+                matrix = build_matrix(
+                    corpus,
+                    lists=self.kwargs['lists'],
+                    sentences_per_list=self.kwargs['sentences_per_list'],
+                    levels=self.kwargs['levels'],
+                    speakers=self.kwargs['speakers'],
+                    presentations=self.kwargs['presentations'],
+                    randomize=self.kwargs['randomize'],
+                    constraints=self.kwargs.get('constraints', ()),
+                    seed=self.kwargs.get('seed')
+                )
+                if key is not None:
+                    cache.put(key, matrix, self.kwargs)
+            if self.kwargs['write'] == True:
+                if cache is not None:
+                    cache.write_csv(key, matrix, "matrix_file.csv")
+                else:
+                    matrix.to_csv("matrix_file.csv", index=False)
+            return matrix
+        except (TypeError, ValueError) as e:
             logger.error(e)
 
 ################
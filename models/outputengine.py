@@ -0,0 +1,294 @@
+""" Persistent audio output engine for Speech Tasker.
+
+    The audio device is opened once per session with a fixed block
+    size and enough channels for every speaker in the matrix. Trials
+    are queued into the running stream as device-ready buffers, so
+    no stream is opened or closed between trials.
+
+    An optional masker can be looped continuously on its own
+    channels. Trial buffers are mixed on top of it in the callback,
+    so the masker keeps running without gaps across trials.
+
+    When a buffer has been played out, the callback queues its
+    measured start and stop times (stream clock, in seconds) with
+    the tag it was played with. The GUI thread collects them with
+    ``poll_finished``; nothing in the callback touches Tk or logs.
+    Stream status flags (e.g., output underflow) are only counted in
+    the callback and logged by ``poll_finished``.
+
+    If the masker plus a trial buffer exceeds full scale, the block
+    is clipped to +/-1 and counted. The count for each buffer is
+    reported with its timing ('clipped_blocks') so the GUI can warn
+    that the calibrated level was not presented.
+
+    Created: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import logging
+import os
+import queue
+import sys
+
+# Third party
+import numpy as np
+import sounddevice as sd
+
+# Add custom path
+try:
+    sys.path.append(os.environ['TMPY'])
+except KeyError:
+    sys.path.append('C:\\Users\\MooTra\\Code\\Python')
+
+# Custom
+from tmpy.audio_handlers import InvalidAudioDevice
+
+##########
+# Logger #
+##########
+# Create new logger
+logger = logging.getLogger(__name__)
+
+################
+# OutputEngine #
+################
+class OutputEngine:
+    """ Long-lived output stream that plays queued buffers. """
+
+    def __init__(self, device, channels, samplerate, blocksize=256):
+        """ Open the output stream. The stream is started
+        immediately and outputs silence until a buffer is queued.
+
+        :param device: sounddevice device ID
+        :type device: int
+        :param channels: Number of output channels
+        :type channels: int
+        :param samplerate: Stream sampling rate in Hz
+        :type samplerate: int
+        :param blocksize: Frames per callback
+        :type blocksize: int
+        :raises InvalidAudioDevice: If the device cannot be opened
+        """
+        logger.info("Initializing OutputEngine")
+        self.channels = int(channels)
+        self.samplerate = int(samplerate)
+        self.blocksize = int(blocksize)
+        self.duration = 0.0
+        self.finished = queue.SimpleQueue()
+
+        # Playback state (only touched by the audio callback)
+        self._queue = queue.SimpleQueue()
+        self._current = None
+        self._pos = 0
+        self._stop = False
+        self._queued_at = None
+        self._started_at = None
+        self._tag = None
+        self._masker = None
+        self._masker_pos = 0
+        self._buffer_clipped = 0
+        # Blocks clipped since the stream was opened
+        self.clipped_blocks = 0
+        # Callbacks with a stream status flag (e.g., output underflow)
+        self.status_count = 0
+        self._last_status = None
+        self._status_logged = 0
+
+        try:
+            self.stream = sd.OutputStream(
+                device=device,
+                channels=self.channels,
+                samplerate=self.samplerate,
+                blocksize=self.blocksize,
+                dtype='float32',
+                latency='low',
+                callback=self._callback
+            )
+            self.stream.start()
+        except (sd.PortAudioError, ValueError) as e:
+            raise InvalidAudioDevice(str(e)) from e
+        logger.info(
+            "Opened device %s: %d channels, %d Hz, %d frames/block",
+            device, self.channels, self.samplerate, self.blocksize
+        )
+
+    @staticmethod
+    def default_samplerate(device):
+        """ Return the default output sampling rate of a device.
+
+        :raises InvalidAudioDevice: If the device does not exist
+        """
+        try:
+            info = sd.query_devices(device, 'output')
+        except (sd.PortAudioError, ValueError) as e:
+            raise InvalidAudioDevice(str(e)) from e
+        return int(info['default_samplerate'])
+
+    def _callback(self, outdata, frames, time_info, status):
+        """ Copy the next block of the current buffer to the device. """
+        if status:
+            # Logged by poll_finished, off the audio thread
+            self.status_count += 1
+            self._last_status = status
+        dac_time = time_info.outputBufferDacTime
+        if self._stop:
+            self._stop = False
+            if self._current is not None:
+                self._post_finished(dac_time, stopped=True)
+            while not self._queue.empty():
+                self._queue.get_nowait()
+        if self._current is None and not self._queue.empty():
+            self._current, self._queued_at, self._tag = \
+                self._queue.get_nowait()
+            self._started_at = dac_time
+            self._pos = 0
+            self._buffer_clipped = 0
+
+        finished = False
+        if self._current is None:
+            outdata.fill(0)
+        else:
+            buffer = self._current
+            pos = self._pos
+            n = min(frames, buffer.shape[0] - pos)
+            outdata[:n] = buffer[pos:pos + n]
+            outdata[n:] = 0
+            self._pos = pos + n
+            finished = self._pos >= buffer.shape[0]
+
+        if self._masker is not None:
+            self._mix_masker(outdata, frames)
+            # max()/min() avoid allocating in the callback
+            if outdata.max() > 1.0 or outdata.min() < -1.0:
+                np.clip(outdata, -1.0, 1.0, out=outdata)
+                self.clipped_blocks += 1
+                self._buffer_clipped += 1
+
+        if finished:
+            self._post_finished(dac_time + n / self.samplerate)
+
+    def _mix_masker(self, outdata, frames):
+        """ Add the next block of the looping masker to outdata in
+        place. Wraps around the end of the masker without allocating.
+        """
+        masker, columns = self._masker
+        length = masker.shape[0]
+        # Wrap in case the masker was swapped for a shorter one
+        pos = self._masker_pos % length
+        done = 0
+        while done < frames:
+            n = min(frames - done, length - pos)
+            for src, dst in columns:
+                np.add(
+                    outdata[done:done + n, dst],
+                    masker[pos:pos + n, src],
+                    out=outdata[done:done + n, dst]
+                )
+            done += n
+            pos = (pos + n) % length
+        self._masker_pos = pos
+
+    def _post_finished(self, stop_time, stopped=False):
+        """ Record the timing of the current buffer and release it. """
+        self.finished.put({
+            'queued': self._queued_at,
+            'start': self._started_at,
+            'stop': stop_time,
+            'stopped': stopped,
+            'clipped_blocks': self._buffer_clipped,
+            'tag': self._tag
+        })
+        self._current = None
+
+    def play(self, buffer, tag=None):
+        """ Queue a buffer for playback.
+
+        :param buffer: Samples of shape (frames, channels)
+        :type buffer: np.ndarray
+        :param tag: Returned with the buffer's timing by
+            poll_finished, to match it to the presentation
+        :type tag: hashable
+        """
+        if buffer.shape[1] != self.channels:
+            raise ValueError(
+                f"Buffer has {buffer.shape[1]} channels; stream has "
+                + f"{self.channels}."
+            )
+        self.duration = buffer.shape[0] / self.samplerate
+        self._queue.put((
+            np.ascontiguousarray(buffer, dtype=np.float32),
+            self.stream.time,
+            tag
+        ))
+
+    def set_masker(self, masker, routing):
+        """ Loop a masker continuously on the given speakers.
+
+        :param masker: Scaled masker of shape (frames, n) or (frames,)
+        :type masker: np.ndarray
+        :param routing: 1-based output channel for each masker channel
+        :type routing: list
+        """
+        masker = np.ascontiguousarray(masker, dtype=np.float32)
+        if masker.ndim == 1:
+            masker = masker[:, np.newaxis]
+        if masker.shape[1] != len(routing):
+            raise ValueError(
+                f"Masker has {masker.shape[1]} channel(s) but routing "
+                + f"has {len(routing)}."
+            )
+        if max(routing) > self.channels:
+            raise ValueError(
+                f"Masker routing {routing} exceeds the {self.channels} "
+                + "output channel(s)."
+            )
+        logger.info("Starting masker on channel(s) %s", routing)
+        columns = tuple((src, dst - 1) for src, dst in enumerate(routing))
+        # Swap in one assignment so the callback never sees a mix
+        self._masker = (masker, columns)
+        # Start the new masker from its beginning
+        self._masker_pos = 0
+
+    def clear_masker(self):
+        """ Stop the looping masker. """
+        logger.info("Stopping masker")
+        self._masker = None
+        self._masker_pos = 0
+
+    def poll_finished(self):
+        """ Return timing dicts of buffers finished since the last
+        call. Safe to call from the GUI thread.
+
+        Also logs any stream status flags raised since the last call.
+        """
+        count = self.status_count
+        if count != self._status_logged:
+            logger.warning(
+                "Output stream status in %d callbacks (last: %s)",
+                count - self._status_logged, self._last_status
+            )
+            self._status_logged = count
+        done = []
+        while not self.finished.empty():
+            done.append(self.finished.get_nowait())
+        return done
+
+    def stop(self):
+        """ Stop the current buffer and discard queued buffers. """
+        logger.info("Stopping output engine playback")
+        self._stop = True
+
+    def close(self):
+        """ Stop and close the output stream. """
+        logger.info("Closing output engine")
+        self.stream.stop()
+        self.stream.close()
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
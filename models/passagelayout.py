@@ -0,0 +1,94 @@
+""" Word-wrap layout for long passages in Speech Tasker.
+
+    Places words (each a slot holding the word and, for key words, a
+    checkbox below it) on lines of a fixed width, and answers which
+    words fall inside a vertical window. The passage display only
+    draws those words, so the cost of a redraw depends on the height
+    of the window, not on the length of the passage. No Tk here:
+    slot widths are measured by the caller.
+
+    Created: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import logging
+
+# Third party
+import numpy as np
+
+##########
+# Logger #
+##########
+# Create new logger
+logger = logging.getLogger(__name__)
+
+#################
+# PassageLayout #
+#################
+class PassageLayout:
+    """ Greedy word wrap of slot widths into lines. """
+
+    def __init__(self, widths, line_width, line_height, spacing=0):
+        """ Lay out a passage.
+
+        :param widths: Width of each word slot (px)
+        :type widths: sequence of int
+        :param line_width: Available width of a line (px)
+        :type line_width: int
+        :param line_height: Height of a line (px)
+        :type line_height: int
+        :param spacing: Gap between neighbouring slots (px)
+        :type spacing: int
+        """
+        self.line_width = line_width
+        self.line_height = line_height
+        self.widths = np.asarray(widths, dtype=np.int32)
+        self.x = np.zeros(len(self.widths), dtype=np.int32)
+        self.line = np.zeros(len(self.widths), dtype=np.int32)
+        x = 0
+        line = 0
+        for ii, width in enumerate(self.widths.tolist()):
+            # A slot wider than the line gets a line of its own
+            if x and x + width > line_width:
+                line += 1
+                x = 0
+            self.x[ii] = x
+            self.line[ii] = line
+            x += width + spacing
+        self.lines = line + 1 if len(self.widths) else 0
+
+    def __len__(self):
+        return len(self.widths)
+
+    @property
+    def height(self):
+        """ Total height of the passage (px). """
+        return self.lines * self.line_height
+
+    def y(self, index):
+        """ Return the top of the line holding a word (px). """
+        return int(self.line[index]) * self.line_height
+
+    def visible(self, top, bottom):
+        """ Return the (start, stop) word indexes of every line that
+        overlaps the window [top, bottom).
+
+        :param top: Top of the window (px)
+        :type top: float
+        :param bottom: Bottom of the window (px)
+        :type bottom: float
+        """
+        first = max(int(top // self.line_height), 0)
+        last = int(np.ceil(bottom / self.line_height)) - 1
+        start = int(np.searchsorted(self.line, first, side='left'))
+        stop = int(np.searchsorted(self.line, last, side='right'))
+        return start, max(start, stop)
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,141 @@
+""" Pre-flight validation of a whole session matrix.
+
+    Checks every (file, level, speaker) row before the first trial:
+    that the file exists, that its sampling rate suits the output
+    stream, that the speaker exists on the device, and that the peak
+    after gain stays below full scale. Channel layouts are not
+    checked: multichannel stimuli are downmixed to mono by the
+    ConversionCache before they are measured.
+    With a looping masker, the masker's peak on the trial's speaker
+    is added to the trial's peak, as the two are mixed on output.
+    The per-file measurements come from the LevelIndex (built on a
+    process pool), so the row checks themselves are vectorized.
+
+    Created: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import logging
+
+# Third party
+import numpy as np
+
+##########
+# Logger #
+##########
+# Create new logger
+logger = logging.getLogger(__name__)
+
+###################
+# PreflightReport #
+###################
+class PreflightReport:
+    """ Problems found by a pre-flight check. """
+
+    # Report sections, in display order
+    SECTIONS = {
+        'missing': "Missing or unreadable files",
+        'samplerate': "Sampling rate does not match the output stream",
+        'routing': "Speaker not available on the audio device",
+        'clipping': "Level would clip (file @ dB)",
+    }
+
+    def __init__(self, n_rows):
+        self.n_rows = n_rows
+        self.problems = {key: [] for key in self.SECTIONS}
+
+    @property
+    def ok(self):
+        """ True if no problems were found. """
+        return not any(self.problems.values())
+
+    def summary(self, limit=5):
+        """ Return a human-readable summary, listing at most
+        ``limit`` items per section.
+        """
+        if self.ok:
+            return f"All {self.n_rows} trials passed."
+        lines = []
+        for key, title in self.SECTIONS.items():
+            items = self.problems[key]
+            if not items:
+                continue
+            lines.append(f"{title} ({len(items)}):")
+            lines += [f"  {item}" for item in items[:limit]]
+            if len(items) > limit:
+                lines.append(f"  ... and {len(items) - limit} more")
+        return '\n'.join(lines)
+
+#############
+# Functions #
+#############
+def check_trials(trials, level_index, channels, samplerate, slm_offset,
+                 masker=None, masker_routing=None):
+    """ Validate every row of a trial matrix.
+
+    :param trials: Matrix with 'file', 'level' and 'speaker' columns
+    :type trials: pd.DataFrame
+    :param level_index: Measurements for the session stimuli
+    :type level_index: LevelIndex
+    :param channels: Output stream channel count
+    :type channels: int
+    :param samplerate: Output stream sampling rate
+    :type samplerate: int
+    :param slm_offset: Calibration offset (dB SPL - dB FS)
+    :type slm_offset: float
+    :param masker: Scaled masker looped under the trials (None if
+        noise is not presented)
+    :type masker: np.ndarray
+    :param masker_routing: 1-based speaker of each masker channel
+    :type masker_routing: list
+    :return: Report of all problems found
+    :rtype: PreflightReport
+    """
+    logger.info("Running pre-flight check on %d trials", len(trials))
+    report = PreflightReport(len(trials))
+    files = trials['file'].to_numpy()
+    speakers = trials['speaker'].to_numpy(dtype=int)
+    levels = trials['level'].to_numpy(dtype=float) - slm_offset
+
+    # Per-file checks (once per unique file)
+    unique, inverse = np.unique(files, return_inverse=True)
+    known = np.array([name in level_index for name in unique], dtype=bool)
+    report.problems['missing'] = [str(n) for n in unique[~known]]
+    for name in unique[known]:
+        entry = level_index[name]
+        if entry['sr'] is not None and entry['sr'] != samplerate:
+            report.problems['samplerate'].append(f"{name} ({entry['sr']} Hz)")
+
+    # Per-row checks
+    bad_speakers = np.unique(speakers[(speakers < 1) | (speakers > channels)])
+    report.problems['routing'] = [f"Speaker {s}" for s in bad_speakers]
+
+    # Headroom left for the sentence on each row's speaker
+    limits = np.ones(len(files))
+    if masker is not None:
+        masker = np.asarray(masker)
+        if masker.ndim == 1:
+            masker = masker[:, np.newaxis]
+        peaks = np.max(np.abs(masker), axis=0)
+        for peak, speaker in zip(peaks, masker_routing):
+            limits[speakers == speaker] -= peak
+
+    rows = known[inverse]
+    if rows.any():
+        clips = np.zeros(len(files), dtype=bool)
+        clips[rows] = level_index.clipping(
+            files[rows], levels[rows], limit=limits[rows])
+        pairs = sorted(set(zip(files[clips], trials['level'].to_numpy()[clips])))
+        report.problems['clipping'] = [f"{f} @ {lvl}" for f, lvl in pairs]
+
+    logger.info("Pre-flight result:\n%s", report.summary())
+    return report
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,256 @@
+""" Pre-rendering of upcoming trials in a separate process.
+
+    A worker process loads, level-scales and routes the stimuli of
+    the next few trials into final, device-ready buffers. Buffers
+    are handed back through shared memory: the GUI process allocates
+    one block per trial (its size is known from the level index),
+    the worker renders into it, and the GUI process takes a private
+    copy when the job is collected and frees the block right away,
+    so no array ever outlives its shared memory. On Next, the Tk
+    thread only queues a ready buffer.
+
+    Every job is tagged with a generation number. ``invalidate``
+    (e.g., after a calibration change) bumps the generation, so any
+    buffer rendered with the old calibration is discarded.
+
+    Created: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import logging
+import multiprocessing
+import queue
+import time
+from multiprocessing import shared_memory
+
+# Third party
+import numpy as np
+
+# Custom
+from models.audiorender import render_trial
+from models.stimulusbundle import StimulusBundle
+from models.stimuluscache import StimulusCache
+
+##########
+# Logger #
+##########
+# Create new logger
+logger = logging.getLogger(__name__)
+
+###############
+# RenderError #
+###############
+class RenderError(Exception):
+    """ Raised when the worker could not render a trial. """
+    pass
+
+##########
+# Worker #
+##########
+def _attach(name):
+    """ Attach to an existing shared memory block without handing
+    its lifetime to this process.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13: the worker shares the GUI process's
+        # resource tracker, so registering the block again is harmless
+        return shared_memory.SharedMemory(name=name)
+
+
+def _load(spec, cache, bundles):
+    """ Load the samples described by a job spec. """
+    if spec['kind'] == 'converted':
+        return np.load(spec['path'], mmap_mode='r')
+    if spec['kind'] == 'bundle':
+        if spec['path'] not in bundles:
+            bundles[spec['path']] = StimulusBundle(spec['path'])
+        return bundles[spec['path']].get(spec['name'])[0]
+    return cache.get(spec['path'])[0]
+
+
+def _worker(jobs, results, channels, cache_bytes):
+    """ Render jobs until a None job is received. """
+    cache = StimulusCache(max_bytes=cache_bytes)
+    bundles = {}
+    while True:
+        job = jobs.get()
+        if job is None:
+            break
+        key, spec, shm_name = job
+        try:
+            audio = _load(spec, cache, bundles)
+            buffer = render_trial(
+                audio=audio,
+                level=spec['level'],
+                routing=spec['routing'],
+                channels=channels,
+                stats=spec['stats']
+            )
+            shm = _attach(shm_name)
+            out = np.ndarray(buffer.shape, dtype=np.float32, buffer=shm.buf)
+            out[:] = buffer
+            del out
+            shm.close()
+            results.put((key, None))
+        except Exception as e:
+            # Report any failure back to the GUI process
+            results.put((key, f"{type(e).__name__}: {e}"))
+
+##################
+# RenderPipeline #
+##################
+class RenderPipeline:
+    """ Render the next K trials in a worker process. """
+
+    def __init__(self, channels, depth=3, cache_bytes=256 * 1024**2):
+        """ Start the worker process.
+
+        :param channels: Output stream channel count
+        :type channels: int
+        :param depth: Number of upcoming trials to pre-render
+        :type depth: int
+        :param cache_bytes: Stimulus cache budget for the worker
+        :type cache_bytes: int
+        """
+        logger.info("Initializing RenderPipeline")
+        self.channels = int(channels)
+        self.depth = int(depth)
+        self.generation = 0
+        self._pending = {}
+        self._ready = {}
+
+        # Counters
+        self.ready = 0
+        self.waits = 0
+        self.direct = 0
+        self.wait_time = 0.0
+
+        # Spawn so the worker never inherits Tk state
+        ctx = multiprocessing.get_context('spawn')
+        self._jobs = ctx.Queue()
+        self._results = ctx.Queue()
+        self._process = ctx.Process(
+            target=_worker,
+            args=(self._jobs, self._results, self.channels, cache_bytes),
+            name='render',
+            daemon=True
+        )
+        self._process.start()
+
+    def _submit(self, row, spec):
+        """ Allocate a shared block for a row and queue its job. """
+        key = (self.generation, row)
+        nbytes = spec['frames'] * self.channels * 4
+        shm = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+        self._pending[key] = (shm, (spec['frames'], self.channels))
+        self._jobs.put((key, spec, shm.name))
+
+    def schedule(self, jobs):
+        """ Queue upcoming trials for rendering.
+
+        :param jobs: (row, spec) pairs in trial order. A spec holds
+            'kind', 'path', 'name', 'level' (dB FS), 'routing',
+            'stats' (rms/peak) and 'frames'.
+        :type jobs: list
+        """
+        for row, spec in list(jobs)[:self.depth]:
+            key = (self.generation, row)
+            if key not in self._pending and row not in self._ready:
+                self._submit(row, spec)
+
+    def _collect(self, block=False, timeout=None):
+        """ Move one finished job from the worker into the ready
+        buffers. Returns False if nothing arrived.
+        """
+        try:
+            key, error = self._results.get(block=block, timeout=timeout)
+        except queue.Empty:
+            return False
+        shm, shape = self._pending.pop(key)
+        generation, row = key
+        # Results from an outdated calibration are dropped
+        if generation == self.generation:
+            if error is not None:
+                self._ready[row] = error
+            else:
+                self._ready[row] = np.ndarray(
+                    shape, dtype=np.float32, buffer=shm.buf).copy()
+        shm.close()
+        shm.unlink()
+        return True
+
+    def get(self, row, spec):
+        """ Return the rendered buffer for a row, waiting for the
+        worker if needed. The buffer stays valid until the row is
+        released, so Repeat plays the same block.
+
+        :raises RenderError: If the worker failed to render the row
+        """
+        while self._collect():
+            pass
+        if row in self._ready:
+            self.ready += 1
+        else:
+            if (self.generation, row) not in self._pending:
+                self.direct += 1
+                self._submit(row, spec)
+            self.waits += 1
+            start = time.perf_counter()
+            while row not in self._ready:
+                if not self._collect(block=True, timeout=5):
+                    if not self._process.is_alive():
+                        raise RenderError("Render process has stopped.")
+            self.wait_time += time.perf_counter() - start
+            logger.warning("Playback waited on an unfinished render")
+        result = self._ready[row]
+        if isinstance(result, str):
+            del self._ready[row]
+            raise RenderError(result)
+        return result
+
+    def release_before(self, row):
+        """ Drop the buffers of all rows before the given row. """
+        for old in [r for r in self._ready if r < row]:
+            del self._ready[old]
+
+    def invalidate(self):
+        """ Discard every buffer rendered so far (e.g., after the
+        calibration changed). In-flight jobs are dropped on arrival.
+        """
+        logger.info("Invalidating pre-rendered trials")
+        self.generation += 1
+        self._ready.clear()
+
+    def close(self):
+        """ Stop the worker and free all shared memory. """
+        logger.info("Closing RenderPipeline")
+        self._jobs.put(None)
+        self._process.join(timeout=2)
+        if self._process.is_alive():
+            self._process.terminate()
+        self._ready.clear()
+        for shm, _ in self._pending.values():
+            shm.close()
+            shm.unlink()
+        self._pending.clear()
+
+    @property
+    def stats(self):
+        """ Return a dictionary of pipeline counters. """
+        return {
+            'ready': self.ready,
+            'waits': self.waits,
+            'wait_ms': round(self.wait_time * 1000, 1),
+            'direct': self.direct
+        }
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
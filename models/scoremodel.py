@@ -35,7 +35,8 @@ class ScoreModel:
         logger.info("Getting words marked correct and incorrect")
         correct = []
         incorrect = []
-        resp_dict = {'correct': correct, 'incorrect': incorrect}
+        resp_dict = {'correct': correct, 'incorrect': incorrect,
+                     'key_words': []}
         for key, value in button_states.items():
             if value.get() == 1:
                 resp_dict['correct'].append(
@@ -45,6 +46,11 @@ class ScoreModel:
                 resp_dict['incorrect'].append(
                     words[key].cget('text')
                     )
+            else:
+                continue
+            # Position of the word in the sentence
+            resp_dict['key_words'].append(
+                (key, words[key].cget('text'), value.get() == 1))
         logger.info("Correct: %s", resp_dict['correct'])
         logger.info("Incorrect: %s", resp_dict['incorrect'])
         return resp_dict
@@ -80,6 +86,30 @@ class ScoreModel:
         # Return resp_dict of words to save to CSV
         return resp_dict
 
+    def score_words(self, words, marked):
+        """ Score a trial from plain data (no Tk widgets). Key
+        words are the CAPITALIZED words of the sentence.
+
+        :param words: Words of the sentence, in order
+        :type words: list of str
+        :param marked: Indexes of the key words marked correct
+        :type marked: set of int
+        :return: Same dictionary as score(): the correct and
+            incorrect words, plus 'key_words', a (position in the
+            sentence, word, correct) tuple per key word
+        :rtype: dict
+        """
+        resp_dict = {'correct': [], 'incorrect': [], 'key_words': []}
+        for ii, word in enumerate(words):
+            if word == word.upper():
+                key = 'correct' if ii in marked else 'incorrect'
+                resp_dict[key].append(word)
+                resp_dict['key_words'].append((ii, word, ii in marked))
+        self._get_outcome(resp_dict)
+        resp_dict['num_correct'] = len(resp_dict['correct'])
+        resp_dict['total_words'] = len(words)
+        return resp_dict
+
 ################
 # Module Guard #
 ################
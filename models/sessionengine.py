@@ -0,0 +1,264 @@
+""" Headless session engine for Speech Tasker.
+
+    Owns the state of a running session: the trial table, scoring,
+    presentation levels, and persistence to the session writer and
+    journal. Nothing here touches Tk, so sessions can be driven from
+    scripts, tests and profilers; the Application is a thin adapter
+    that shows each trial and passes back which key words were
+    marked correct.
+
+    Typical use:
+        engine = SessionEngine(trials, settings={'Subject': '001'})
+        while (trial := engine.next()) is not None:
+            engine.score(marked={0, 2})
+        engine.finish()
+
+    Created: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import logging
+
+# Custom
+from models.scoremodel import ScoreModel
+from models.sessionwriter import DATA_COLUMNS
+from models.trialtable import TrialTable
+
+##########
+# Logger #
+##########
+# Create new logger
+logger = logging.getLogger(__name__)
+
+#################
+# SessionEngine #
+#################
+class SessionEngine:
+    """ Trial sequencing, scoring and persistence for one session. """
+
+    def __init__(self, trials, settings=None, writer=None, journal=None,
+                 slm_offset=0.0):
+        """ Create a session over a trial matrix.
+
+        :param trials: Trials in presentation order
+        :type trials: pd.DataFrame
+        :param settings: Plain values of the session settings
+            (e.g., Subject and Condition for the data file)
+        :type settings: dict
+        :param writer: Session data writer (rows are not written if
+            None)
+        :type writer: models.SessionWriter
+        :param journal: Session journal (nothing journaled if None)
+        :type journal: models.SessionJournal
+        :param slm_offset: SLM offset (dB) for presentation levels
+        :type slm_offset: float
+        """
+        self.trials = trials
+        self.th = TrialTable(trials)
+        self.settings = dict(settings or {})
+        self.writer = writer
+        self.journal = journal
+        self.slm_offset = slm_offset
+        self.scorer = ScoreModel()
+        # Desired level (dB) of every scored trial
+        self.level_data = []
+        # Whether the current trial has been presented but not scored
+        self.awaiting_response = False
+
+    @classmethod
+    def from_journal(cls, state, **kwargs):
+        """ Rebuild a session from models.sessionjournal.read_journal
+        output, positioned before the first unscored trial.
+
+        :param state: Session state read from a journal
+        :type state: dict
+        """
+        engine = cls(state['trials'], **kwargs)
+        for record in state['scored']:
+            engine.th.next()
+            engine.level_data.append(record['row']['desired_level_dB'])
+        return engine
+
+    ##############
+    # Properties #
+    ##############
+    @property
+    def seed(self):
+        """ Seed recorded with shuffled trials, if any. """
+        if 'seed' not in self.trials or self.trials.empty:
+            return None
+        return int(self.trials['seed'].iat[0])
+
+    @property
+    def trial(self):
+        """ Current trial (read-only mapping of its fields). """
+        return self.th.trial_info
+
+    @property
+    def desired_level(self):
+        """ Desired level (dB) of the current trial. """
+        return self.th.trial_info['level']
+
+    ###########
+    # Methods #
+    ###########
+    def start(self, filename):
+        """ Journal the trial order, settings and seed.
+
+        :param filename: Data file name
+        :type filename: str
+        """
+        if self.journal is None:
+            return
+        self.journal.start(
+            filename=filename,
+            trials=self.trials,
+            settings=self.settings,
+            seed=self.seed
+        )
+
+    def calibrate(self, **values):
+        """ Set the SLM offset and journal the calibration.
+
+        :param values: Must include 'slm_offset' (dB)
+        :type values: float
+        """
+        self.slm_offset = values['slm_offset']
+        if self.journal is not None:
+            self.journal.calibration(**values)
+
+    def presentation_level(self, row):
+        """ Return the output level (dB FS) of any row.
+
+        :param row: 0-based row index
+        :type row: int
+        """
+        return self.th.value('level', row) - self.slm_offset
+
+    def render_spec(self, row, level_index, source):
+        """ Return the render job (see RenderPipeline.schedule) for a
+        row of the trial matrix.
+
+        :param row: 0-based row index
+        :type row: int
+        :param level_index: Measured levels of the stimuli
+        :type level_index: models.LevelIndex
+        :param source: Returns the (kind, path) a file is played from
+        :type source: callable
+        """
+        name = self.th.value('file', row)
+        kind, path = source(name)
+        entry = level_index[name]
+        return {
+            'kind': kind,
+            'path': str(path),
+            'name': name,
+            'level': self.presentation_level(row),
+            'routing': [int(self.th.value('speaker', row))],
+            'stats': {'rms': entry['rms'], 'peak': entry['peak']},
+            'frames': entry['frames']
+        }
+
+    def next(self):
+        """ Advance to the next trial. Returns the trial (a view
+        that follows the current trial, not a copy), or None after
+        the last one.
+        """
+        try:
+            self.th.next()
+        except IndexError:
+            logger.warning("End of trials!")
+            self.awaiting_response = False
+            return None
+        self.awaiting_response = True
+        return self.th.trial_info
+
+    def score(self, marked, timing=None):
+        """ Score the current trial and save its data row.
+
+        :param marked: Indexes of the key words marked correct
+        :type marked: set of int
+        :param timing: Extra fields (e.g., measured playback timing)
+        :type timing: dict
+        :raises OSError: If the data row cannot be written (the trial
+            is still scored and journaled)
+        :return: Scored words and outcome
+        :rtype: dict
+        """
+        if not self.awaiting_response:
+            raise RuntimeError("No trial is awaiting a response.")
+        self.awaiting_response = False
+        responses = self.scorer.score_words(
+            words=self.th.trial_info['sentence'].split(),
+            marked=marked
+        )
+        responses.update(timing or {})
+        self.level_data.append(self.desired_level)
+        self._save(responses)
+        return responses
+
+    def finish(self):
+        """ Record that the session finished normally. """
+        if self.journal is not None:
+            self.journal.end()
+
+    def run(self, respond, limit=None):
+        """ Present and score trials without a UI.
+
+        :param respond: Called with each trial; returns the indexes
+            of the key words marked correct
+        :type respond: callable
+        :param limit: Stop after this many trials (all if None)
+        :type limit: int
+        :return: Number of trials scored
+        :rtype: int
+        """
+        scored = 0
+        while limit is None or scored < limit:
+            trial = self.next()
+            if trial is None:
+                self.finish()
+                break
+            self.score(respond(trial))
+            scored += 1
+        return scored
+
+    def row(self, responses):
+        """ Return the data row of the current trial.
+
+        :param responses: Output of score_words (plus timing)
+        :type responses: dict
+        """
+        columns = (self.writer.columns if self.writer is not None
+                   else DATA_COLUMNS)
+        levels = {'desired_level_dB': self.desired_level}
+        # 1-based number of the trial in the session
+        trial = {'trial': self.th.trial_num}
+        row = {}
+        for source in (self.settings, levels, responses,
+                       self.th.trial_info, trial):
+            for key in columns:
+                if key in source:
+                    row[key] = source[key]
+        return row
+
+    def _save(self, responses):
+        """ Journal the scored trial and queue its data row. """
+        if self.writer is None and self.journal is None:
+            return
+        row = self.row(responses)
+        # Journal the scored trial for File>Resume Session
+        if self.journal is not None:
+            self.journal.trial(trial_num=self.th.trial_num, row=row)
+        if self.writer is not None:
+            self.writer.write(row)
+            logger.info("Session writer: %s", self.writer.stats)
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,171 @@
+""" Crash-safe session journal for Speech Tasker.
+
+    Every session appends JSON lines to a small journal next to its
+    data file:
+        start:       data file name, realised trial order, RNG seed
+                     and a snapshot of the session settings
+        calibration: SLM offset at the start and after every change
+        trial:       each scored trial (its data row)
+        end:         the session finished normally
+
+    Records are written by the SessionWriter thread and fsynced, so
+    a crash loses at most the trial being scored. ``read_journal``
+    rebuilds the session state from the records, without replaying
+    audio or re-scoring; a partially written last line is ignored.
+
+    Created: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import json
+import logging
+from pathlib import Path
+
+# Third party
+import pandas as pd
+
+# Custom
+from models.sessionwriter import SessionWriter
+
+##########
+# Logger #
+##########
+# Create new logger
+logger = logging.getLogger(__name__)
+
+#############
+# Constants #
+#############
+JOURNAL_SUFFIX = '.journal'
+
+#############
+# Functions #
+#############
+def _to_json(value):
+    """ JSON fallback for NumPy scalars and other objects. """
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+def journal_path(data_dir, filename):
+    """ Return the journal file of a session data file name. """
+    return Path(data_dir) / (Path(filename).stem + JOURNAL_SUFFIX)
+
+
+def read_journal(path):
+    """ Rebuild session state from a journal.
+
+    :param path: Journal file
+    :type path: str or Path
+    :return: Dictionary with 'filename', 'trials' (DataFrame in the
+        realised order), 'seed', 'settings', 'calibration' (the
+        latest), 'scored' (trial records in order) and 'complete'
+    :rtype: dict
+    :raises ValueError: If the file has no start record
+    """
+    state = None
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Torn write from a crash
+                logger.warning("Ignoring incomplete journal line")
+                continue
+            event = record.pop('event')
+            if event == 'start':
+                order = record['order']
+                state = {
+                    'filename': record['filename'],
+                    'trials': pd.DataFrame(
+                        order['data'], columns=order['columns']),
+                    'seed': record['seed'],
+                    'settings': record['settings'],
+                    'calibration': {},
+                    'scored': [],
+                    'complete': False
+                }
+            elif state is None:
+                continue
+            elif event == 'calibration':
+                state['calibration'] = record
+            elif event == 'trial':
+                state['scored'].append(record)
+            elif event == 'end':
+                state['complete'] = True
+    if state is None:
+        raise ValueError(f"{path} is not a session journal")
+    return state
+
+##################
+# SessionJournal #
+##################
+class SessionJournal(SessionWriter):
+    """ Append-only JSON-lines journal of one session. """
+
+    def __init__(self, filepath):
+        """ Open (or reopen, when resuming) a session journal.
+
+        :param filepath: Journal file
+        :type filepath: str or Path
+        :raises OSError: If the file cannot be opened
+        """
+        super().__init__(filepath, columns=[])
+
+    def _open(self):
+        """ Open the journal for appending (writer thread). """
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.filepath, 'a+', encoding='utf-8')
+        # Terminate a torn last line before appending (resume)
+        if self._file.tell() > 0:
+            self._file.seek(self._file.tell() - 1)
+            if self._file.read(1) != '\n':
+                self._file.write('\n')
+
+    def _write_rows(self, rows):
+        """ Append records and sync once per batch (writer thread). """
+        for row in rows:
+            self._file.write(json.dumps(row, default=_to_json) + '\n')
+        self._sync()
+
+    def start(self, filename, trials, settings, seed=None):
+        """ Record the start of a session.
+
+        :param filename: Data file name
+        :type filename: str
+        :param trials: Trials in the order they will be presented
+        :type trials: pd.DataFrame
+        :param settings: Plain values of the session settings
+        :type settings: dict
+        :param seed: Seed used to randomize the trial order
+        :type seed: int
+        """
+        self.write({
+            'event': 'start',
+            'filename': filename,
+            'order': json.loads(trials.to_json(orient='split', index=False)),
+            'seed': seed,
+            'settings': settings
+        })
+
+    def calibration(self, **values):
+        """ Record the calibration state (e.g., slm_offset). """
+        self.write(dict(values, event='calibration'))
+
+    def trial(self, trial_num, row):
+        """ Record a scored trial and its data row. """
+        self.write({'event': 'trial', 'trial_num': trial_num, 'row': row})
+
+    def end(self):
+        """ Record that the session finished normally. """
+        self.write({'event': 'end'})
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
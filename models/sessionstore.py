@@ -0,0 +1,302 @@
+""" SQLite session store for Speech Tasker.
+
+    An alternative to the per-session CSV files: every session is
+    written to one local SQLite database (WAL mode), so all sessions
+    of a subject or condition can be found with an indexed query
+    instead of globbing and parsing the Data folder.
+
+    Tables:
+        sessions: one row per session (subject, condition, start time)
+        trials:   one row per scored trial
+        words:    one row per scored key word, with its position
+                  (0-based index) in the sentence
+
+    Rows are queued by the Tk thread and inserted by the
+    SessionWriter thread, one transaction per batch of queued rows.
+    A resumed session appends to the session row of its data file,
+    so an interrupted session keeps a single session_id.
+
+    Export sessions to the CSV layout of the data files with:
+        python -m models.sessionstore <database> <csv_file>
+            [--subject SUBJECT] [--condition CONDITION]
+
+    Created: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import csv
+import datetime
+import logging
+import sqlite3
+
+# Custom
+from models.sessionwriter import DATA_COLUMNS, SessionWriter
+
+##########
+# Logger #
+##########
+# Create new logger
+logger = logging.getLogger(__name__)
+
+#############
+# Constants #
+#############
+# Trial columns stored in the trials table (words are stored
+# separately and Subject/Condition live in the sessions table)
+TRIAL_COLUMNS = [
+    'trial',
+    'file',
+    'list_num',
+    'sentence_num',
+    'speaker',
+    'desired_level_dB',
+    'total_words',
+    'num_correct',
+    'playback_start',
+    'playback_stop',
+    'onset_latency_ms',
+    'timestamp'
+]
+
+# Row fields the store reads: the data file columns plus the
+# (position, word, correct) tuples of ScoreModel.score_words
+STORE_COLUMNS = DATA_COLUMNS + ['key_words']
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id INTEGER PRIMARY KEY,
+    subject TEXT NOT NULL,
+    condition TEXT NOT NULL,
+    started TEXT NOT NULL,
+    data_file TEXT
+);
+CREATE TABLE IF NOT EXISTS trials (
+    trial_id INTEGER PRIMARY KEY,
+    session_id INTEGER NOT NULL REFERENCES sessions(session_id),
+    trial INTEGER,
+    file TEXT,
+    list_num INTEGER,
+    sentence_num INTEGER,
+    speaker INTEGER,
+    desired_level_dB REAL,
+    total_words INTEGER,
+    num_correct INTEGER,
+    playback_start REAL,
+    playback_stop REAL,
+    onset_latency_ms REAL,
+    timestamp TEXT
+);
+CREATE TABLE IF NOT EXISTS words (
+    trial_id INTEGER NOT NULL REFERENCES trials(trial_id),
+    position INTEGER NOT NULL,
+    word TEXT NOT NULL,
+    correct INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_subject ON sessions(subject);
+CREATE INDEX IF NOT EXISTS idx_sessions_condition ON sessions(condition);
+CREATE INDEX IF NOT EXISTS idx_trials_session ON trials(session_id);
+CREATE INDEX IF NOT EXISTS idx_trials_list_num ON trials(list_num);
+CREATE INDEX IF NOT EXISTS idx_trials_timestamp ON trials(timestamp);
+CREATE INDEX IF NOT EXISTS idx_words_trial ON words(trial_id);
+"""
+
+#############
+# Functions #
+#############
+def connect(db_path):
+    """ Open a session database, creating the schema if needed. """
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    # Sync every commit, matching the fsync of the CSV writer
+    conn.execute("PRAGMA synchronous=FULL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def find_sessions(db_path, subject=None, condition=None):
+    """ Return the sessions of a subject and/or condition.
+
+    :return: One dict per session, oldest first
+    :rtype: list
+    """
+    query = "SELECT * FROM sessions WHERE 1=1"
+    params = []
+    if subject is not None:
+        query += " AND subject = ?"
+        params.append(subject)
+    if condition is not None:
+        query += " AND condition = ?"
+        params.append(condition)
+    query += " ORDER BY started"
+    conn = connect(db_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        return [dict(row) for row in conn.execute(query, params)]
+    finally:
+        conn.close()
+
+
+def export_csv(db_path, csv_path, subject=None, condition=None,
+               columns=DATA_COLUMNS):
+    """ Write trials to a CSV file in the layout of the per-session
+    data files, so existing analysis scripts can read them.
+
+    :param columns: Data file columns, in order
+    :type columns: list
+    :return: Number of trials written
+    :rtype: int
+    """
+    sessions = find_sessions(db_path, subject, condition)
+    conn = connect(db_path)
+    conn.row_factory = sqlite3.Row
+    count = 0
+    try:
+        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(
+                f, fieldnames=columns, extrasaction='ignore')
+            writer.writeheader()
+            for session in sessions:
+                trials = conn.execute(
+                    "SELECT * FROM trials WHERE session_id = ? "
+                    "ORDER BY trial_id", (session['session_id'],))
+                for trial in trials:
+                    row = dict(trial)
+                    row['Subject'] = session['subject']
+                    row['Condition'] = session['condition']
+                    words = conn.execute(
+                        "SELECT word, correct FROM words WHERE trial_id = ? "
+                        "ORDER BY position", (trial['trial_id'],)).fetchall()
+                    # Lists are written as in the CSV data files
+                    row['correct'] = [w for w, c in words if c]
+                    row['incorrect'] = [w for w, c in words if not c]
+                    writer.writerow(row)
+                    count += 1
+    finally:
+        conn.close()
+    logger.info("Exported %d trials to %s", count, csv_path)
+    return count
+
+################
+# SessionStore #
+################
+class SessionStore(SessionWriter):
+    """ SessionWriter backend that inserts into a SQLite database. """
+
+    def __init__(self, filepath, subject, condition, data_file=None,
+                 columns=STORE_COLUMNS, resume=False):
+        """ Open the database, add (or, when resuming, find) the
+        session row and start the writer thread.
+
+        :param filepath: Database file (shared by all sessions)
+        :type filepath: str or Path
+        :param subject: Subject identifier
+        :type subject: str
+        :param condition: Condition name
+        :type condition: str
+        :param data_file: Name the CSV data file would have had
+        :type data_file: str
+        :param columns: Row fields to store
+        :type columns: list
+        :param resume: Append to the latest session of data_file,
+            if there is one
+        :type resume: bool
+        :raises OSError: If the database cannot be opened
+        """
+        self.session = {
+            'subject': subject,
+            'condition': condition,
+            'started': datetime.datetime.now().isoformat(
+                timespec='seconds'),
+            'data_file': data_file
+        }
+        self.session_id = None
+        self.resume = resume
+        super().__init__(filepath, columns)
+
+    def _open(self):
+        """ Connect and insert or find the session row (writer
+        thread).
+        """
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            self._conn = connect(self.filepath)
+            if self.resume and self.session['data_file'] is not None:
+                found = self._conn.execute(
+                    "SELECT session_id FROM sessions WHERE data_file = ? "
+                    "ORDER BY session_id DESC LIMIT 1",
+                    (self.session['data_file'],)).fetchone()
+                if found is not None:
+                    self.session_id = found[0]
+                    logger.info("Resuming database session %d",
+                                self.session_id)
+                    return
+                logger.warning("No database session for %s; starting one",
+                               self.session['data_file'])
+            with self._conn:
+                cursor = self._conn.execute(
+                    "INSERT INTO sessions (subject, condition, started, "
+                    "data_file) VALUES (:subject, :condition, :started, "
+                    ":data_file)", self.session)
+            self.session_id = cursor.lastrowid
+        except sqlite3.Error as e:
+            raise OSError(f"Cannot open session database: {e}") from e
+
+    def _write_rows(self, rows):
+        """ Insert a batch of trials in one transaction (writer
+        thread).
+        """
+        trial_sql = (
+            f"INSERT INTO trials (session_id, {', '.join(TRIAL_COLUMNS)}) "
+            f"VALUES (?{', ?' * len(TRIAL_COLUMNS)})"
+        )
+        try:
+            with self._conn:
+                for row in rows:
+                    cursor = self._conn.execute(
+                        trial_sql,
+                        [self.session_id] + [row.get(c) for c in TRIAL_COLUMNS]
+                    )
+                    self._conn.executemany(
+                        "INSERT INTO words (trial_id, position, word, correct) "
+                        "VALUES (?, ?, ?, ?)",
+                        [(cursor.lastrowid, ii, w, int(c))
+                         for ii, w, c in row.get('key_words', [])]
+                    )
+        except sqlite3.Error as e:
+            raise OSError(f"Cannot write to session database: {e}") from e
+
+    def _close_file(self):
+        """ Close the connection (writer thread). """
+        self._conn.close()
+
+    def write(self, row):
+        """ Queue one trial row, stamped with the current time. """
+        row = dict(row)
+        row.setdefault(
+            'timestamp',
+            datetime.datetime.now().isoformat(timespec='milliseconds')
+        )
+        super().write(row)
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(
+        description="Export sessions from the database to CSV.")
+    parser.add_argument('database', help="Session database file")
+    parser.add_argument('csv_file', help="Output CSV file")
+    parser.add_argument('--subject', help="Only export this subject")
+    parser.add_argument('--condition', help="Only export this condition")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    export_csv(
+        args.database,
+        args.csv_file,
+        subject=args.subject,
+        condition=args.condition
+    )
@@ -0,0 +1,222 @@
+""" Append-only session data writer for Speech Tasker.
+
+    The data file is opened once per session and kept open. Rows
+    are queued by the Tk thread and written by a background thread,
+    so the Next button never waits on the disk (or a network share).
+    Each row is flushed and fsynced before the next one is written,
+    so a crash loses at most the rows still in the queue.
+
+    Write errors are raised in the writer thread; they are kept in
+    ``error`` and re-raised by the next call to ``write`` or
+    ``close``, so the Tk thread can report them.
+
+    Created: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import csv
+import logging
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+
+##########
+# Logger #
+##########
+# Create new logger
+logger = logging.getLogger(__name__)
+
+#############
+# Constants #
+#############
+# Columns of the trial data file, in order
+DATA_COLUMNS = [
+    'trial',
+    'Subject',
+    'Condition',
+    'file',
+    'list_num',
+    'sentence_num',
+    'speaker',
+    'desired_level_dB',
+    'correct',
+    'incorrect',
+    'total_words',
+    'num_correct',
+    'playback_start',
+    'playback_stop',
+    'onset_latency_ms'
+]
+
+#################
+# SessionWriter #
+#################
+class SessionWriter:
+    """ Background writer for one session's trial data.
+
+    Subclasses implement ``_open``, ``_write_rows`` and
+    ``_close_file``; they are only ever called from the writer
+    thread.
+    """
+
+    def __init__(self, filepath, columns=DATA_COLUMNS):
+        """ Open the data file and start the writer thread.
+
+        :param filepath: Output file
+        :type filepath: str or Path
+        :param columns: Column order, fixed for the whole session
+        :type columns: list
+        :raises OSError: If the file cannot be opened
+        :raises Exception: Any other error raised by ``_open``
+        """
+        logger.info("Initializing %s: %s", type(self).__name__, filepath)
+        self.filepath = Path(filepath)
+        self.columns = list(columns)
+        self.error = None
+
+        # Counters
+        self.rows = 0
+        self.batches = 0
+        self.write_time = 0.0
+        self.max_batch_time = 0.0
+
+        self._queue = queue.SimpleQueue()
+        # Open on the writer thread, but report failures here
+        opened = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(opened,),
+            name='session-writer',
+            daemon=True
+        )
+        self._thread.start()
+        opened.wait()
+        if self.error is not None:
+            self._thread.join()
+            raise self.error
+
+    def _run(self, opened):
+        """ Writer thread: write queued rows until a None row. """
+        try:
+            self._open()
+        except Exception as e:
+            # Not only OSError: __init__ must never wait forever
+            self.error = e
+            return
+        finally:
+            opened.set()
+
+        done = False
+        while not done:
+            # Write everything that queued up behind the first row
+            rows = [self._queue.get()]
+            while True:
+                try:
+                    rows.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in rows:
+                rows = rows[:rows.index(None)]
+                done = True
+            if rows and self.error is None:
+                start = time.perf_counter()
+                try:
+                    self._write_rows(rows)
+                except OSError as e:
+                    logger.exception("Cannot write session data")
+                    self.error = e
+                    continue
+                elapsed = time.perf_counter() - start
+                self.rows += len(rows)
+                self.batches += 1
+                self.write_time += elapsed
+                self.max_batch_time = max(self.max_batch_time, elapsed)
+
+        try:
+            self._close_file()
+        except OSError as e:
+            logger.exception("Cannot close session data")
+            self.error = self.error or e
+
+    def _open(self):
+        """ Open the output file (writer thread). """
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        new_file = (not self.filepath.exists()
+            or self.filepath.stat().st_size == 0)
+        self._file = open(self.filepath, 'a', newline='', encoding='utf-8')
+        self._csv = csv.DictWriter(
+            self._file, fieldnames=self.columns, extrasaction='ignore')
+        if new_file:
+            self._csv.writeheader()
+            self._sync()
+
+    def _write_rows(self, rows):
+        """ Append rows, syncing each one to disk (writer thread). """
+        for row in rows:
+            self._csv.writerow(row)
+            self._sync()
+
+    def _sync(self):
+        """ Flush Python and OS buffers to disk. """
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _close_file(self):
+        """ Close the output file (writer thread). """
+        self._file.close()
+
+    def _check(self):
+        """ Re-raise a failure from the writer thread. """
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+    def write(self, row):
+        """ Queue one trial row. Values must already be plain Python
+        objects (not Tk variables), as they are read on another
+        thread.
+
+        :param row: Column name -> value (extra keys are ignored)
+        :type row: dict
+        :raises OSError: If an earlier row could not be written
+        """
+        self._check()
+        self._queue.put(dict(row))
+
+    def close(self):
+        """ Write the remaining rows and close the file.
+
+        :raises OSError: If any row could not be written
+        """
+        logger.info("Closing session writer: %s", self.stats)
+        self._queue.put(None)
+        self._thread.join()
+        self._check()
+
+    @property
+    def queue_depth(self):
+        """ Number of rows waiting to be written. """
+        return self._queue.qsize()
+
+    @property
+    def stats(self):
+        """ Return a dictionary of writer counters. """
+        mean = self.write_time / self.rows if self.rows else 0.0
+        return {
+            'rows': self.rows,
+            'batches': self.batches,
+            'queue_depth': self.queue_depth,
+            'mean_row_ms': round(mean * 1000, 3),
+            'max_batch_ms': round(self.max_batch_time * 1000, 3)
+        }
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
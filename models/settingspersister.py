@@ -0,0 +1,115 @@
+""" Dirty-tracking, debounced persistence of the runtime settings.
+
+    Every Tk variable in the settings dict is traced. A save request
+    only schedules a single write after a short delay; further
+    requests within the delay are coalesced into it. When the write
+    happens, only variables whose value differs from the last saved
+    value are passed to the settings model, and the file is written
+    once. Checkpoints (dialog submits, calibration, session start
+    and end) call ``flush`` to write immediately.
+
+    Created: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import logging
+import tkinter as tk
+
+##########
+# Logger #
+##########
+# Create new logger
+logger = logging.getLogger(__name__)
+
+#####################
+# SettingsPersister #
+#####################
+class SettingsPersister:
+    """ Coalesce settings saves into one write per change burst. """
+
+    def __init__(self, root, settings, settings_model, delay_ms=1000):
+        """ Start tracking the settings variables.
+
+        :param root: Tk widget used to schedule delayed writes
+        :type root: tk.Misc
+        :param settings: Runtime settings (key -> Tk variable)
+        :type settings: dict
+        :param settings_model: Model with set(key, value) and save()
+        :type settings_model: tkgui.models.SettingsModel
+        :param delay_ms: Debounce delay for save requests
+        :type delay_ms: int
+        """
+        logger.info("Initializing SettingsPersister")
+        self.root = root
+        self.settings = settings
+        self.settings_model = settings_model
+        self.delay_ms = int(delay_ms)
+        self._saved = {key: var.get() for key, var in settings.items()}
+        self._touched = set()
+        self._after_id = None
+
+        # Counters
+        self.writes = 0
+        self.avoided = 0
+
+        for key, var in settings.items():
+            var.trace_add('write', lambda *_, key=key: self._touched.add(key))
+
+    def _dirty(self):
+        """ Return {key: value} for variables changed since the last
+        write. Reading a variable that holds an invalid entry (e.g.,
+        an empty IntVar) raises TclError; such keys stay touched.
+        """
+        dirty = {}
+        for key in list(self._touched):
+            try:
+                value = self.settings[key].get()
+            except tk.TclError:
+                continue
+            self._touched.discard(key)
+            if value != self._saved.get(key):
+                dirty[key] = value
+        return dirty
+
+    def request_save(self):
+        """ Schedule a write after the debounce delay. Requests
+        while a write is pending are coalesced into it.
+        """
+        if self._after_id is not None or not self._touched:
+            self.avoided += 1
+            return
+        self._after_id = self.root.after(self.delay_ms, self.flush)
+
+    def flush(self):
+        """ Write all changed settings now, in a single save. """
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        dirty = self._dirty()
+        if not dirty:
+            self.avoided += 1
+            return
+        for key, value in dirty.items():
+            self.settings_model.set(key, value)
+        self.settings_model.save()
+        self._saved.update(dirty)
+        self.writes += 1
+        logger.info("Saved %d changed settings: %s", len(dirty), self.stats)
+
+    @property
+    def stats(self):
+        """ Return a dictionary of write counters. """
+        return {
+            'writes': self.writes,
+            'avoided': self.avoided,
+            'pending': self._after_id is not None
+        }
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,332 @@
+""" Constrained, reproducible trial shuffling for Speech Tasker.
+
+    Constraints are declared, not coded into the shuffle:
+        MaxRun('speaker', 2)         no speaker more than 2x in a row
+        MaxRun('list_num', 1)        no list back-to-back
+        BalancedBlocks('level', 8)   every block of 8 trials has the
+                                     levels in (near) equal proportion
+
+    or as text (e.g., from settings), separated by semicolons:
+        "max_run speaker 2; no_repeat list_num; balance level 8"
+
+    The order is built in near-linear time instead of by rejection
+    sampling whole permutations:
+        1. Balancing: each block gets a quota per value, from the
+           value's trials spread evenly over the matrix (stratified
+           positions).
+        2. Runs: trials are placed one at a time, drawn at random
+           among all remaining trials whose value still has quota
+           in the current block and that keep every run limit. A
+           value is forced when placing anything else would leave
+           too few other trials to separate its remaining runs.
+    A block that dead-ends (rare, when constraints interact) is
+    redrawn from its start with the same generator, so a seed always
+    gives the same order.
+
+    Created: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import logging
+import random
+import secrets
+
+# Third party
+import numpy as np
+import pandas as pd
+
+##########
+# Logger #
+##########
+# Create new logger
+logger = logging.getLogger(__name__)
+
+#############
+# Constants #
+#############
+# Random draws before scanning a block for a valid trial
+DRAWS = 16
+# Attempts per block before the constraints are reported as
+# unsatisfiable
+ATTEMPTS = 50
+
+###############
+# Constraints #
+###############
+class MaxRun:
+    """ No more than ``limit`` consecutive trials share a value. """
+
+    def __init__(self, column, limit):
+        if int(limit) < 1:
+            raise ValueError(f"Run limit for '{column}' must be at least 1.")
+        self.column = column
+        self.limit = int(limit)
+
+    def __repr__(self):
+        return f"max_run {self.column} {self.limit}"
+
+
+class BalancedBlocks:
+    """ Each block of ``block_size`` consecutive trials contains the
+    values of a column in (within one trial) equal proportion.
+    """
+
+    def __init__(self, column, block_size):
+        if int(block_size) < 1:
+            raise ValueError(f"Block size for '{column}' must be at least 1.")
+        self.column = column
+        self.block_size = int(block_size)
+
+    def __repr__(self):
+        return f"balance {self.column} {self.block_size}"
+
+
+def parse_constraints(text):
+    """ Return the constraints described by a string.
+
+    :param text: Semicolon-separated constraints: 'max_run <column>
+        <n>', 'no_repeat <column>' or 'balance <column> <block size>'
+    :type text: str
+    :rtype: list
+    :raises ValueError: If a constraint cannot be parsed
+    """
+    constraints = []
+    for item in (text or '').split(';'):
+        tokens = item.split()
+        if not tokens:
+            continue
+        try:
+            if tokens[0] == 'max_run' and len(tokens) == 3:
+                constraints.append(MaxRun(tokens[1], int(tokens[2])))
+                continue
+            if tokens[0] == 'no_repeat' and len(tokens) == 2:
+                constraints.append(MaxRun(tokens[1], 1))
+                continue
+            if tokens[0] == 'balance' and len(tokens) == 3:
+                constraints.append(BalancedBlocks(tokens[1], int(tokens[2])))
+                continue
+        except ValueError:
+            pass
+        raise ValueError(f"Invalid constraint: '{item.strip()}'")
+    return constraints
+
+#############
+# Functions #
+#############
+def new_seed():
+    """ Return a fresh seed to record with a shuffled matrix. """
+    return secrets.randbelow(2**31)
+
+
+def _quotas(n, codes, block_size, rng):
+    """ Return the trials per balanced value in each block, shape
+    (blocks, values). Each value's trials are spread evenly over the
+    matrix, so every block holds it in proportion (within one).
+    """
+    counts = np.bincount(codes)
+    values = np.repeat(np.arange(counts.size), counts)
+    rank = np.arange(n) - np.repeat(np.cumsum(counts) - counts, counts)
+    # Ties between values are broken at random
+    position = (rank + 0.5) / counts[values] + rng.random(n) * 1e-9
+    slots = values[np.argsort(position, kind='stable')]
+    quotas = np.zeros((-(-n // block_size), counts.size), dtype=np.int64)
+    np.add.at(quotas, (np.arange(n) // block_size, slots), 1)
+    return quotas
+
+
+def _fill(balance, quotas, runs, rnd):
+    """ Return the trial order, or None if a block dead-ends on
+    every attempt.
+
+    :param balance: Balanced value of each trial
+    :param quotas: Trials per balanced value in each block
+    :param runs: (codes, limit) per MaxRun constraint
+    """
+    checks = range(len(runs))
+    values = [codes.tolist() for codes, _ in runs]
+    limits = [limit for _, limit in runs]
+    counts = [np.bincount(codes).tolist() for codes, _ in runs]
+    # Largest remaining count per constraint (an upper bound, as
+    # counts only fall), so the max is only rescanned near the end
+    upper = [max(cnt) for cnt in counts]
+    pools = [np.flatnonzero(balance == v).tolist()
+             for v in range(quotas.shape[1])]
+    size = len(balance)
+    order = []
+    last = [-1] * len(runs)
+    length = [0] * len(runs)
+
+    def valid(item, forced):
+        for ci in checks:
+            value = values[ci][item]
+            if forced[ci] >= 0 and value != forced[ci]:
+                return False
+            if value == last[ci] and length[ci] >= limits[ci]:
+                return False
+        return True
+
+    for quota in quotas.tolist():
+        start = (len(order), list(last), list(length))
+        for _ in range(ATTEMPTS):
+            left = list(quota)
+            slots = sum(left)
+            while slots:
+                # Values that must be placed now to stay feasible
+                forced = [-1] * len(runs)
+                for ci in checks:
+                    if upper[ci] * (limits[ci] + 1) <= limits[ci] * size:
+                        continue
+                    cnt = counts[ci]
+                    top = max(range(len(cnt)), key=cnt.__getitem__)
+                    upper[ci] = cnt[top]
+                    if cnt[top] > limits[ci] * (size - cnt[top]):
+                        forced[ci] = top
+
+                pick = None
+                for _ in range(DRAWS):
+                    # Balanced value in proportion to its quota left
+                    r = rnd.randrange(slots)
+                    v = 0
+                    while r >= left[v]:
+                        r -= left[v]
+                        v += 1
+                    jj = rnd.randrange(len(pools[v]))
+                    if valid(pools[v][jj], forced):
+                        pick = (v, jj)
+                        break
+                else:
+                    for v in range(len(left)):
+                        if not left[v]:
+                            continue
+                        offset = rnd.randrange(len(pools[v]))
+                        for kk in range(len(pools[v])):
+                            jj = (offset + kk) % len(pools[v])
+                            if valid(pools[v][jj], forced):
+                                pick = (v, jj)
+                                break
+                        if pick is not None:
+                            break
+                if pick is None:
+                    break
+
+                v, jj = pick
+                pool = pools[v]
+                item = pool[jj]
+                pool[jj] = pool[-1]
+                pool.pop()
+                left[v] -= 1
+                slots -= 1
+                size -= 1
+                order.append(item)
+                for ci in checks:
+                    value = values[ci][item]
+                    counts[ci][value] -= 1
+                    length[ci] = length[ci] + 1 if value == last[ci] else 1
+                    last[ci] = value
+            if not slots:
+                break
+            # Dead end: put the block's trials back and redraw it
+            for item in order[start[0]:]:
+                pools[balance[item]].append(item)
+                for ci in checks:
+                    counts[ci][values[ci][item]] += 1
+                size += 1
+            del order[start[0]:]
+            last, length = list(start[1]), list(start[2])
+            upper = [max(cnt) for cnt in counts]
+        else:
+            return None
+    return order
+
+
+def constrained_order(n, columns, constraints=(), seed=None):
+    """ Return a random order of n trials that satisfies the
+    constraints.
+
+    :param n: Number of trials
+    :type n: int
+    :param columns: Values of each constrained column, per trial
+    :type columns: dict
+    :param constraints: MaxRun and BalancedBlocks constraints
+    :type constraints: list
+    :param seed: Seed for the order (a fresh one if None)
+    :type seed: int
+    :return: (order, seed)
+    :rtype: tuple(np.ndarray, int)
+    :raises ValueError: If a column is missing, or the constraints
+        cannot be satisfied
+    """
+    seed = new_seed() if seed is None else int(seed)
+    rng = np.random.default_rng(seed)
+    rnd = random.Random(seed)
+
+    def codes_of(column):
+        if column not in columns:
+            raise ValueError(f"Cannot constrain unknown column '{column}'.")
+        return pd.factorize(np.asarray(columns[column]))[0]
+
+    balance = [c for c in constraints if isinstance(c, BalancedBlocks)]
+    if len(balance) > 1:
+        raise ValueError("Only one column can be balanced across blocks.")
+    runs = []
+    for constraint in constraints:
+        if isinstance(constraint, MaxRun):
+            codes = codes_of(constraint.column)
+            top = np.bincount(codes).max() if n else 0
+            if top > constraint.limit * (n - top + 1):
+                raise ValueError(
+                    f"Too many trials share one '{constraint.column}' value "
+                    f"for a run limit of {constraint.limit}.")
+            runs.append((codes, constraint.limit))
+
+    if n == 0 or (not runs and not balance):
+        return rng.permutation(n), seed
+
+    if balance:
+        codes = codes_of(balance[0].column)
+        quotas = _quotas(n, codes, balance[0].block_size, rng)
+    else:
+        codes = np.zeros(n, dtype=np.int64)
+        quotas = np.array([[n]])
+    if not runs:
+        # Balance only: each block is a random draw of its quotas
+        slots = np.repeat(np.tile(np.arange(quotas.shape[1]), len(quotas)),
+                          quotas.ravel())
+        order = np.empty(n, dtype=np.int64)
+        for v in range(quotas.shape[1]):
+            order[slots == v] = rng.permutation(np.flatnonzero(codes == v))
+        for ii in range(0, n, balance[0].block_size):
+            rng.shuffle(order[ii:ii + balance[0].block_size])
+        return order, seed
+
+    order = _fill(codes, quotas, runs, rnd)
+    if order is None:
+        raise ValueError(
+            f"No order satisfies the constraints {list(constraints)}.")
+    return np.asarray(order, dtype=np.int64), seed
+
+
+def shuffle_frame(frame, constraints=(), seed=None):
+    """ Return the trials in a constrained random order, with the
+    seed recorded in a 'seed' column.
+
+    :param frame: Trials
+    :type frame: pd.DataFrame
+    :rtype: pd.DataFrame
+    """
+    columns = {c.column: frame[c.column].to_numpy()
+               for c in constraints if c.column in frame}
+    order, seed = constrained_order(len(frame), columns, constraints, seed)
+    shuffled = frame.take(order).reset_index(drop=True)
+    shuffled['seed'] = seed
+    logger.info("Shuffled %d trials (seed %d)", len(shuffled), seed)
+    return shuffled
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,77 @@
+""" Startup phase timings for Speech Tasker.
+
+    The controller marks the end of each startup phase (imports,
+    settings, views, menus, ...). The timings are always logged as
+    one line; with --profile-startup they are also printed as a
+    table when the main window is shown.
+
+    Created: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import logging
+import time
+
+##########
+# Logger #
+##########
+# Create new logger
+logger = logging.getLogger(__name__)
+
+##################
+# StartupProfile #
+##################
+class StartupProfile:
+    """ Wall-clock duration of consecutive startup phases. """
+
+    def __init__(self, start=None):
+        """ Start timing.
+
+        :param start: time.perf_counter() value the first phase
+            started at (now if None)
+        :type start: float
+        """
+        self.start = time.perf_counter() if start is None else start
+        self.phases = []
+        self._last = self.start
+
+    def mark(self, phase, at=None):
+        """ End the current phase and start the next one.
+
+        :param phase: Name of the phase that just ended
+        :type phase: str
+        :param at: time.perf_counter() value the phase ended at
+            (now if None)
+        :type at: float
+        """
+        now = time.perf_counter() if at is None else at
+        self.phases.append((phase, now - self._last))
+        self._last = now
+
+    @property
+    def total(self):
+        """ Seconds from the start to the last mark. """
+        return self._last - self.start
+
+    def report(self):
+        """ Return the phases as a printable table. """
+        width = max([len(phase) for phase, _ in self.phases] + [5])
+        lines = [f"{'phase':<{width}}  {'ms':>8}"]
+        for phase, seconds in self.phases:
+            lines.append(f"{phase:<{width}}  {seconds * 1000:8.1f}")
+        lines.append(f"{'total':<{width}}  {self.total * 1000:8.1f}")
+        return "\n".join(lines)
+
+    def log(self):
+        """ Log the phases on one line. """
+        logger.info("Startup %.0f ms: %s", self.total * 1000, ", ".join(
+            f"{phase} {seconds * 1000:.0f}" for phase, seconds in self.phases))
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,193 @@
+""" Packed stimulus bundles for Speech Tasker.
+
+    A bundle stores a whole stimulus directory in one file, so a
+    session opens a single file instead of thousands of small WAVs.
+
+    Layout (little endian):
+        magic (8 bytes) | padding to 64 bytes
+        float32 sample blob (interleaved, one stimulus after another)
+        JSON index | index length (uint64) | magic (8 bytes)
+
+    The index maps each file name (relative to the packed directory,
+    with forward slashes) to its offset and length in the blob, its
+    sampling rate, channel count and RMS. At runtime the blob is
+    memory-mapped and each stimulus is returned as a zero-copy,
+    read-only slice.
+
+    Pack a directory from the command line with:
+        python -m models.stimulusbundle <stimulus_dir> <bundle_file>
+
+    Created: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import json
+import logging
+import struct
+from pathlib import Path
+
+# Third party
+import numpy as np
+import soundfile as sf
+
+##########
+# Logger #
+##########
+# Create new logger
+logger = logging.getLogger(__name__)
+
+#############
+# Constants #
+#############
+MAGIC = b'STBNDL01'
+BLOB_OFFSET = 64
+BUNDLE_SUFFIX = '.stb'
+AUDIO_SUFFIXES = ('.wav', '.flac', '.aiff', '.aif', '.ogg')
+
+#############
+# Functions #
+#############
+def is_bundle(path):
+    """ Return True if path is a stimulus bundle file. """
+    path = Path(path)
+    if not path.is_file():
+        return False
+    with open(path, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def _normalize_name(name):
+    """ Return a bundle lookup key for a matrix file name. """
+    return str(name).replace('\\', '/')
+
+
+def pack_directory(directory, bundle_path):
+    """ Pack every audio file below a directory into a bundle.
+
+    Files are streamed into the bundle one at a time, so packing
+    does not need to hold the whole stimulus set in memory.
+
+    :param directory: Stimulus directory
+    :type directory: str or Path
+    :param bundle_path: Output bundle file
+    :type bundle_path: str or Path
+    :return: The bundle index
+    :rtype: dict
+    """
+    directory = Path(directory)
+    files = sorted(
+        p for p in directory.rglob('*')
+        if p.suffix.lower() in AUDIO_SUFFIXES
+    )
+    logger.info("Packing %d files from %s", len(files), directory)
+
+    index = {}
+    offset = 0
+    with open(bundle_path, 'wb') as f:
+        f.write(MAGIC.ljust(BLOB_OFFSET, b'\0'))
+        for path in files:
+            audio, fs = sf.read(path, dtype='float32', always_2d=True)
+            name = path.relative_to(directory).as_posix()
+            index[name] = {
+                'offset': offset,
+                'frames': audio.shape[0],
+                'sr': fs,
+                'channels': audio.shape[1],
+                'rms': float(np.sqrt(np.mean(np.square(audio, dtype=np.float64)))),
+                'peak': float(np.max(np.abs(audio)))
+            }
+            f.write(np.ascontiguousarray(audio).tobytes())
+            offset += audio.size
+        payload = json.dumps({'version': 1, 'files': index}).encode('utf-8')
+        f.write(payload)
+        f.write(struct.pack('<Q', len(payload)))
+        f.write(MAGIC)
+    logger.info("Wrote bundle %s (%d samples)", bundle_path, offset)
+    return index
+
+##################
+# StimulusBundle #
+##################
+class StimulusBundle:
+    """ Memory-mapped reader for a packed stimulus bundle. """
+
+    def __init__(self, path):
+        """ Open a bundle and read its index.
+
+        :param path: Bundle file
+        :type path: str or Path
+        :raises ValueError: If the file is not a stimulus bundle
+        """
+        logger.info("Opening StimulusBundle %s", path)
+        self.path = Path(path)
+        size = self.path.stat().st_size
+        with open(self.path, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{self.path} is not a stimulus bundle")
+            f.seek(size - len(MAGIC) - 8)
+            (index_len,) = struct.unpack('<Q', f.read(8))
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{self.path} is truncated")
+            index_start = size - len(MAGIC) - 8 - index_len
+            f.seek(index_start)
+            self.index = json.loads(f.read(index_len))['files']
+        n_samples = (index_start - BLOB_OFFSET) // 4
+        self._blob = np.memmap(
+            self.path,
+            dtype='<f4',
+            mode='r',
+            offset=BLOB_OFFSET,
+            shape=(n_samples,)
+        )
+
+    def __contains__(self, name):
+        return _normalize_name(name) in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    @property
+    def names(self):
+        """ Return the names of all stimuli in the bundle. """
+        return list(self.index)
+
+    def info(self, name):
+        """ Return the index entry for a stimulus.
+
+        :raises FileNotFoundError: If the name is not in the bundle
+        """
+        try:
+            return self.index[_normalize_name(name)]
+        except KeyError:
+            raise FileNotFoundError(
+                f"'{name}' is not in bundle {self.path.name}") from None
+
+    def get(self, name):
+        """ Return (samples, sampling rate) for a stimulus. Samples
+        are a read-only view into the memory-mapped blob; mono
+        stimuli are returned as 1-D arrays.
+        """
+        entry = self.info(name)
+        start = entry['offset']
+        stop = start + entry['frames'] * entry['channels']
+        audio = self._blob[start:stop].reshape(
+            entry['frames'], entry['channels'])
+        if entry['channels'] == 1:
+            audio = audio[:, 0]
+        return audio, entry['sr']
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(
+        description="Pack a stimulus directory into a bundle.")
+    parser.add_argument('directory', help="Stimulus directory")
+    parser.add_argument('bundle', help="Output bundle file (*.stb)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    pack_directory(args.directory, args.bundle)
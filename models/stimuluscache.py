@@ -0,0 +1,125 @@
+""" In-memory stimulus cache for Speech Tasker.
+
+    Decoded audio is kept in memory so that repeated presentations
+    of a stimulus (e.g., the Repeat button) do not touch the disk.
+    Entries are keyed by the resolved file path and its modification
+    time, and evicted in least-recently-used order once the memory
+    budget is exceeded.
+
+    Created: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+# Third party
+import soundfile as sf
+
+##########
+# Logger #
+##########
+# Create new logger
+logger = logging.getLogger(__name__)
+
+#################
+# StimulusCache #
+#################
+class StimulusCache:
+    """ Byte-budget LRU cache of decoded audio files. """
+
+    def __init__(self, max_bytes=256 * 1024**2):
+        """ Create an empty cache.
+
+        :param max_bytes: Memory budget for cached samples, in bytes
+        :type max_bytes: int
+        """
+        logger.info("Initializing StimulusCache")
+        self.max_bytes = int(max_bytes)
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _make_key(path):
+        """ Return the (resolved path, mtime) cache key for a file. """
+        path = Path(path).resolve()
+        # Raises FileNotFoundError for missing files
+        mtime = path.stat().st_mtime_ns
+        return (str(path), mtime)
+
+    def get(self, path):
+        """ Return (samples, sampling rate) for an audio file.
+
+        Samples are returned as a read-only float32 array. Decoding
+        only happens on a cache miss.
+
+        :param path: Path to the audio file
+        :type path: str or Path
+        :return: Decoded samples and sampling rate
+        :rtype: tuple(np.ndarray, int)
+        """
+        key = self._make_key(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        # Decode outside of the lock so other threads are not blocked
+        audio, fs = sf.read(key[0], dtype='float32')
+        audio.flags.writeable = False
+        entry = (audio, fs)
+
+        with self._lock:
+            self.misses += 1
+            if key not in self._entries:
+                self._entries[key] = entry
+                self.nbytes += audio.nbytes
+                self._evict()
+        return entry
+
+    def _evict(self):
+        """ Drop least-recently-used entries until within budget.
+        The most recent entry is always kept, even if it alone
+        exceeds the budget.
+        """
+        while self.nbytes > self.max_bytes and len(self._entries) > 1:
+            _, (audio, _) = self._entries.popitem(last=False)
+            self.nbytes -= audio.nbytes
+            self.evictions += 1
+
+    def clear(self):
+        """ Remove all entries. Counters are left untouched. """
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    @property
+    def stats(self):
+        """ Return a dictionary of cache counters. """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'nbytes': self.nbytes
+        }
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
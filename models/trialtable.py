@@ -0,0 +1,142 @@
+""" Array-backed trial table for Speech Tasker.
+
+    Replaces the pandas-backed TrialHandler in the trial loop. The
+    matrix DataFrame is converted once into columns of small integer
+    codes plus a list of each column's distinct values (file names
+    and sentences repeat across presentations, levels and speakers
+    take a handful of values). Columns with mostly distinct numeric
+    values are kept as plain NumPy arrays.
+
+    The cursor has the TrialHandler interface (next(), trial_num,
+    trial_info), but next() only moves an integer, and trial_info is
+    a single reusable view, so reading a field is one code lookup
+    with no Series or dict built per trial.
+
+    Created: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import logging
+from collections.abc import Mapping
+
+# Third party
+import numpy as np
+import pandas as pd
+
+##########
+# Logger #
+##########
+# Create new logger
+logger = logging.getLogger(__name__)
+
+############
+# TrialRow #
+############
+class TrialRow(Mapping):
+    """ Read-only view of the table's current trial. """
+
+    __slots__ = ('_table',)
+
+    def __init__(self, table):
+        self._table = table
+
+    def __getitem__(self, column):
+        if self._table.row < 0:
+            raise IndexError("No current trial; call next() first.")
+        return self._table.value(column, self._table.row)
+
+    def __contains__(self, column):
+        return column in self._table.columns
+
+    def __iter__(self):
+        return iter(self._table.columns)
+
+    def __len__(self):
+        return len(self._table.columns)
+
+    def __repr__(self):
+        return f"TrialRow({dict(self)})"
+
+##############
+# TrialTable #
+##############
+class TrialTable:
+    """ Columnar trial matrix with a TrialHandler-style cursor. """
+
+    def __init__(self, trials_df):
+        """ Encode a trial matrix.
+
+        :param trials_df: Trials, one row per presentation
+        :type trials_df: pd.DataFrame
+        """
+        self.columns = list(trials_df.columns)
+        self._codes = {}
+        self._values = {}
+        self._raw = {}
+        self._n = len(trials_df)
+        for column in trials_df.columns:
+            series = trials_df[column]
+            codes, uniques = pd.factorize(series, use_na_sentinel=False)
+            numeric = pd.api.types.is_numeric_dtype(series)
+            if numeric and len(uniques) > self._n // 2:
+                self._raw[column] = series.to_numpy()
+            else:
+                # Smallest unsigned type that holds every code
+                dtype = np.min_scalar_type(max(len(uniques) - 1, 0))
+                self._codes[column] = codes.astype(dtype)
+                self._values[column] = uniques.tolist()
+        # Row of the current trial (-1 before the first next())
+        self.row = -1
+        self.trial_info = TrialRow(self)
+        logger.info("Trial table: %d trials, %.1f kB (DataFrame %.1f kB)",
+                    self._n, self.nbytes / 1024,
+                    trials_df.memory_usage(deep=True).sum() / 1024)
+
+    def __len__(self):
+        return self._n
+
+    @property
+    def trial_num(self):
+        """ 1-based number of the current trial (0 before start). """
+        return self.row + 1
+
+    def next(self):
+        """ Advance to the next trial.
+
+        :raises IndexError: After the last trial
+        """
+        if self.row + 1 >= self._n:
+            raise IndexError("No trials left.")
+        self.row += 1
+
+    def value(self, column, row):
+        """ Return one field of any row.
+
+        :param column: Column name
+        :type column: str
+        :param row: 0-based row index
+        :type row: int
+        :raises KeyError: For an unknown column
+        """
+        codes = self._codes.get(column)
+        if codes is not None:
+            return self._values[column][codes[row]]
+        return self._raw[column][row].item()
+
+    @property
+    def nbytes(self):
+        """ Approximate memory used by the table. """
+        total = sum(c.nbytes for c in self._codes.values())
+        total += sum(a.nbytes for a in self._raw.values())
+        for values in self._values.values():
+            total += sum(len(v) if isinstance(v, str) else 8 for v in values)
+        return total
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
@@ -5,9 +5,13 @@ fields = {
     # Session variables
     'Subject': {'type': 'str', 'value': '999'},
     'Condition': {'type': 'str', 'value': "test"},
+    'data_backend': {'type': 'str', 'value': 'csv'},
+    'database_path': {'type': 'str', 'value': ''},
     
     # Stimulus variables
     'Randomize': {'type': 'int', 'value': 0},
+    'Seed': {'type': 'str', 'value': ''},
+    'Constraints': {'type': 'str', 'value': ''},
     'Presentations': {'type': 'int', 'value': 1},
     'Sentence Lists': {'type': 'str', 'value': '1, 2'},
     'Sentences per List': {'type': 'int', 'value': 5},
@@ -15,10 +19,18 @@ fields = {
     'matrix_file_path': {'type': 'str', 'value': "Please select a path"},
     'sentence_file_path': {'type': 'str', 'value': 'Please select a file'},
     'write_matrix': {'type': 'int', 'value': 0},
+    'stimulus_cache_mb': {'type': 'int', 'value': 256},
+    'prefetch_depth': {'type': 'int', 'value': 3},
+    'cache_dir': {'type': 'str', 'value': ''},
+    'matrix_cache_mb': {'type': 'int', 'value': 64},
+    'settings_save_ms': {'type': 'int', 'value': 1000},
 
     # Presentation variables
     'Sentence Levels': {'type': 'str', 'value': '70, 75'},
     'Noise Level': {'type': 'float', 'value': 65},
+    'Noise Speakers': {'type': 'str', 'value': '1'},
+    'Present Noise': {'type': 'int', 'value': 0},
+    'masker_file_path': {'type': 'str', 'value': 'Please select a file'},
     'Sentence Speakers': {'type': 'str', 'value': '1, 2, 3'},
     
     # Internal level variables
@@ -28,6 +40,8 @@ fields = {
     # Audio device variables
     'audio_device': {'type': 'int', 'value': 999},
     'channel_routing': {'type': 'str', 'value': '1'},
+    'output_blocksize': {'type': 'int', 'value': 256},
+    'output_samplerate': {'type': 'int', 'value': 0},
 
     # Calibration variables
     'cal_file': {'type': 'str', 'value': 'cal_stim.wav'},
@@ -39,3 +53,11 @@ fields = {
     'check_for_updates': {'type': 'str', 'value': 'yes'},
     'version_lib_path': {'type': 'str', 'value': r'\\starfile\Public\Temp\MooreT\Personal Files\admin\versions.xlsx'},
 }
+
+# Per-module log levels (logger name -> level), applied on startup.
+# Raise a module to 'WARNING' to drop its per-trial INFO records.
+log_levels = {
+    'models.scoremodel': 'INFO',
+    'models.renderpipeline': 'INFO',
+    'models.sessionwriter': 'INFO',
+}
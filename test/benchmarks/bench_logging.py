@@ -0,0 +1,107 @@
+""" Benchmark of per-trial logging overhead on the calling thread.
+
+    Emits the log records of one simulated trial (about as many as
+    the controller, ScoreModel and views write per sentence) through
+    a file handler, first synchronously and then through the queue
+    listener from models.logqueue. A slow handler (fixed delay per
+    record) stands in for a busy network share or AV scanner.
+
+    Run from the repository root:
+        python -m test.benchmarks.bench_logging
+
+    Last edited: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import argparse
+import logging
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Custom
+sys.path.append(".")
+from models import logqueue
+
+#############
+# Constants #
+#############
+RECORDS_PER_TRIAL = 40
+
+#############
+# Functions #
+#############
+class SlowFileHandler(logging.FileHandler):
+    """ File handler with a fixed delay per record. """
+    def __init__(self, filename, delay_s):
+        super().__init__(filename)
+        self.delay_s = delay_s
+
+    def emit(self, record):
+        time.sleep(self.delay_s)
+        super().emit(record)
+
+
+def _configure(log_file, delay_s):
+    """ Reset the root logger to a single (slow) file handler. """
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+    handler = SlowFileHandler(log_file, delay_s)
+    handler.setFormatter(logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+    root.addHandler(handler)
+    root.setLevel(logging.INFO)
+
+
+def _trial(log):
+    """ Emit one trial's worth of records. """
+    words = ['THE', 'BOY', 'FELL', 'FROM', 'THE', 'WINDOW']
+    for ii in range(RECORDS_PER_TRIAL // 2):
+        log.info("Correct: %s", words)
+        log.info("Trial %d: level %.1f dB", ii, 65.0)
+
+
+def run(trials, delay_ms):
+    """ Return per-trial overhead (ms) for both pipelines. """
+    log = logging.getLogger('bench')
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in ('synchronous', 'queued'):
+            _configure(Path(tmp) / f"{mode}.log", delay_ms / 1000)
+            listener = None
+            if mode == 'queued':
+                listener = logqueue.start_queue_logging()
+            times = []
+            for _ in range(trials):
+                start = time.perf_counter()
+                _trial(log)
+                times.append((time.perf_counter() - start) * 1000)
+            if listener is not None:
+                listener.stop()
+            results[mode] = times
+        _configure(Path(tmp) / "done.log", 0)
+        logging.getLogger().handlers[0].close()
+    return results
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--trials', type=int, default=50)
+    parser.add_argument('--delay-ms', type=float, default=0.2,
+                        help="Simulated handler delay per record")
+    args = parser.parse_args()
+    results = run(args.trials, args.delay_ms)
+    print(f"{RECORDS_PER_TRIAL} records/trial, {args.trials} trials, "
+          f"{args.delay_ms} ms handler delay")
+    for mode, times in results.items():
+        print(f"{mode:>12}: median {statistics.median(times):8.3f} ms/trial, "
+              f"max {max(times):8.3f} ms/trial")
@@ -0,0 +1,115 @@
+""" Benchmark of per-trial sentence rendering in the main view:
+    destroying and recreating every word widget (the previous
+    MainView behaviour) vs. the pooled word cells.
+
+    Each trial shows a sentence of 3 to 15 words (key words in
+    capitals) and runs Tk's idle tasks, so geometry and redraw are
+    included. Per-trial times and the widget count under the
+    sentence frame are reported. Requires a display.
+
+    Run from the repository root:
+        python -m test.benchmarks.bench_mainview [--trials 500]
+
+    Last edited: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import argparse
+import random
+import statistics
+import sys
+import time
+import tkinter as tk
+from tkinter import ttk
+
+# Custom
+sys.path.append(".")
+from views.mainview import MainView
+
+#############
+# Functions #
+#############
+def make_sentences(trials, seed=0):
+    """ Return sentences of 3-15 words, about half of them key words. """
+    rnd = random.Random(seed)
+    words = ["the", "boy", "fell", "from", "window", "big", "dog", "ran",
+             "after", "small", "cat", "near", "house", "she", "sang"]
+    return [
+        " ".join(w.upper() if rnd.random() < 0.5 else w
+                 for w in rnd.sample(words, rnd.randint(3, 15)))
+        for _ in range(trials)
+    ]
+
+
+def recreate(view, sentence):
+    """ Previous update_main_label: destroy and recreate widgets. """
+    for label in view.words_dict.values():
+        label.destroy()
+    for button in view.buttons_dict.values():
+        button.destroy()
+    view.words_dict = {}
+    view.buttons_dict = {}
+    view.buttonstates_dict = {}
+    for ii, word in enumerate(sentence.split()):
+        view.words_dict[ii] = ttk.Label(view.frm_sentence, text=word)
+        view.words_dict[ii].grid(row=5, column=ii)
+        if word == word.upper():
+            view.buttonstates_dict[ii] = tk.IntVar(value=0)
+            view.buttons_dict[ii] = ttk.Checkbutton(
+                view.frm_sentence, text="", takefocus=0,
+                variable=view.buttonstates_dict[ii])
+            view.buttons_dict[ii].grid(row=10, column=ii)
+
+
+def make_view(root):
+    """ Return a MainView with the settings it displays. """
+    settings = {
+        'Subject': tk.StringVar(value='999'),
+        'Condition': tk.StringVar(value='test'),
+        'Sentence Lists': tk.StringVar(value='1, 2'),
+        'desired_level_dB': tk.DoubleVar(value=65)
+    }
+    view = MainView(root, settings)
+    view.grid()
+    return view
+
+
+def run(trials):
+    """ Return per-trial times (ms) and widget counts per mode. """
+    sentences = make_sentences(trials)
+    results = {}
+    for mode in ('recreate', 'pooled'):
+        root = tk.Tk()
+        view = make_view(root)
+        root.update()
+        times = []
+        for sentence in sentences:
+            start = time.perf_counter()
+            if mode == 'recreate':
+                recreate(view, sentence)
+            else:
+                view.update_main_label(sentence)
+            root.update_idletasks()
+            times.append((time.perf_counter() - start) * 1000)
+        widgets = len(view.frm_sentence.winfo_children())
+        root.destroy()
+        results[mode] = (times, widgets)
+    return results
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--trials', type=int, default=500)
+    args = parser.parse_args()
+    results = run(args.trials)
+    print(f"{args.trials} trials")
+    for mode, (times, widgets) in results.items():
+        times = sorted(times)
+        print(f"{mode:>9}: median {statistics.median(times):6.3f} ms/trial, "
+              f"p95 {times[int(len(times) * 0.95)]:6.3f} ms/trial, "
+              f"{widgets} widgets at end")
@@ -0,0 +1,115 @@
+""" Benchmark of matrix construction: chained MatrixFile steps vs.
+    the vectorized engine (models.matrixengine).
+
+    For each design size, a synthetic corpus is built and both paths
+    construct the same (unrandomized) matrix. Wall time and peak
+    traced memory are reported, and the outputs are checked to be
+    identical.
+
+    Run from the repository root:
+        python -m test.benchmarks.bench_matrix [--sizes 1000 100000 1000000]
+
+    Last edited: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import argparse
+import sys
+import time
+import tracemalloc
+
+# Third party
+import numpy as np
+import pandas as pd
+
+# Custom
+sys.path.append(".")
+from models.matrixengine import build_matrix
+from models.matrixmodel import CreateSpeechTaskerMatrix
+
+#############
+# Constants #
+#############
+SENTENCES_PER_LIST = 20
+PRESENTATIONS = 5
+
+#############
+# Functions #
+#############
+def make_corpus(n_lists, per_list=SENTENCES_PER_LIST + 5):
+    """ Return a synthetic corpus with interleaved lists. """
+    n = n_lists * per_list
+    list_num = np.tile(np.arange(1, n_lists + 1), per_list)
+    return pd.DataFrame({
+        'list_num': list_num,
+        'sentence_num': np.repeat(np.arange(1, per_list + 1), n_lists),
+        'sentence': [f"THE SENTENCE {ii}" for ii in range(n)],
+        'file': [f"{ii}.wav" for ii in range(n)]
+    })
+
+
+def chain_matrix(mf, corpus):
+    """ Build the matrix with the chained MatrixFile steps (the
+    reference for build_matrix).
+    """
+    pars = mf.kwargs
+    subset = mf.subset_lists(corpus, pars['lists'])
+    truncated = mf.truncate_lists(subset, pars['sentences_per_list'])
+    added_levels = mf.assign_values(truncated, pars['levels'], 'level')
+    added_speakers = mf.assign_values(added_levels, pars['speakers'], 'speaker')
+    return mf.repeat_trials(added_speakers, pars['presentations'])
+
+
+def pars_for(rows):
+    """ Return design parameters that produce ``rows`` trials. """
+    n_lists = max(1, rows // (SENTENCES_PER_LIST * PRESENTATIONS))
+    lists = list(range(1, n_lists + 1))
+    return n_lists, {
+        'lists': lists,
+        'sentences_per_list': SENTENCES_PER_LIST,
+        'levels': [60 + (ii % 4) * 5 for ii in range(n_lists)],
+        'speakers': [1 + ii % 3 for ii in range(n_lists)],
+        'presentations': PRESENTATIONS,
+        'randomize': 0
+    }
+
+
+def measure(func):
+    """ Return (result, seconds, peak MB) of a call. """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 1024**2
+
+
+def run(sizes):
+    """ Print a comparison table for each design size. """
+    print(f"{'rows':>9} | {'chain s':>8} {'chain MB':>9} | "
+          f"{'engine s':>8} {'engine MB':>9} | {'speedup':>7} | same")
+    for rows in sizes:
+        n_lists, pars = pars_for(rows)
+        corpus = make_corpus(n_lists)
+        mf = CreateSpeechTaskerMatrix(filepath=None, write=False, **pars)
+        chain, chain_s, chain_mb = measure(lambda: chain_matrix(mf, corpus))
+        engine, engine_s, engine_mb = measure(
+            lambda: build_matrix(corpus, **pars))
+        same = chain.reset_index(drop=True).astype(engine.dtypes).equals(engine)
+        print(f"{len(engine):>9} | {chain_s:>8.3f} {chain_mb:>9.1f} | "
+              f"{engine_s:>8.3f} {engine_mb:>9.1f} | "
+              f"{chain_s / engine_s:>6.1f}x | {same}")
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[1000, 100000, 1000000])
+    args = parser.parse_args()
+    run(args.sizes)
@@ -0,0 +1,95 @@
+""" Benchmark of the passage display: word-wrap layout and the
+    number of words drawn per redraw, for passages of increasing
+    length.
+
+    The layout (models.PassageLayout) is timed headless. The words
+    drawn per redraw are those in a 180 px window, which is what
+    PassageView creates or moves canvas items for. With --tk, the
+    full PassageView.show() (measure, wrap, draw) is also timed;
+    that requires a display.
+
+    Run from the repository root:
+        python -m test.benchmarks.bench_passage [--words 10 100 1000 10000] [--tk]
+
+    Last edited: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import argparse
+import random
+import sys
+import time
+
+# Custom
+sys.path.append(".")
+from models.passagelayout import PassageLayout
+
+#############
+# Constants #
+#############
+LINE_WIDTH = 468
+LINE_HEIGHT = 38
+WINDOW = 180
+REPEATS = 20
+
+#############
+# Functions #
+#############
+def make_passage(n_words, seed=0):
+    """ Return a passage of n_words, about a third of them key words. """
+    rnd = random.Random(seed)
+    words = ["the", "boy", "fell", "from", "window", "big", "dog", "ran",
+             "after", "small", "cat", "near", "house", "she", "sang"]
+    return " ".join(w.upper() if rnd.random() < 0.33 else w
+                    for w in rnd.choices(words, k=n_words))
+
+
+def time_layout(passage):
+    """ Return (ms per layout, words in the first window). """
+    widths = [7 * len(word) for word in passage.split()]
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        layout = PassageLayout(widths, LINE_WIDTH, LINE_HEIGHT, spacing=10)
+        first, stop = layout.visible(-LINE_HEIGHT, WINDOW + LINE_HEIGHT)
+    elapsed = (time.perf_counter() - start) / REPEATS * 1000
+    return elapsed, stop - first
+
+
+def time_view(passages):
+    """ Return ms per PassageView.show() for each passage. """
+    import tkinter as tk
+    from views.passageview import PassageView
+    root = tk.Tk()
+    view = PassageView(root, width=484, height=WINDOW)
+    view.grid()
+    root.update()
+    times = []
+    for passage in passages:
+        start = time.perf_counter()
+        for _ in range(REPEATS):
+            view.show(passage)
+            root.update_idletasks()
+        times.append((time.perf_counter() - start) / REPEATS * 1000)
+    root.destroy()
+    return times
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--words', type=int, nargs='+',
+                        default=[10, 100, 1000, 10000])
+    parser.add_argument('--tk', action='store_true',
+                        help="Also time PassageView.show() (needs a display)")
+    args = parser.parse_args()
+    passages = [make_passage(n) for n in args.words]
+    view_ms = time_view(passages) if args.tk else [None] * len(passages)
+    print(f"{'words':>6} | {'layout ms':>9} | {'drawn':>5} | {'show ms':>7}")
+    for n, passage, shown in zip(args.words, passages, view_ms):
+        layout_ms, drawn = time_layout(passage)
+        shown = f"{shown:7.3f}" if shown is not None else f"{'-':>7}"
+        print(f"{n:>6} | {layout_ms:9.3f} | {drawn:>5} | {shown}")
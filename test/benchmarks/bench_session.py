@@ -0,0 +1,324 @@
+""" End-to-end session benchmark with a simulated listener.
+
+    Runs complete sessions through the same path as File>Start:
+    build the matrix, measure stimulus levels, pre-render trials in
+    the render process, queue each buffer for playback, score and
+    save. The output device is replaced by a null sink that accepts
+    buffers immediately, and the listener marks each key word
+    correct with a probability given by a logistic psychometric
+    function of the presentation level.
+
+    Per-stage timings (load, render, play, score, save) and trials
+    per second are written as JSON, so runs can be compared across
+    commits.
+
+    Run from the repository root:
+        python -m test.benchmarks.bench_session [--sessions 3] [--lists 10]
+            [--output results.json]
+
+    Last edited: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Third party
+import numpy as np
+import pandas as pd
+import soundfile as sf
+
+# Custom
+sys.path.append(".")
+from models.levelindex import LevelIndex
+from models.matrixengine import build_matrix
+from models.renderpipeline import RenderPipeline
+from models.sessionengine import SessionEngine
+from models.sessionjournal import SessionJournal
+from models.sessionwriter import SessionWriter
+
+#############
+# Constants #
+#############
+STAGES = ('load', 'render', 'play', 'score', 'save')
+SAMPLERATE = 44100
+SLM_OFFSET = 100.0
+WORDS = ["the", "boy", "fell", "from", "window", "big", "dog", "ran",
+         "after", "small", "cat", "near", "house", "she", "sang"]
+
+################
+# Test Doubles #
+################
+class PsychometricListener:
+    """ Marks each key word correct with probability
+    1 / (1 + exp(-(level - midpoint) / slope)).
+    """
+
+    def __init__(self, midpoint=60.0, slope=2.0, seed=0):
+        self.midpoint = midpoint
+        self.slope = slope
+        self.rng = np.random.default_rng(seed)
+
+    def p_correct(self, level):
+        return 1 / (1 + np.exp(-(level - self.midpoint) / self.slope))
+
+    def __call__(self, trial):
+        p = self.p_correct(trial['level'])
+        return {ii for ii, word in enumerate(trial['sentence'].split())
+                if word == word.upper() and self.rng.random() < p}
+
+
+class NullSink:
+    """ Stands in for OutputEngine: checks and accepts buffers, and
+    reports them finished at once.
+    """
+
+    def __init__(self, channels, samplerate=SAMPLERATE):
+        self.channels = channels
+        self.samplerate = samplerate
+        self.frames = 0
+        self._finished = []
+
+    def play(self, buffer):
+        if buffer.shape[1] != self.channels:
+            raise ValueError(
+                f"Buffer has {buffer.shape[1]} channels; stream has "
+                + f"{self.channels}."
+            )
+        now = time.perf_counter()
+        self.frames += buffer.shape[0]
+        self._finished.append(
+            {'queued': now, 'start': now, 'stop': now, 'stopped': False})
+
+    def poll_finished(self):
+        done, self._finished = self._finished, []
+        return done
+
+
+class TimedSink:
+    """ Wraps a writer or journal and times its write calls. """
+
+    def __init__(self, target, method):
+        self.target = target
+        self.method = method
+        self.columns = getattr(target, 'columns', None)
+        self.time = 0.0
+
+    def __getattr__(self, name):
+        func = getattr(self.target, name)
+        if name != self.method:
+            return func
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.time += time.perf_counter() - start
+        return timed
+
+#############
+# Functions #
+#############
+def make_stimuli(directory, n_lists, per_list, seed=0):
+    """ Write one short noise burst per sentence and return the
+    corpus that refers to them.
+    """
+    rng = np.random.default_rng(seed)
+    rows = []
+    for list_num in range(1, n_lists + 1):
+        for sentence_num in range(1, per_list + 1):
+            name = f"{list_num}_{sentence_num}.wav"
+            frames = int(SAMPLERATE * rng.uniform(1.0, 2.0))
+            audio = 0.05 * rng.standard_normal(frames)
+            sf.write(directory / name, audio.astype(np.float32), SAMPLERATE)
+            words = rng.choice(WORDS, size=rng.integers(4, 8))
+            sentence = " ".join(w.upper() if rng.random() < 0.5 else w
+                                for w in words)
+            rows.append((list_num, sentence_num, sentence, name))
+    return pd.DataFrame(
+        rows, columns=['list_num', 'sentence_num', 'sentence', 'file'])
+
+
+def summarize(times):
+    """ Return summary statistics (ms) of per-trial times (s). """
+    times = np.asarray(times) * 1000
+    return {
+        'total_s': round(float(times.sum()) / 1000, 4),
+        'mean_ms': round(float(times.mean()), 4),
+        'p50_ms': round(float(np.percentile(times, 50)), 4),
+        'p95_ms': round(float(np.percentile(times, 95)), 4),
+        'max_ms': round(float(times.max()), 4)
+    }
+
+
+def run_session(directory, corpus, args, seed, timings, key_words):
+    """ Run one session, appending per-stage times to timings and
+    [correct, total] key word counts per level to key_words.
+    Returns the number of trials.
+    """
+    # Load: matrix, level index, outputs, render process
+    start = time.perf_counter()
+    levels = [float(v) for v in args.levels]
+    trials = build_matrix(
+        corpus,
+        lists=list(range(1, args.lists + 1)),
+        sentences_per_list=args.sentences_per_list,
+        levels=[levels[ii % len(levels)] for ii in range(args.lists)],
+        speakers=[1 + ii % args.speakers for ii in range(args.lists)],
+        presentations=args.presentations,
+        randomize=1,
+        seed=seed
+    )
+    filename = f"sim_{seed}.csv"
+    writer = TimedSink(SessionWriter(directory / filename), 'write')
+    journal = TimedSink(
+        SessionJournal(directory / f"sim_{seed}.journal"), 'trial')
+    session = SessionEngine(
+        trials,
+        settings={'Subject': 'sim', 'Condition': str(seed)},
+        writer=writer,
+        journal=journal,
+        slm_offset=SLM_OFFSET
+    )
+    session.start(filename=filename)
+    level_index = LevelIndex(directory / 'levels.json')
+    level_index.update({name: ('file', directory / name)
+                        for name in trials['file'].unique()})
+    source = lambda name: ('file', directory / name)
+    sink = NullSink(channels=args.speakers)
+    pipeline = RenderPipeline(channels=sink.channels, depth=args.depth)
+    listener = PsychometricListener(args.midpoint, args.slope, seed)
+    timings['load'].append(time.perf_counter() - start)
+
+    def schedule(first):
+        stop = min(first + pipeline.depth, len(session.th))
+        pipeline.schedule(
+            [(row, session.render_spec(row, level_index, source))
+             for row in range(first, stop)])
+
+    schedule(0)
+    try:
+        while session.next() is not None:
+            row = session.th.trial_num - 1
+            # Render: wait for (or collect) the pre-rendered buffer
+            start = time.perf_counter()
+            buffer = pipeline.get(
+                row, session.render_spec(row, level_index, source))
+            timings['render'].append(time.perf_counter() - start)
+            # Play: queue the buffer and schedule upcoming trials
+            start = time.perf_counter()
+            sink.play(buffer)
+            timing = sink.poll_finished()[0]
+            pipeline.release_before(row)
+            schedule(row + 1)
+            timings['play'].append(time.perf_counter() - start)
+            # Score (the writer and journal time themselves)
+            saved = writer.time + journal.time
+            start = time.perf_counter()
+            responses = session.score(
+                marked=listener(session.trial),
+                timing={
+                    'playback_start': timing['start'],
+                    'playback_stop': timing['stop'],
+                    'onset_latency_ms': 0.0
+                }
+            )
+            elapsed = time.perf_counter() - start
+            save = writer.time + journal.time - saved
+            timings['score'].append(elapsed - save)
+            timings['save'].append(save)
+            counts = key_words.setdefault(str(session.desired_level), [0, 0])
+            counts[0] += responses['num_correct']
+            counts[1] += (len(responses['correct'])
+                          + len(responses['incorrect']))
+        session.finish()
+    finally:
+        pipeline.close()
+        start = time.perf_counter()
+        writer.close()
+        journal.close()
+        timings['save'][-1] += time.perf_counter() - start
+    return len(trials)
+
+
+def git_commit():
+    """ Return the current commit hash, or None outside a repo. """
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+            check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args):
+    """ Return the benchmark results as a dictionary. """
+    timings = {stage: [] for stage in STAGES}
+    n_trials = 0
+    key_words = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        corpus = make_stimuli(directory, args.lists, args.sentences_per_list)
+        start = time.perf_counter()
+        for seed in range(args.sessions):
+            n_trials += run_session(
+                directory, corpus, args, seed, timings, key_words)
+        wall = time.perf_counter() - start
+    return {
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'config': vars(args),
+        'sessions': args.sessions,
+        'trials': n_trials,
+        'wall_s': round(wall, 4),
+        'trials_per_s': round(n_trials / wall, 2),
+        'stages': {
+            'load': {'total_s': round(sum(timings['load']), 4),
+                     'per_session_s': round(
+                         sum(timings['load']) / args.sessions, 4)},
+            **{stage: summarize(timings[stage]) for stage in STAGES[1:]}
+        },
+        'listener': {
+            'midpoint_db': args.midpoint,
+            'slope_db': args.slope,
+            'key_words_correct_by_level': {
+                level: round(correct / total, 4)
+                for level, (correct, total) in sorted(key_words.items())}
+        }
+    }
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sessions', type=int, default=3)
+    parser.add_argument('--lists', type=int, default=10)
+    parser.add_argument('--sentences-per-list', type=int, default=10)
+    parser.add_argument('--presentations', type=int, default=2)
+    parser.add_argument('--levels', type=float, nargs='+',
+                        default=[55, 60, 65])
+    parser.add_argument('--speakers', type=int, default=2)
+    parser.add_argument('--depth', type=int, default=3,
+                        help="Trials pre-rendered ahead")
+    parser.add_argument('--midpoint', type=float, default=60.0,
+                        help="Level (dB) with 50%% of key words correct")
+    parser.add_argument('--slope', type=float, default=2.0,
+                        help="Logistic slope (dB)")
+    parser.add_argument('--output', help="Write JSON here (default: stdout)")
+    args = parser.parse_args()
+    results = json.dumps(run(args), indent=2)
+    if args.output:
+        Path(args.output).write_text(results + "\n")
+    else:
+        print(results)
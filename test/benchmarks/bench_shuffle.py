@@ -0,0 +1,108 @@
+""" Benchmark of constrained trial shuffling: rejection sampling of
+    whole permutations vs. the shuffle engine (models.shuffleengine).
+
+    Each design has three speakers, four levels and lists of 20
+    sentences, shuffled with:
+        max_run speaker 2; no_repeat list_num; balance level 8
+    Rejection sampling redraws a plain permutation until it passes
+    (within a time budget); the engine builds a valid order directly.
+    The engine's orders are checked against every constraint.
+
+    Run from the repository root:
+        python -m test.benchmarks.bench_shuffle [--sizes 1000 10000 100000 1000000]
+
+    Last edited: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import argparse
+import sys
+import time
+
+# Third party
+import numpy as np
+
+# Custom
+sys.path.append(".")
+from models.shuffleengine import constrained_order
+from models.shuffleengine import parse_constraints
+
+#############
+# Constants #
+#############
+CONSTRAINTS = "max_run speaker 2; no_repeat list_num; balance level 8"
+BLOCK = 8
+
+#############
+# Functions #
+#############
+def make_columns(n):
+    """ Return the constrained columns of a synthetic design. """
+    return {
+        'speaker': np.tile([1, 2, 3], n // 3 + 1)[:n],
+        'level': np.tile([60, 65, 70, 75], n // 4 + 1)[:n],
+        'list_num': np.repeat(np.arange(n // 20 + 1), 20)[:n]
+    }
+
+
+def satisfied(columns, order):
+    """ Return whether an order meets CONSTRAINTS. """
+    speaker = columns['speaker'][order]
+    same = np.r_[False, speaker[1:] == speaker[:-1]]
+    two_in_row = same[1:] & same[:-1]
+    if two_in_row.any():
+        return False
+    lists = columns['list_num'][order]
+    if (lists[1:] == lists[:-1]).any():
+        return False
+    level = columns['level'][order]
+    full = len(level) // BLOCK * BLOCK
+    values = np.unique(level)
+    blocks = level[:full].reshape(-1, BLOCK)
+    counts = (blocks[:, :, None] == values).sum(axis=1)
+    return counts.max() - counts.min() <= 1
+
+
+def rejection(columns, n, budget_s, rng):
+    """ Return (attempts, seconds, found) of rejection sampling. """
+    start = time.perf_counter()
+    attempts = 0
+    while time.perf_counter() - start < budget_s:
+        attempts += 1
+        if satisfied(columns, rng.permutation(n)):
+            return attempts, time.perf_counter() - start, True
+    return attempts, time.perf_counter() - start, False
+
+
+def run(sizes, budget_s):
+    """ Print a comparison table for each design size. """
+    constraints = parse_constraints(CONSTRAINTS)
+    print(f"Constraints: {CONSTRAINTS}")
+    print(f"{'trials':>9} | {'rejection':>28} | {'engine s':>8} | "
+          f"{'us/trial':>8} | valid")
+    rng = np.random.default_rng(0)
+    for n in sizes:
+        columns = make_columns(n)
+        attempts, rej_s, found = rejection(columns, n, budget_s, rng)
+        outcome = (f"found in {rej_s:.2f} s" if found
+                   else f"none in {attempts} tries")
+        start = time.perf_counter()
+        order, seed = constrained_order(n, columns, constraints, seed=1)
+        engine_s = time.perf_counter() - start
+        print(f"{n:>9} | {outcome:>28} | {engine_s:>8.3f} | "
+              f"{engine_s / n * 1e6:>8.2f} | {satisfied(columns, order)}")
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[1000, 10000, 100000, 1000000])
+    parser.add_argument('--budget', type=float, default=5.0,
+                        help="Seconds allowed for rejection sampling")
+    args = parser.parse_args()
+    run(args.sizes, args.budget)
@@ -0,0 +1,123 @@
+""" Automated tests for the ConversionCache of the Speech Tasker.
+
+    Last edited: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import pytest
+import sys
+
+# Third party
+import numpy as np
+import soundfile as sf
+
+# Custom
+sys.path.append("..")
+from models import conversioncache
+from models.conversioncache import ConversionCache, convert
+from models.stimulusbundle import pack_directory
+
+############
+# Fixtures #
+############
+@pytest.fixture
+def stimuli(tmp_path):
+    t = np.arange(44100) / 44100
+    tone = 0.5 * np.sin(2 * np.pi * 440 * t)
+    sf.write(tmp_path / "native.wav", tone, 48000, subtype='FLOAT')
+    sf.write(tmp_path / "cd.wav", tone, 44100, subtype='FLOAT')
+    sf.write(tmp_path / "stereo.wav", np.column_stack([tone, tone]),
+             48000, subtype='FLOAT')
+    return {
+        name: tmp_path / name 
+        for name in ["native.wav", "cd.wav", "stereo.wav"]
+    }
+
+##############
+# Unit Tests #
+##############
+def test_convert_resamples_and_downmixes():
+    # Arrange
+    stereo = np.ones((441, 2), dtype=np.float32)
+    # Act
+    out = convert(stereo, 44100, 48000, 1)
+    # Assert
+    assert out.shape == (480,)
+    assert out.dtype == np.float32
+
+
+def test_prepare_only_converts_mismatches(stimuli, tmp_path):
+    # Arrange
+    cache = ConversionCache(tmp_path / "cache", target_sr=48000)
+    # Act
+    n = cache.prepare(stimuli, max_workers=2)
+    audio, fs = cache.get("cd.wav")
+    # Assert
+    assert n == 2
+    assert "native.wav" not in cache
+    assert fs == 48000 and audio.shape == (48000,)
+    assert cache.downmixed == ["stereo.wav"]
+
+
+def test_warm_prepare_uses_manifest(stimuli, tmp_path):
+    # Arrange
+    ConversionCache(tmp_path / "cache", target_sr=48000).prepare(stimuli)
+    warm = ConversionCache(tmp_path / "cache", target_sr=48000)
+    # Act
+    warm.prepare(stimuli)
+    # Assert
+    assert "cd.wav" in warm and "stereo.wav" in warm
+    assert warm.downmixed == ["stereo.wav"]
+
+
+def test_warm_prepare_skips_the_pool(stimuli, tmp_path, monkeypatch):
+    # Arrange
+    ConversionCache(tmp_path / "cache", target_sr=48000).prepare(stimuli)
+    def no_pool(*args, **kwargs):
+        raise AssertionError("Process pool started on a warm cache")
+    monkeypatch.setattr(conversioncache, 'ProcessPoolExecutor', no_pool)
+    monkeypatch.setattr(conversioncache.sf, 'info', no_pool)
+    warm = ConversionCache(tmp_path / "cache", target_sr=48000)
+    # Act
+    n = warm.prepare(stimuli)
+    # Assert
+    assert n == 2
+    assert "native.wav" not in warm
+
+
+def test_native_bundle_entries_skip_the_pool(stimuli, tmp_path, monkeypatch):
+    # Arrange
+    bundle = tmp_path / "stimuli.stb"
+    pack_directory(tmp_path, bundle)
+    def no_pool(*args, **kwargs):
+        raise AssertionError("Process pool started with nothing to convert")
+    monkeypatch.setattr(conversioncache, 'ProcessPoolExecutor', no_pool)
+    cache = ConversionCache(tmp_path / "cache", target_sr=48000)
+    # Act
+    n = cache.prepare({"native.wav": bundle}, in_bundle=True)
+    # Assert
+    assert n == 0
+
+
+def test_bundle_conversions(stimuli, tmp_path):
+    # Arrange
+    bundle = tmp_path / "stimuli.stb"
+    pack_directory(tmp_path, bundle)
+    cache = ConversionCache(tmp_path / "cache", target_sr=48000)
+    # Act
+    n = cache.prepare({name: bundle for name in stimuli}, in_bundle=True,
+                      max_workers=2)
+    audio, fs = cache.get("cd.wav")
+    # Assert
+    assert n == 2
+    assert "native.wav" not in cache
+    assert fs == 48000 and audio.shape == (48000,)
+
+################
+# Module Guard #
+################
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,93 @@
+""" Automated tests for the indexed sentence corpus of the Speech Tasker.
+
+    Last edited: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import os
+import pytest
+import sys
+
+# Third party
+import pandas as pd
+
+# Custom
+sys.path.append("..")
+from models import corpusindex
+from models.corpusindex import CorpusIndex
+from models.matrixengine import build_matrix
+
+############
+# Fixtures #
+############
+@pytest.fixture
+def corpus_csv(tmp_path):
+    # Lists are interleaved to check that file order is kept
+    corpus = pd.DataFrame({
+        'list_num': [1, 2, 1, 2, 1, 2, 3, 3],
+        'sentence_num': [1, 1, 2, 2, 3, 3, 1, 2],
+        'sentence': ["THE boy FELL", "A café", "SHE ran", "IT is",
+                     "WE go", "HE sat", "THEY ate", "YOU see"],
+        'file': [f"{ii}.wav" for ii in range(8)]
+    })
+    path = tmp_path / "corpus.csv"
+    corpus.to_csv(path, index=False)
+    return path
+
+##############
+# Unit Tests #
+##############
+def test_sidecar_is_reused(corpus_csv):
+    # Act
+    first = CorpusIndex.load(corpus_csv)
+    second = CorpusIndex.load(corpus_csv)
+    # Assert
+    assert not first.from_sidecar
+    assert second.from_sidecar
+    assert CorpusIndex.sidecar_path(corpus_csv).exists()
+    pd.testing.assert_frame_equal(second.frame, pd.read_csv(corpus_csv))
+
+
+def test_changed_file_rebuilds_and_touched_file_reuses(corpus_csv,
+                                                       monkeypatch):
+    # Arrange
+    CorpusIndex.load(corpus_csv)
+    stat = os.stat(corpus_csv)
+    # Act
+    os.utime(corpus_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    touched = CorpusIndex.load(corpus_csv)
+    with monkeypatch.context() as m:
+        # The new stat was saved, so the file is not hashed again
+        m.setattr(corpusindex, 'file_hash', None)
+        again = CorpusIndex.load(corpus_csv)
+    with open(corpus_csv, 'a') as f:
+        f.write("4,1,NEW one,8.wav\n")
+    changed = CorpusIndex.load(corpus_csv)
+    # Assert
+    assert touched.from_sidecar
+    assert again.from_sidecar
+    assert not changed.from_sidecar
+    assert list(changed.lists) == [1, 2, 3, 4]
+
+
+def test_select_rows_matches_engine(corpus_csv):
+    # Arrange
+    index = CorpusIndex.load(corpus_csv)
+    pars = {'lists': [2, 1], 'sentences_per_list': 2, 'levels': [60, 70],
+            'speakers': [3], 'presentations': 2, 'randomize': 0}
+    # Act
+    from_index = build_matrix(index, **pars)
+    from_frame = build_matrix(pd.read_csv(corpus_csv), **pars)
+    # Assert
+    assert list(index.select_rows([2, 1], 2)) == [0, 1, 2, 3]
+    assert list(index.select_rows([9], 2)) == []
+    pd.testing.assert_frame_equal(from_index, from_frame)
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
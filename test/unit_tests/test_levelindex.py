@@ -0,0 +1,100 @@
+""" Automated tests for the LevelIndex of the Speech Tasker.
+
+    Last edited: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import os
+import pytest
+import sys
+
+# Third party
+import numpy as np
+import soundfile as sf
+
+# Custom
+sys.path.append("..")
+from models import levelindex
+from models.levelindex import LevelIndex
+from models.stimulusbundle import pack_directory
+
+############
+# Fixtures #
+############
+@pytest.fixture
+def stimuli(tmp_path):
+    directory = tmp_path / "stimuli"
+    directory.mkdir()
+    t = np.arange(4800) / 48000
+    for name, amplitude in [("a.wav", 0.5), ("b.wav", 0.1)]:
+        tone = amplitude * np.sin(2 * np.pi * 1000 * t)
+        sf.write(directory / name, tone.astype(np.float32), 48000,
+                 subtype='FLOAT')
+    return directory
+
+
+def _sources(directory, kind='file'):
+    return {name: (kind, directory / name) for name in ["a.wav", "b.wav"]}
+
+##############
+# Unit Tests #
+##############
+def test_measures_then_hits(stimuli):
+    # Arrange
+    index = LevelIndex(stimuli / "levels.json")
+    # Act
+    cold = index.update(_sources(stimuli), max_workers=2)
+    warm = LevelIndex(stimuli / "levels.json")
+    hits = warm.update(_sources(stimuli))
+    # Assert
+    assert cold == 2
+    assert hits == 0
+    assert warm['a.wav']['peak'] == pytest.approx(0.5, abs=1e-3)
+    assert warm['a.wav']['rms'] == pytest.approx(0.5 / np.sqrt(2), rel=1e-3)
+    assert warm['a.wav']['frames'] == 4800
+
+
+def test_stale_entry_is_remeasured(stimuli):
+    # Arrange
+    index = LevelIndex(stimuli / "levels.json")
+    index.update(_sources(stimuli))
+    sf.write(stimuli / "b.wav", np.full(4800, 0.25, dtype=np.float32),
+             48000, subtype='FLOAT')
+    stat = (stimuli / "b.wav").stat()
+    os.utime(stimuli / "b.wav",
+             ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    # Act
+    measured = index.update(_sources(stimuli))
+    # Assert
+    assert measured == 1
+    assert index['b.wav']['peak'] == pytest.approx(0.25)
+
+
+def test_bundle_uses_stored_stats(stimuli, tmp_path, monkeypatch):
+    # Arrange
+    bundle = tmp_path / "stimuli.stb"
+    pack_directory(stimuli, bundle)
+    def no_pool(*args, **kwargs):
+        raise AssertionError("Bundle stimuli were re-measured")
+    monkeypatch.setattr(levelindex, 'ProcessPoolExecutor', no_pool)
+    monkeypatch.setattr(levelindex, 'measure', no_pool)
+    index = LevelIndex(tmp_path / "stimuli.levels.json")
+    # Act
+    measured = index.update(
+        {name: ('bundle', bundle) for name in ["a.wav", "b.wav"]})
+    # Assert
+    assert measured == 2
+    assert index['a.wav']['peak'] == pytest.approx(0.5, abs=1e-3)
+    assert index['b.wav']['sr'] == 48000
+    assert index['b.wav']['channels'] == 1
+    assert not index.would_clip('a.wav', -6.0)
+    assert index.would_clip('a.wav', 0.0)
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,72 @@
+""" Automated tests for the queued logging of the Speech Tasker.
+
+    Last edited: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import logging
+import logging.handlers
+import pytest
+import sys
+import threading
+
+# Custom
+sys.path.append("..")
+from models import logqueue
+
+############
+# Fixtures #
+############
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.threads = set()
+
+    def emit(self, record):
+        self.records.append(record.getMessage())
+        self.threads.add(threading.current_thread().name)
+
+
+@pytest.fixture
+def handler():
+    root = logging.getLogger()
+    saved = list(root.handlers), root.level
+    for h in saved[0]:
+        root.removeHandler(h)
+    handler = ListHandler()
+    root.addHandler(handler)
+    root.setLevel(logging.INFO)
+    yield handler
+    for h in list(root.handlers):
+        root.removeHandler(h)
+    for h in saved[0]:
+        root.addHandler(h)
+    root.setLevel(saved[1])
+    logging.getLogger('bench.quiet').setLevel(logging.NOTSET)
+
+##############
+# Unit Tests #
+##############
+def test_records_are_written_by_listener(handler):
+    # Arrange
+    listener = logqueue.start_queue_logging({'bench.quiet': 'warning'})
+    # Act
+    logging.getLogger('bench.loud').info("kept")
+    logging.getLogger('bench.quiet').info("dropped")
+    listener.stop()
+    # Assert
+    assert isinstance(logging.getLogger().handlers[0],
+                      logging.handlers.QueueHandler)
+    assert "kept" in handler.records
+    assert "dropped" not in handler.records
+    assert 'MainThread' not in handler.threads
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
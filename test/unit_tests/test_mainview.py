@@ -0,0 +1,99 @@
+""" Automated tests for the pooled word cells of the MainView.
+
+    Needs a display for Tk; skipped without one.
+
+    Last edited: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import pytest
+import sys
+import tkinter as tk
+
+# Custom
+sys.path.append("..")
+from views.mainview import MainView
+
+############
+# Fixtures #
+############
+@pytest.fixture
+def view():
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("No display for Tk")
+    root.withdraw()
+    settings = {
+        name: tk.StringVar(value="")
+        for name in ['Subject', 'Condition', 'Sentence Lists',
+                     'desired_level_dB']
+    }
+    view = MainView(root, settings)
+    yield view
+    root.destroy()
+
+
+def _texts(view):
+    return [str(cell.label.cget('text')) for cell in view._cells]
+
+
+def _gridded(widgets):
+    return [widget.winfo_manager() == 'grid' for widget in widgets]
+
+##############
+# Unit Tests #
+##############
+def test_cells_are_reused_for_shorter_and_longer_sentences(view):
+    # Arrange
+    view.update_main_label("THE big DOG ran HOME")
+    cells = list(view._cells)
+    # Act
+    view.update_main_label("A CAT sat")
+    shorter = list(view._cells)
+    shorter_labels = _gridded(c.label for c in view._cells)
+    shorter_buttons = _gridded(c.button for c in view._cells)
+    view.update_main_label("WE all WENT to the PARK")
+    # Assert
+    assert shorter == cells
+    assert shorter_labels == [True, True, True, False, False]
+    assert shorter_buttons == [True, True, False, False, False]
+    assert view._cells[:5] == cells
+    assert len(view._cells) == 6
+    assert _texts(view) == ["WE", "all", "WENT", "to", "the", "PARK"]
+    assert _gridded(c.label for c in view._cells) == [True] * 6
+    assert _gridded(c.button for c in view._cells) == \
+        [True, False, True, False, False, True]
+    assert sorted(view.buttonstates_dict) == [0, 2, 5]
+
+
+def test_marked_words_after_reuse(view):
+    # Arrange
+    view.update_main_label("THE big DOG ran HOME")
+    view.buttonstates_dict[0].set(1)
+    view.buttonstates_dict[2].set(1)
+    marked = view.marked_words()
+    # Act
+    # Cell 2 was a marked key word; now it is not a key word
+    view.update_main_label("a BIG dog")
+    unmarked = view.marked_words()
+    view.buttonstates_dict[1].set(1)
+    remarked = view.marked_words()
+    # Key words get cleared checkbuttons when cells are reused
+    view.update_main_label("THE big DOG ran HOME")
+    cleared = view.marked_words()
+    # Assert
+    assert marked == {0, 2}
+    assert unmarked == set()
+    assert remarked == {1}
+    assert cleared == set()
+    assert sorted(view.buttonstates_dict) == [0, 2, 4]
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,135 @@
+""" Automated tests for the matrix cache of the Speech Tasker.
+
+    Last edited: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import os
+import pytest
+import sys
+
+# Third party
+import pandas as pd
+
+# Custom
+sys.path.append("..")
+from models.matrixcache import MatrixCache
+from models.matrixcache import matrix_key
+from models.matrixmodel import CreateSpeechTaskerMatrix
+
+############
+# Fixtures #
+############
+@pytest.fixture
+def corpus_csv(tmp_path):
+    corpus = pd.DataFrame({
+        'list_num': [1, 2, 1, 2, 1, 2],
+        'sentence_num': [1, 1, 2, 2, 3, 3],
+        'sentence': [f"SENTENCE {ii}" for ii in range(6)],
+        'file': [f"{ii}.wav" for ii in range(6)]
+    })
+    path = tmp_path / "corpus.csv"
+    corpus.to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture
+def pars(corpus_csv):
+    return {
+        'filepath': corpus_csv,
+        'lists': [1, 2],
+        'sentences_per_list': 2,
+        'levels': [60, 70],
+        'speakers': [1],
+        'presentations': 2,
+        'randomize': 0,
+        'write': True
+    }
+
+##############
+# Unit Tests #
+##############
+def test_keys_are_normalised():
+    # Arrange
+    pars = {'lists': ['1', 2], 'sentences_per_list': 2, 'levels': [60],
+            'speakers': [1], 'presentations': 1, 'randomize': 0, 'seed': 5}
+    # Act
+    key = matrix_key('abc', pars)
+    same = matrix_key('abc', dict(pars, lists=[1, 2], levels=[60.0], seed=9))
+    # Assert
+    assert key == same
+    assert key != matrix_key('abd', pars)
+    assert matrix_key('abc', dict(pars, randomize=1, seed=None)) is None
+    assert matrix_key('abc', dict(pars, randomize=1)) != \
+        matrix_key('abc', dict(pars, randomize=1, seed=6))
+
+
+def test_repeat_design_is_a_hit(tmp_path, pars, monkeypatch):
+    # Arrange
+    monkeypatch.chdir(tmp_path)
+    cache = MatrixCache(tmp_path / "cache")
+    first = CreateSpeechTaskerMatrix(cache=cache, **pars).create_matrix_file()
+    mtime = os.stat("matrix_file.csv").st_mtime_ns
+    # Act
+    second = CreateSpeechTaskerMatrix(cache=cache, **pars).create_matrix_file()
+    # Assert
+    pd.testing.assert_frame_equal(first, second)
+    assert cache.stats()['hits'] == 1
+    assert os.stat("matrix_file.csv").st_mtime_ns == mtime
+    assert cache.entries()[0]['trials'] == 8
+
+
+def test_seeded_shuffle_is_reproducible(tmp_path, pars, monkeypatch):
+    # Arrange
+    monkeypatch.chdir(tmp_path)
+    cache = MatrixCache(tmp_path / "cache")
+    pars = dict(pars, randomize=1, seed=42)
+    # Act
+    cached = CreateSpeechTaskerMatrix(cache=cache, **pars).create_matrix_file()
+    fresh = CreateSpeechTaskerMatrix(**pars).create_matrix_file()
+    # Assert
+    pd.testing.assert_frame_equal(cached, fresh)
+    assert cache.entries()[0]['pars']['seed'] == 42
+
+
+def test_eviction_and_clear(tmp_path):
+    # Arrange
+    cache = MatrixCache(tmp_path, max_bytes=1)
+    matrix = pd.DataFrame({'file': ['a.wav'] * 10})
+    # Act
+    cache.put('a', matrix)
+    cache.put('b', matrix)
+    kept = [e['key'] for e in cache.entries()]
+    reopened = len(MatrixCache(tmp_path))
+    cache.clear()
+    # Assert
+    assert kept == ['b']
+    assert cache.stats()['evictions'] == 1
+    assert reopened == 1
+    assert len(cache) == 0
+    assert not list(tmp_path.glob('*.npz'))
+
+
+def test_matrices_round_trip_without_pickle(tmp_path):
+    # Arrange
+    cache = MatrixCache(tmp_path)
+    matrix = pd.DataFrame({
+        'file': ['b.wav', 'a.wav', 'c.wav'],
+        'sentence': ['A BIG dog', 'NA', ''],
+        'level': [60.0, 65.5, 70.0],
+        'speaker': [2, 1, 2]
+    }, index=[2, 0, 1])
+    # Act
+    cache.put('a', matrix)
+    loaded = MatrixCache(tmp_path).get('a')
+    # Assert
+    pd.testing.assert_frame_equal(loaded, matrix)
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
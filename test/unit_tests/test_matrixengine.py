@@ -0,0 +1,95 @@
+""" Automated tests for the vectorized matrix engine of the Speech Tasker.
+
+    Last edited: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import pytest
+import sys
+
+# Third party
+import pandas as pd
+
+# Custom
+sys.path.append("..")
+from models.matrixengine import build_matrix
+
+############
+# Fixtures #
+############
+@pytest.fixture
+def corpus():
+    # Lists are interleaved to check that file order is kept
+    return pd.DataFrame({
+        'list_num': [1, 2, 1, 2, 1, 2, 3, 3],
+        'sentence_num': [1, 1, 2, 2, 3, 3, 1, 2],
+        'sentence': [f"SENTENCE {ii}" for ii in range(8)],
+        'file': [f"{ii}.wav" for ii in range(8)]
+    })
+
+
+@pytest.fixture
+def pars():
+    return {
+        'lists': [2, 1],
+        'sentences_per_list': 2,
+        'levels': [60, 70],
+        'speakers': [3],
+        'presentations': 2,
+        'randomize': 0
+    }
+
+##############
+# Unit Tests #
+##############
+def test_rows_levels_and_repeats(corpus, pars):
+    # Act
+    matrix = build_matrix(corpus, **pars)
+    # Assert
+    assert list(matrix['file']) == ['0.wav', '1.wav', '2.wav', '3.wav'] * 2
+    assert list(matrix['level']) == [70, 60, 70, 60] * 2
+    assert set(matrix['speaker']) == {3}
+
+
+def test_randomize_is_a_permutation(corpus, pars):
+    # Arrange
+    pars['randomize'] = 1
+    # Act
+    matrix = build_matrix(corpus, seed=1, **pars)
+    # Assert
+    ordered = build_matrix(corpus, **dict(pars, randomize=0))
+    assert sorted(matrix['file']) == sorted(ordered['file'])
+
+
+def test_wrong_number_of_values_raises(corpus, pars):
+    # Arrange
+    pars['levels'] = [60, 70, 80]
+    # Act & Assert
+    with pytest.raises(ValueError):
+        build_matrix(corpus, **pars)
+
+
+def test_full_matrix_matches_expected_frame(corpus, pars):
+    # Arrange: the output of the chained MatrixFile steps
+    once = pd.DataFrame({
+        'list_num': [1, 2, 1, 2],
+        'sentence_num': [1, 1, 2, 2],
+        'sentence': [f"SENTENCE {ii}" for ii in range(4)],
+        'file': [f"{ii}.wav" for ii in range(4)],
+        'level': [70, 60, 70, 60],
+        'speaker': [3, 3, 3, 3]
+    })
+    expected = pd.concat([once, once], ignore_index=True)
+    # Act
+    matrix = build_matrix(corpus, **pars)
+    # Assert
+    pd.testing.assert_frame_equal(matrix, expected, check_dtype=False)
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,212 @@
+""" Automated tests for the OutputEngine of the Speech Tasker.
+
+    The audio callback is called directly with a fake output block;
+    no audio device is opened.
+
+    Last edited: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import pytest
+import sys
+from types import SimpleNamespace
+
+# Third party
+import numpy as np
+
+# Custom
+sys.path.append("..")
+from models import outputengine
+from models.outputengine import OutputEngine
+
+################
+# Test Doubles #
+################
+class FakeStream:
+    """ Stands in for sd.OutputStream. """
+
+    def __init__(self, **kwargs):
+        self.time = 0.0
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def close(self):
+        pass
+
+############
+# Fixtures #
+############
+@pytest.fixture
+def engine(monkeypatch):
+    monkeypatch.setattr(outputengine.sd, 'OutputStream', FakeStream,
+                        raising=False)
+    return OutputEngine(device=0, channels=2, samplerate=1000, blocksize=4)
+
+
+def _block(engine, dac_time=0.0, status=None):
+    """ Run the callback once and return the output block. """
+    outdata = np.full((engine.blocksize, engine.channels), np.nan,
+                      dtype=np.float32)
+    engine._callback(outdata, engine.blocksize,
+                     SimpleNamespace(outputBufferDacTime=dac_time), status)
+    return outdata
+
+##############
+# Unit Tests #
+##############
+def test_buffer_plays_across_blocks(engine):
+    # Arrange
+    buffer = np.arange(20, dtype=np.float32).reshape(10, 2) / 100
+    engine.play(buffer)
+    # Act
+    blocks = [_block(engine, dac_time=ii * 0.004) for ii in range(3)]
+    # Assert
+    out = np.concatenate(blocks)
+    assert np.array_equal(out[:10], buffer)
+    assert not out[10:].any()
+    assert engine.duration == 0.01
+
+
+def test_finished_times_are_reported(engine):
+    # Arrange
+    engine.stream.time = 0.5
+    engine.play(np.ones((6, 2), dtype=np.float32) / 10)
+    # Act
+    _block(engine, dac_time=1.0)
+    during = engine.poll_finished()
+    _block(engine, dac_time=1.004)
+    done = engine.poll_finished()
+    _block(engine, dac_time=1.008)
+    # Assert
+    assert during == []
+    assert len(done) == 1
+    assert done[0]['queued'] == 0.5
+    assert done[0]['start'] == 1.0
+    # 2 of the second block's 4 frames at 1000 Hz
+    assert done[0]['stop'] == pytest.approx(1.006)
+    assert not done[0]['stopped']
+    assert engine.poll_finished() == []
+
+
+def test_finishes_carry_their_buffer_tag(engine):
+    # Arrange
+    engine.play(np.ones((4, 2), dtype=np.float32) / 10, tag=1)
+    engine.play(np.ones((4, 2), dtype=np.float32) / 10, tag=2)
+    # Act
+    _block(engine)
+    _block(engine)
+    timing = engine.poll_finished()
+    # Assert
+    assert [t['tag'] for t in timing] == [1, 2]
+
+
+def test_stop_reports_and_discards_queue(engine):
+    # Arrange
+    engine.play(np.ones((40, 2), dtype=np.float32) / 10)
+    engine.play(np.ones((40, 2), dtype=np.float32) / 10)
+    _block(engine, dac_time=2.0)
+    # Act
+    engine.stop()
+    out = _block(engine, dac_time=2.004)
+    timing = engine.poll_finished()
+    # Assert
+    assert not out.any()
+    assert [t['stopped'] for t in timing] == [True]
+    assert timing[0]['stop'] == 2.004
+    assert not _block(engine).any()
+
+
+def test_masker_loops_across_blocks_without_gaps(engine):
+    # Arrange
+    masker = np.arange(1, 7, dtype=np.float32) / 100
+    engine.set_masker(masker, [2])
+    # Act
+    out = np.concatenate([_block(engine) for _ in range(3)])
+    # Assert
+    assert np.allclose(out[:, 1], np.tile(masker, 2))
+    assert not out[:, 0].any()
+
+
+def test_masker_wraps_and_clipping_is_counted(engine):
+    # Arrange
+    engine.set_masker(np.array([0.5, 0.0, 0.0], dtype=np.float32), [1])
+    engine.play(np.full((4, 2), 0.75, dtype=np.float32))
+    # Act
+    out = _block(engine)
+    timing = engine.poll_finished()
+    # Assert
+    # Masker wraps within the block: 0.5, 0, 0, 0.5 (+ 0.75, clipped)
+    assert out[:, 0].tolist() == [1.0, 0.75, 0.75, 1.0]
+    assert out[:, 1].tolist() == [0.75] * 4
+    assert engine.clipped_blocks == 1
+    assert timing[0]['clipped_blocks'] == 1
+
+
+def test_no_clipping_below_full_scale(engine):
+    # Arrange
+    engine.set_masker(np.full(8, 0.25, dtype=np.float32), [2])
+    engine.play(np.full((4, 2), 0.5, dtype=np.float32))
+    # Act
+    out = _block(engine)
+    timing = engine.poll_finished()
+    # Assert
+    assert out[:, 1].tolist() == [0.75] * 4
+    assert engine.clipped_blocks == 0
+    assert timing[0]['clipped_blocks'] == 0
+
+
+def test_shorter_masker_restarts_from_beginning(engine):
+    # Arrange
+    engine.set_masker(np.arange(10, dtype=np.float32) / 100, [1])
+    _block(engine)
+    _block(engine)
+    # Act
+    engine.set_masker(np.array([0.1, 0.2, 0.3], dtype=np.float32), [1])
+    out = _block(engine)
+    # Assert
+    assert np.allclose(out[:, 0], [0.1, 0.2, 0.3, 0.1])
+    assert out[:, 1].tolist() == [0.0] * 4
+
+
+def test_stale_masker_position_wraps(engine):
+    # Arrange
+    engine.set_masker(np.array([0.1, 0.2, 0.3], dtype=np.float32), [1])
+    # Position left over from a longer masker
+    engine._masker_pos = 8
+    # Act
+    out = _block(engine)
+    # Assert
+    assert np.allclose(out[:, 0], [0.3, 0.1, 0.2, 0.3])
+
+
+def test_stream_status_is_logged_by_poll(engine, caplog, monkeypatch):
+    # Arrange
+    def no_log(*args, **kwargs):
+        raise AssertionError("Logged in the audio callback")
+    with monkeypatch.context() as m:
+        m.setattr(outputengine.logger, 'warning', no_log)
+        _block(engine, status="output underflow")
+        _block(engine, status="output underflow")
+        _block(engine)
+    # Act
+    with caplog.at_level('WARNING', logger=outputengine.logger.name):
+        engine.poll_finished()
+        engine.poll_finished()
+    # Assert
+    assert engine.status_count == 2
+    assert len(caplog.records) == 1
+    assert "2 callbacks" in caplog.text
+    assert "output underflow" in caplog.text
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
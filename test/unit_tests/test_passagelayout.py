@@ -0,0 +1,58 @@
+""" Automated tests for the passage layout of the Speech Tasker.
+
+    Last edited: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import pytest
+import sys
+
+# Custom
+sys.path.append("..")
+from models.passagelayout import PassageLayout
+
+############
+# Fixtures #
+############
+@pytest.fixture
+def layout():
+    # Three 40 px words fit on a 140 px line with 10 px spacing
+    return PassageLayout([40] * 10, line_width=140, line_height=20,
+                         spacing=10)
+
+##############
+# Unit Tests #
+##############
+def test_wraps_words(layout):
+    # Assert
+    assert layout.lines == 4
+    assert layout.height == 80
+    assert list(layout.line) == [0, 0, 0, 1, 1, 1, 2, 2, 2, 3]
+    assert list(layout.x[:4]) == [0, 50, 100, 0]
+    assert layout.y(9) == 60
+
+
+def test_wide_word_gets_own_line():
+    # Act
+    layout = PassageLayout([30, 500, 30], line_width=100, line_height=10)
+    # Assert
+    assert list(layout.line) == [0, 1, 2]
+    assert PassageLayout([], line_width=100, line_height=10).height == 0
+
+
+def test_visible_words(layout):
+    # Act & Assert
+    assert layout.visible(0, 20) == (0, 3)
+    assert layout.visible(25, 45) == (3, 9)
+    assert layout.visible(70, 500) == (9, 10)
+    assert layout.visible(-40, -10) == (0, 0)
+    assert layout.visible(200, 300) == (10, 10)
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
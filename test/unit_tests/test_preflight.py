@@ -0,0 +1,88 @@
+""" Automated tests for the pre-flight check of the Speech Tasker.
+
+    Last edited: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import pytest
+import sys
+
+# Third party
+import numpy as np
+import pandas as pd
+
+# Custom
+sys.path.append("..")
+from models.preflight import check_trials
+
+############
+# Fixtures #
+############
+class FakeLevelIndex(dict):
+    """ Minimal LevelIndex stand-in backed by a dict. """
+    def clipping(self, names, levels, limit=1.0):
+        import numpy as np
+        peak = np.array([self[n]['peak'] for n in names])
+        rms = np.array([self[n]['rms'] for n in names])
+        return peak * 10 ** (np.asarray(levels) / 20) / rms > limit
+
+
+@pytest.fixture
+def level_index():
+    return FakeLevelIndex({
+        'a.wav': {'rms': 0.1, 'peak': 0.4, 'sr': 48000, 'channels': 1},
+        'b.wav': {'rms': 0.1, 'peak': 0.4, 'sr': 44100, 'channels': 2},
+    })
+
+##############
+# Unit Tests #
+##############
+def test_clean_matrix_passes(level_index):
+    # Arrange
+    trials = pd.DataFrame({
+        'file': ['a.wav', 'a.wav'], 'level': [60, 70], 'speaker': [1, 2]})
+    # Act
+    report = check_trials(trials, level_index, 2, 48000, slm_offset=100)
+    # Assert
+    assert report.ok
+
+
+def test_problems_are_reported(level_index):
+    # Arrange: 95 dB - 100 dB offset = -5 dB FS; peak 0.4 / rms 0.1 clips
+    trials = pd.DataFrame({
+        'file': ['a.wav', 'b.wav', 'c.wav'],
+        'level': [95, 60, 60],
+        'speaker': [1, 3, 1]
+    })
+    # Act
+    report = check_trials(trials, level_index, 2, 48000, slm_offset=100)
+    # Assert
+    assert not report.ok
+    assert report.problems['missing'] == ['c.wav']
+    assert report.problems['samplerate'] == ['b.wav (44100 Hz)']
+    assert report.problems['routing'] == ['Speaker 3']
+    assert report.problems['clipping'] == ['a.wav @ 95']
+
+
+def test_masker_peak_is_added_on_its_speaker(level_index):
+    # Arrange: 85 dB - 100 dB offset = -15 dB FS -> peak 0.71, which
+    # fits alone but not under a 0.4 peak masker
+    trials = pd.DataFrame({
+        'file': ['a.wav', 'a.wav'], 'level': [85, 85], 'speaker': [1, 2]})
+    masker = np.full((100, 1), 0.4)
+    # Act
+    quiet = check_trials(trials, level_index, 2, 48000, slm_offset=100)
+    noisy = check_trials(trials, level_index, 2, 48000, slm_offset=100,
+                         masker=masker, masker_routing=[2])
+    # Assert
+    assert quiet.ok
+    assert noisy.problems['clipping'] == ['a.wav @ 85']
+
+################
+# Module Guard #
+################
+if __name__ == '__main__':
+    pass
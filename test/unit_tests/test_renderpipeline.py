@@ -0,0 +1,86 @@
+""" Automated tests for the RenderPipeline of the Speech Tasker.
+
+    Last edited: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import pytest
+import sys
+
+# Third party
+import numpy as np
+import soundfile as sf
+
+# Custom
+sys.path.append("..")
+from models.renderpipeline import RenderError, RenderPipeline
+
+############
+# Fixtures #
+############
+@pytest.fixture
+def spec(tmp_path):
+    path = tmp_path / "tone.wav"
+    audio = 0.1 * np.sin(2 * np.pi * 1000 * np.arange(4800) / 48000)
+    sf.write(path, audio.astype('float32'), 48000, subtype='FLOAT')
+    rms = float(np.sqrt(np.mean(audio ** 2)))
+    return {
+        'kind': 'file',
+        'path': str(path),
+        'name': 'tone.wav',
+        'level': -20.0,
+        'routing': [2],
+        'stats': {'rms': rms, 'peak': 0.1},
+        'frames': 4800
+    }
+
+
+@pytest.fixture
+def pipeline():
+    pipeline = RenderPipeline(channels=2, depth=2)
+    yield pipeline
+    pipeline.close()
+
+
+def _level(buffer):
+    return 20 * np.log10(np.sqrt(np.mean(np.square(buffer))))
+
+##############
+# Unit Tests #
+##############
+def test_buffer_is_rendered_and_routed(pipeline, spec):
+    # Arrange
+    pipeline.schedule([(0, spec)])
+    # Act
+    buffer = pipeline.get(0, spec)
+    # Assert
+    assert buffer.shape == (4800, 2)
+    assert not buffer[:, 0].any()
+    assert _level(buffer[:, 1]) == pytest.approx(-20, abs=0.01)
+
+
+def test_invalidate_rerenders(pipeline, spec):
+    # Arrange
+    pipeline.get(0, spec)
+    # Act
+    pipeline.invalidate()
+    buffer = pipeline.get(0, dict(spec, level=-30.0))
+    # Assert
+    assert _level(buffer[:, 1]) == pytest.approx(-30, abs=0.01)
+
+
+def test_missing_file_raises(pipeline, spec):
+    # Arrange
+    spec['path'] = spec['path'] + '.missing'
+    # Act & Assert
+    with pytest.raises(RenderError):
+        pipeline.get(0, spec)
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
@@ -1,7 +1,7 @@
 """ Automated tests for the ScoreModel of the automated HINT. 
 
     Written by: Travis M. Moore
-    Last edited: May 10, 2024
+    Last edited: October 17, 2026
 """
 
 ###########
@@ -22,6 +22,19 @@ from models.scoremodel import ScoreModel
 def scoremodel():
     return ScoreModel()
 
+
+class Word:
+    """ Stands in for a word label and its checkbutton IntVar. """
+    def __init__(self, text, state=0):
+        self.text = text
+        self.state = state
+
+    def cget(self, option):
+        return self.text
+
+    def get(self):
+        return self.state
+
 ##############
 # Unit Tests #
 ##############
@@ -29,6 +42,46 @@ def test__init(scoremodel):
     # Assert
     assert scoremodel.outcome == None
 
+
+def test_score_widgets(scoremodel):
+    # Arrange
+    words = {0: Word("THE"), 1: Word("boy"), 2: Word("FELL")}
+    states = {0: Word("THE", 1), 2: Word("FELL", 0)}
+    # Act
+    resp = scoremodel.score(words=words, button_states=states)
+    # Assert
+    assert resp['correct'] == ['THE']
+    assert resp['incorrect'] == ['FELL']
+    assert resp['num_correct'] == 1
+    assert resp['total_words'] == 3
+    assert scoremodel.outcome == -1
+
+
+def test_score_words_all_correct(scoremodel):
+    # Act
+    resp = scoremodel.score_words(
+        words=["THE", "boy", "FELL"], marked={0, 2})
+    # Assert
+    assert resp['correct'] == ['THE', 'FELL']
+    assert resp['incorrect'] == []
+    assert resp['key_words'] == [(0, 'THE', True), (2, 'FELL', True)]
+    assert resp['total_words'] == 3
+    assert scoremodel.outcome == 1
+
+
+def test_score_words_matches_score(scoremodel):
+    # Arrange
+    sentence = "a BIG dog RAN after THE cat".split()
+    marked = {1, 5}
+    words = {ii: Word(w) for ii, w in enumerate(sentence)}
+    states = {ii: Word(w, int(ii in marked))
+              for ii, w in enumerate(sentence) if w == w.upper()}
+    # Act
+    from_widgets = scoremodel.score(words=words, button_states=states)
+    from_data = scoremodel.score_words(words=sentence, marked=marked)
+    # Assert
+    assert from_widgets == from_data
+
 ################
 # Module Guard #
 ################
@@ -0,0 +1,112 @@
+""" Automated tests for the headless SessionEngine of the Speech Tasker.
+
+    Last edited: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import csv
+import pytest
+import sys
+
+# Third party
+import pandas as pd
+
+# Custom
+sys.path.append("..")
+from models.sessionengine import SessionEngine
+from models.sessionjournal import SessionJournal, read_journal
+from models.sessionwriter import SessionWriter
+
+############
+# Fixtures #
+############
+@pytest.fixture
+def trials():
+    return pd.DataFrame({
+        'file': ['a.wav', 'b.wav', 'c.wav'],
+        'sentence': ['THE boy FELL', 'a BIG dog', 'SHE sang'],
+        'list_num': [1, 1, 2],
+        'sentence_num': [1, 2, 1],
+        'level': [65.0, 70.0, 75.0],
+        'speaker': [1, 2, 1]
+    })
+
+
+@pytest.fixture
+def settings():
+    return {'Subject': 'S1', 'Condition': 'quiet', 'desired_level_dB': 0}
+
+##############
+# Unit Tests #
+##############
+def test_scores_and_saves_trials(tmp_path, trials, settings):
+    # Arrange
+    writer = SessionWriter(tmp_path / 'data.csv')
+    journal = SessionJournal(tmp_path / 'data.journal')
+    engine = SessionEngine(trials, settings=settings, writer=writer,
+                           journal=journal, slm_offset=100.0)
+    engine.start(filename='data.csv')
+    # Act
+    first = engine.next()['file']
+    resp = engine.score(marked={0, 2}, timing={'playback_start': 1.5})
+    engine.next()
+    engine.score(marked=set())
+    writer.close()
+    journal.close()
+    # Assert
+    assert first == 'a.wav'
+    assert resp['correct'] == ['THE', 'FELL']
+    assert engine.scorer.outcome == -1
+    assert engine.level_data == [65.0, 70.0]
+    assert engine.presentation_level(2) == -25.0
+    with open(tmp_path / 'data.csv', newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert [row['trial'] for row in rows] == ['1', '2']
+    assert rows[0]['Subject'] == 'S1'
+    assert rows[0]['desired_level_dB'] == '65.0'
+    assert rows[0]['num_correct'] == '2'
+    assert rows[0]['playback_start'] == '1.5'
+    assert rows[1]['incorrect'] == "['BIG']"
+    assert len(read_journal(tmp_path / 'data.journal')['scored']) == 2
+
+
+def test_score_requires_presented_trial(trials):
+    # Arrange
+    engine = SessionEngine(trials)
+    # Act & Assert
+    with pytest.raises(RuntimeError):
+        engine.score(marked=set())
+    engine.next()
+    engine.score(marked=set())
+    with pytest.raises(RuntimeError):
+        engine.score(marked=set())
+
+
+def test_run_and_resume(tmp_path, trials, settings):
+    # Arrange
+    path = tmp_path / 'data.journal'
+    journal = SessionJournal(path)
+    engine = SessionEngine(trials, settings=settings, journal=journal)
+    engine.start(filename='data.csv')
+    # Act
+    scored = engine.run(lambda trial: {0}, limit=2)
+    journal.close()
+    resumed = SessionEngine.from_journal(read_journal(path))
+    remaining = resumed.run(lambda trial: {0})
+    # Assert
+    assert scored == 2
+    assert remaining == 1
+    assert resumed.level_data == [65.0, 70.0, 75.0]
+    assert resumed.trial['file'] == 'c.wav'
+    assert [r['row']['trial'] for r in read_journal(path)['scored']] \
+        == [1, 2]
+    assert resumed.next() is None
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,82 @@
+""" Automated tests for the SessionJournal of the Speech Tasker.
+
+    Last edited: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import pytest
+import sys
+
+# Third party
+import numpy as np
+import pandas as pd
+
+# Custom
+sys.path.append("..")
+from models.sessionjournal import SessionJournal, read_journal
+
+############
+# Fixtures #
+############
+@pytest.fixture
+def journal_file(tmp_path):
+    path = tmp_path / 'session.journal'
+    trials = pd.DataFrame({
+        'file': ['b.wav', 'a.wav', 'c.wav'],
+        'level': np.array([65, 70, 75]),
+        'speaker': np.array([1, 2, 1])
+    })
+    journal = SessionJournal(path)
+    journal.start('S1_test_.csv', trials, {'Subject': 'S1'}, seed=7)
+    journal.calibration(slm_offset=100.0)
+    journal.trial(1, {'trial': 1, 'desired_level_dB': np.float64(65)})
+    journal.calibration(slm_offset=98.5)
+    journal.close()
+    return path
+
+##############
+# Unit Tests #
+##############
+def test_state_is_rebuilt(journal_file):
+    # Act
+    state = read_journal(journal_file)
+    # Assert
+    assert list(state['trials']['file']) == ['b.wav', 'a.wav', 'c.wav']
+    assert state['seed'] == 7
+    assert state['calibration'] == {'slm_offset': 98.5}
+    assert [t['trial_num'] for t in state['scored']] == [1]
+    assert not state['complete']
+
+
+def test_torn_last_line_is_ignored(journal_file):
+    # Arrange: a crash in the middle of a write
+    with open(journal_file, 'a') as f:
+        f.write('{"event": "trial", "trial_n')
+    # Act
+    state = read_journal(journal_file)
+    # Assert
+    assert len(state['scored']) == 1
+
+
+def test_resumed_journal_appends(journal_file):
+    # Arrange: resume after a crash in the middle of a write
+    with open(journal_file, 'a') as f:
+        f.write('{"event": "trial", "trial_n')
+    journal = SessionJournal(journal_file)
+    # Act
+    journal.trial(2, {'trial': 2})
+    journal.end()
+    journal.close()
+    state = read_journal(journal_file)
+    # Assert
+    assert len(state['scored']) == 2
+    assert state['complete']
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,111 @@
+""" Automated tests for the SQLite SessionStore of the Speech Tasker.
+
+    Last edited: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import csv
+import pytest
+import sqlite3
+import sys
+
+# Custom
+sys.path.append("..")
+from models.sessionstore import SessionStore, export_csv, find_sessions
+
+############
+# Fixtures #
+############
+@pytest.fixture
+def database(tmp_path):
+    path = tmp_path / 'sessions.db'
+    for subject, condition in [('S1', 'quiet'), ('S2', 'quiet'), ('S1', 'noise')]:
+        store = SessionStore(path, subject, condition)
+        for ii in range(1, 3):
+            store.write({
+                'trial': ii,
+                'file': f'{ii}.wav',
+                'list_num': 1,
+                'correct': ['THE', 'DOG'],
+                'incorrect': ['RAN'],
+                'key_words': [(0, 'THE', True), (2, 'DOG', True),
+                              (3, 'RAN', False)],
+                'num_correct': 2,
+                'total_words': 3
+            })
+        store.close()
+    return path
+
+##############
+# Unit Tests #
+##############
+def test_database_uses_wal(database):
+    # Act
+    conn = sqlite3.connect(database)
+    mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    conn.close()
+    # Assert
+    assert mode == 'wal'
+
+
+def test_find_sessions_by_subject(database):
+    # Act
+    sessions = find_sessions(database, subject='S1')
+    # Assert
+    assert [s['condition'] for s in sessions] == ['quiet', 'noise']
+
+
+def test_export_matches_csv_layout(database, tmp_path):
+    # Arrange
+    out = tmp_path / 'export.csv'
+    # Act
+    count = export_csv(database, out, subject='S1', condition='noise')
+    # Assert
+    with open(out, newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert count == 2
+    assert rows[0]['Subject'] == 'S1'
+    assert rows[0]['correct'] == "['THE', 'DOG']"
+    assert rows[0]['incorrect'] == "['RAN']"
+
+
+def test_words_keep_sentence_positions(database):
+    # Act
+    conn = sqlite3.connect(database)
+    words = conn.execute(
+        "SELECT position, word, correct FROM words WHERE trial_id = 1 "
+        "ORDER BY position").fetchall()
+    conn.close()
+    # Assert
+    assert words == [(0, 'THE', 1), (2, 'DOG', 1), (3, 'RAN', 0)]
+
+
+def test_resume_appends_to_session(tmp_path):
+    # Arrange
+    path = tmp_path / 'sessions.db'
+    first = SessionStore(path, 'S1', 'quiet', data_file='S1.csv')
+    first.write({'trial': 1})
+    first.close()
+    # Act
+    resumed = SessionStore(path, 'S1', 'quiet', data_file='S1.csv',
+                           resume=True)
+    resumed.write({'trial': 2})
+    resumed.close()
+    # Assert
+    sessions = find_sessions(path)
+    conn = sqlite3.connect(path)
+    trials = conn.execute(
+        "SELECT session_id, trial FROM trials ORDER BY trial").fetchall()
+    conn.close()
+    assert len(sessions) == 1
+    assert resumed.session_id == first.session_id
+    assert trials == [(first.session_id, 1), (first.session_id, 2)]
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,80 @@
+""" Automated tests for the SessionWriter of the Speech Tasker.
+
+    Last edited: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import csv
+import pytest
+import sys
+
+# Custom
+sys.path.append("..")
+from models.sessionwriter import SessionWriter
+
+############
+# Fixtures #
+############
+@pytest.fixture
+def columns():
+    return ['trial', 'Subject', 'num_correct']
+
+##############
+# Unit Tests #
+##############
+def test_rows_are_appended_in_column_order(tmp_path, columns):
+    # Arrange
+    path = tmp_path / 'Data' / 'session.csv'
+    writer = SessionWriter(path, columns)
+    # Act
+    for ii in range(1, 4):
+        writer.write({'num_correct': ii, 'trial': ii, 'Subject': 'S1', 'x': 0})
+    writer.close()
+    # Assert
+    with open(path, newline='') as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == columns
+    assert rows[1:] == [[str(ii), 'S1', str(ii)] for ii in range(1, 4)]
+    assert writer.stats['rows'] == 3
+
+
+def test_reopen_does_not_repeat_header(tmp_path, columns):
+    # Arrange
+    path = tmp_path / 'session.csv'
+    # Act: two sessions writing to the same file
+    for ii in range(2):
+        writer = SessionWriter(path, columns)
+        writer.write({'trial': ii})
+        writer.close()
+    # Assert
+    with open(path, newline='') as f:
+        rows = list(csv.reader(f))
+    assert len(rows) == 3
+
+
+def test_open_failure_is_raised(tmp_path, columns):
+    # Arrange: a directory cannot be opened as the data file
+    path = tmp_path / 'session.csv'
+    path.mkdir()
+    # Act & Assert
+    with pytest.raises(OSError):
+        SessionWriter(path, columns)
+
+
+def test_unexpected_open_error_is_raised(tmp_path, columns):
+    # Arrange: an error other than OSError must not hang __init__
+    class BrokenWriter(SessionWriter):
+        def _open(self):
+            raise TypeError("bad columns")
+    # Act & Assert
+    with pytest.raises(TypeError):
+        BrokenWriter(tmp_path / 'session.csv', columns)
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
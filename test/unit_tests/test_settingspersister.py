@@ -0,0 +1,120 @@
+""" Automated tests for the SettingsPersister of the Speech Tasker.
+
+    Last edited: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import pytest
+import sys
+
+# Custom
+sys.path.append("..")
+from models.settingspersister import SettingsPersister
+
+############
+# Fixtures #
+############
+class FakeVar:
+    """ Minimal Tk variable stand-in with write traces. """
+    def __init__(self, value):
+        self.value = value
+        self.traces = []
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+        for callback in self.traces:
+            callback('name', '', 'write')
+
+    def trace_add(self, mode, callback):
+        self.traces.append(callback)
+
+
+class FakeRoot:
+    """ Runs scheduled callbacks on demand instead of a Tk loop. """
+    def __init__(self):
+        self.pending = {}
+
+    def after(self, ms, func):
+        self.pending[len(self.pending) + 1] = func
+        return len(self.pending)
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def run_pending(self):
+        pending, self.pending = self.pending, {}
+        for func in pending.values():
+            func()
+
+
+class FakeSettingsModel:
+    def __init__(self):
+        self.values = {}
+        self.saves = 0
+
+    def set(self, key, value):
+        self.values[key] = value
+
+    def save(self):
+        self.saves += 1
+
+
+@pytest.fixture
+def setup():
+    root = FakeRoot()
+    settings = {'level': FakeVar(65.0), 'Subject': FakeVar('999')}
+    model = FakeSettingsModel()
+    persister = SettingsPersister(root, settings, model)
+    return root, settings, model, persister
+
+##############
+# Unit Tests #
+##############
+def test_requests_are_coalesced(setup):
+    # Arrange
+    root, settings, model, persister = setup
+    # Act: a burst of per-trial changes
+    for level in (70.0, 75.0, 80.0):
+        settings['level'].set(level)
+        persister.request_save()
+    root.run_pending()
+    # Assert
+    assert model.saves == 1
+    assert model.values == {'level': 80.0}
+    assert persister.stats['avoided'] == 2
+
+
+def test_unchanged_values_are_not_written(setup):
+    # Arrange
+    root, settings, model, persister = setup
+    # Act: set to the value already saved
+    settings['Subject'].set('999')
+    persister.flush()
+    # Assert
+    assert model.saves == 0
+    assert persister.stats['avoided'] == 1
+
+
+def test_flush_cancels_pending_write(setup):
+    # Arrange
+    root, settings, model, persister = setup
+    settings['level'].set(70.0)
+    persister.request_save()
+    # Act
+    persister.flush()
+    root.run_pending()
+    # Assert
+    assert model.saves == 1
+    assert not persister.stats['pending']
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
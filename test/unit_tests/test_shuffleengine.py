@@ -0,0 +1,123 @@
+""" Automated tests for the constrained shuffle engine of the Speech Tasker.
+
+    Last edited: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import pytest
+import sys
+
+# Third party
+import numpy as np
+import pandas as pd
+
+# Custom
+sys.path.append("..")
+from models.matrixengine import build_matrix
+from models.shuffleengine import BalancedBlocks
+from models.shuffleengine import MaxRun
+from models.shuffleengine import constrained_order
+from models.shuffleengine import parse_constraints
+from models.shuffleengine import shuffle_frame
+
+############
+# Fixtures #
+############
+@pytest.fixture
+def trials():
+    n = 2400
+    return pd.DataFrame({
+        'file': [f"{ii}.wav" for ii in range(n)],
+        'list_num': np.repeat(np.arange(n // 20), 20),
+        'speaker': np.tile([1, 2, 3], n // 3),
+        'level': np.tile([60, 65, 70, 75], n // 4)
+    })
+
+
+def longest_run(values):
+    """ Return the longest run of equal consecutive values. """
+    breaks = np.flatnonzero(np.diff(values)) + 1
+    return max(len(run) for run in np.split(values, breaks))
+
+##############
+# Unit Tests #
+##############
+def test_parse_constraints():
+    # Act
+    constraints = parse_constraints(
+        "max_run speaker 2; no_repeat list_num;balance level 8; ")
+    # Assert
+    assert [repr(c) for c in constraints] == [
+        'max_run speaker 2', 'max_run list_num 1', 'balance level 8']
+    with pytest.raises(ValueError):
+        parse_constraints("max_run speaker")
+    with pytest.raises(ValueError):
+        parse_constraints("balance level zero")
+
+
+def test_constraints_are_satisfied(trials):
+    # Arrange
+    constraints = [MaxRun('speaker', 2), MaxRun('list_num', 1),
+                   BalancedBlocks('level', 8)]
+    # Act
+    shuffled = shuffle_frame(trials, constraints, seed=3)
+    # Assert
+    assert sorted(shuffled['file']) == sorted(trials['file'])
+    assert longest_run(shuffled['speaker'].to_numpy()) <= 2
+    assert longest_run(shuffled['list_num'].to_numpy()) == 1
+    for start in range(0, len(shuffled), 8):
+        block = shuffled['level'].iloc[start:start + 8]
+        assert block.value_counts().max() == 2
+    assert set(shuffled['seed']) == {3}
+
+
+def test_same_seed_same_order(trials):
+    # Arrange
+    constraints = parse_constraints("no_repeat speaker")
+    columns = {'speaker': trials['speaker'].to_numpy()}
+    # Act
+    first, seed = constrained_order(len(trials), columns, constraints)
+    second, _ = constrained_order(len(trials), columns, constraints, seed)
+    third, _ = constrained_order(len(trials), columns, constraints, seed + 1)
+    # Assert
+    assert list(first) == list(second)
+    assert list(first) != list(third)
+
+
+def test_unsatisfiable_constraints_raise(trials):
+    # Arrange
+    columns = {'speaker': np.array([1, 1, 1, 2])}
+    # Act & Assert
+    with pytest.raises(ValueError):
+        constrained_order(4, columns, [MaxRun('speaker', 1)], seed=1)
+    with pytest.raises(ValueError):
+        shuffle_frame(trials, [MaxRun('talker', 1)], seed=1)
+
+
+def test_build_matrix_records_seed():
+    # Arrange
+    corpus = pd.DataFrame({
+        'list_num': [1, 1, 1, 2, 2, 2],
+        'sentence_num': [1, 2, 3, 1, 2, 3],
+        'sentence': [f"SENTENCE {ii}" for ii in range(6)],
+        'file': [f"{ii}.wav" for ii in range(6)]
+    })
+    pars = {'lists': [1, 2], 'sentences_per_list': 3, 'levels': [60],
+            'speakers': [1, 2], 'presentations': 2, 'randomize': 1,
+            'constraints': [MaxRun('list_num', 1)]}
+    # Act
+    matrix = build_matrix(corpus, seed=11, **pars)
+    again = build_matrix(corpus, seed=11, **pars)
+    # Assert
+    pd.testing.assert_frame_equal(matrix, again)
+    assert longest_run(matrix['list_num'].to_numpy()) == 1
+    assert set(matrix['seed']) == {11}
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
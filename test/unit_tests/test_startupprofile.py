@@ -0,0 +1,56 @@
+""" Automated tests for startup profiling and lazy model imports of
+    the Speech Tasker.
+
+    Last edited: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import subprocess
+import sys
+from pathlib import Path
+
+# Custom
+sys.path.append("..")
+from models.startupprofile import StartupProfile
+
+##############
+# Unit Tests #
+##############
+def test_phases_are_consecutive():
+    # Arrange
+    profile = StartupProfile(start=0.0)
+    # Act
+    profile.mark('tmpy imports', at=0.25)
+    profile.mark('imports')
+    profile.mark('settings')
+    report = profile.report()
+    # Assert
+    assert [phase for phase, _ in profile.phases] == [
+        'tmpy imports', 'imports', 'settings']
+    assert profile.phases[0][1] == 0.25
+    assert abs(sum(s for _, s in profile.phases) - profile.total) < 1e-9
+    assert report.splitlines()[1].startswith('tmpy imports')
+    assert report.splitlines()[-1].startswith('total')
+
+
+def test_models_import_lazily():
+    # Arrange
+    code = ("import sys, models; "
+            "print('pandas' in sys.modules, 'sounddevice' in sys.modules); "
+            "models.TrialTable; "
+            "print('pandas' in sys.modules)")
+    root = Path(__file__).resolve().parents[2]
+    # Act
+    result = subprocess.run([sys.executable, '-c', code], cwd=root,
+                            capture_output=True, text=True, check=True)
+    # Assert
+    assert result.stdout.split() == ['False', 'False', 'True']
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,64 @@
+""" Automated tests for the StimulusBundle of the Speech Tasker.
+
+    Last edited: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import pytest
+import sys
+
+# Third party
+import numpy as np
+import soundfile as sf
+
+# Custom
+sys.path.append("..")
+from models.stimulusbundle import StimulusBundle, is_bundle, pack_directory
+
+############
+# Fixtures #
+############
+@pytest.fixture
+def bundle(tmp_path):
+    stim_dir = tmp_path / "stimuli"
+    (stim_dir / "list_1").mkdir(parents=True)
+    sf.write(stim_dir / "list_1" / "mono.wav",
+             np.linspace(-0.5, 0.5, 100), 16000, subtype='FLOAT')
+    sf.write(stim_dir / "stereo.wav",
+             np.full((50, 2), 0.25), 44100, subtype='FLOAT')
+    bundle_path = tmp_path / "stimuli.stb"
+    pack_directory(stim_dir, bundle_path)
+    return StimulusBundle(bundle_path)
+
+##############
+# Unit Tests #
+##############
+def test_is_bundle(bundle, tmp_path):
+    assert is_bundle(bundle.path)
+    assert not is_bundle(tmp_path / "stimuli")
+
+
+def test_round_trip(bundle):
+    # Act
+    mono, mono_fs = bundle.get("list_1\\mono.wav")
+    stereo, stereo_fs = bundle.get("stereo.wav")
+    # Assert
+    assert mono_fs == 16000 and stereo_fs == 44100
+    assert mono.shape == (100,) and stereo.shape == (50, 2)
+    assert np.allclose(mono, np.linspace(-0.5, 0.5, 100))
+    assert bundle.info("stereo.wav")['rms'] == pytest.approx(0.25)
+    assert not mono.flags.writeable
+
+
+def test_missing_name(bundle):
+    with pytest.raises(FileNotFoundError):
+        bundle.get("missing.wav")
+
+################
+# Module Guard #
+################
+if __name__ == '__main__':
+    pass
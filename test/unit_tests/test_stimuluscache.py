@@ -0,0 +1,71 @@
+""" Automated tests for the StimulusCache of the Speech Tasker.
+
+    Last edited: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import pytest
+import sys
+
+# Third party
+import numpy as np
+import soundfile as sf
+
+# Custom
+sys.path.append("..")
+from models.stimuluscache import StimulusCache
+
+############
+# Fixtures #
+############
+@pytest.fixture
+def wav_files(tmp_path):
+    paths = []
+    for ii in range(3):
+        path = tmp_path / f"stim_{ii}.wav"
+        sf.write(path, np.zeros(1000, dtype='float32'), 16000)
+        paths.append(path)
+    return paths
+
+##############
+# Unit Tests #
+##############
+def test_repeat_is_hit(wav_files):
+    # Arrange
+    cache = StimulusCache()
+    # Act
+    first, fs = cache.get(wav_files[0])
+    second, _ = cache.get(wav_files[0])
+    # Assert
+    assert fs == 16000
+    assert first is second
+    assert cache.stats['hits'] == 1
+    assert cache.stats['misses'] == 1
+
+
+def test_lru_eviction(wav_files):
+    # Arrange: room for two 1000-sample float32 files
+    cache = StimulusCache(max_bytes=8000)
+    # Act
+    cache.get(wav_files[0])
+    cache.get(wav_files[1])
+    cache.get(wav_files[0])
+    cache.get(wav_files[2])
+    # Assert: file 1 was least recently used
+    assert cache.stats['evictions'] == 1
+    cache.get(wav_files[0])
+    assert cache.stats['hits'] == 2
+
+
+def test_missing_file():
+    with pytest.raises(FileNotFoundError):
+        StimulusCache().get("does_not_exist.wav")
+
+################
+# Module Guard #
+################
+if __name__ == '__main__':
+    pass
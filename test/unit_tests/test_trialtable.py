@@ -0,0 +1,92 @@
+""" Automated tests for the array-backed trial table of the Speech Tasker.
+
+    Last edited: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import pytest
+import sys
+
+# Third party
+import numpy as np
+import pandas as pd
+
+# Custom
+sys.path.append("..")
+from models.trialtable import TrialTable
+
+############
+# Fixtures #
+############
+@pytest.fixture
+def trials():
+    n = 40
+    return pd.DataFrame({
+        'file': [f"{ii % 10}.wav" for ii in range(n)],
+        'sentence': [f"THE boy FELL {ii % 10}" for ii in range(n)],
+        'list_num': np.repeat([1, 2], n // 2),
+        'level': np.tile([60.0, 65.5], n // 2),
+        'speaker': np.tile([1, 2, 3, 4], n // 4),
+        'onset': np.arange(n) * 0.5
+    })
+
+##############
+# Unit Tests #
+##############
+def test_cursor_matches_dataframe(trials):
+    # Arrange
+    table = TrialTable(trials)
+    # Act
+    rows = []
+    while True:
+        try:
+            table.next()
+        except IndexError:
+            break
+        rows.append(dict(table.trial_info))
+    # Assert
+    assert rows == trials.to_dict('records')
+    assert table.trial_num == len(trials)
+    assert type(rows[0]['speaker']) is int
+    assert type(rows[0]['level']) is float
+
+
+def test_field_access(trials):
+    # Arrange
+    table = TrialTable(trials)
+    # Act & Assert
+    with pytest.raises(IndexError):
+        table.trial_info['file']
+    table.next()
+    table.next()
+    assert table.trial_num == 2
+    assert table.trial_info['sentence'] == "THE boy FELL 1"
+    assert 'speaker' in table.trial_info
+    assert 'correct' not in table.trial_info
+    assert table.value('onset', 39) == 19.5
+    with pytest.raises(KeyError):
+        table.value('missing', 0)
+
+
+def test_uses_less_memory_than_dataframe():
+    # Arrange
+    n = 100000
+    trials = pd.DataFrame({
+        'file': [f"list_{ii % 250}_sentence.wav" for ii in range(n)],
+        'sentence': [f"A LONG sentence NUMBER {ii % 250}" for ii in range(n)],
+        'level': np.tile([60.0, 65.0, 70.0], n // 3 + 1)[:n],
+        'speaker': np.tile([1, 2], n // 2)
+    })
+    # Act
+    table = TrialTable(trials)
+    # Assert
+    assert table.nbytes * 10 < trials.memory_usage(deep=True).sum()
+
+################
+# Module Guard #
+################
+if __name__ == "__main__":
+    pass
@@ -1,5 +1,8 @@
 """ Imports. """
 
+import importlib
+from typing import TYPE_CHECKING
+
 from views.mainview import (
     MainView,
 )
@@ -9,19 +12,24 @@ __all__ = [
 ]
 
 
-from views.createview import (
-    CreateView
-)
+# Never run, but lets PyInstaller and IDEs see the lazy imports
+if TYPE_CHECKING:
+    from views.createview import CreateView
+    from views.importview import ImportView
 
-__all__ += [
-    'CreateView'
-]
+# Dialog views are imported when first opened (see __getattr__)
+_DIALOGS = {
+    'CreateView': 'views.createview',
+    'ImportView': 'views.importview'
+}
 
+__all__ += list(_DIALOGS)
 
-from views.importview import (
-    ImportView
-)
 
-__all__ += [
-    'ImportView'
-]
+def __getattr__(name):
+    """ Import a dialog view the first time it is used. """
+    if name not in _DIALOGS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_DIALOGS[name]), name)
+    globals()[name] = value
+    return value
@@ -87,6 +87,9 @@ class CreateView(tk.Toplevel):
         # Sentence file browser
         lfrm_sentencepath = ttk.Labelframe(lfrm_path, text="Sentence CSV File")
         lfrm_sentencepath.grid(row=10, column=5, **frame_options)
+        # Masker file browser
+        lfrm_maskerpath = ttk.Labelframe(lfrm_path, text="Masker File")
+        lfrm_maskerpath.grid(row=15, column=5, **frame_options)
 
         ###################
         # Session Widgets #
@@ -112,6 +115,21 @@ class CreateView(tk.Toplevel):
                 + "\nSeparate words with underscores."
         ).grid(row=5, column=10, padx=5, pady=(5,0))
 
+        # Data backend
+        w.LabelInput(
+            lfrm_session,
+            label="Save to Database",
+            var=self.settings['data_backend'],
+            input_class=ttk.Checkbutton,
+            input_args={
+                'onvalue': 'sqlite',
+                'offvalue': 'csv',
+                'takefocus': 0
+            },
+            tool_tip="Write trials to the session database instead "
+                + "of a CSV file per session."
+        ).grid(row=5, column=15, padx=5, pady=(5,0), sticky='n')
+
         ####################
         # Sentence Widgets #
         ####################
@@ -184,6 +202,27 @@ class CreateView(tk.Toplevel):
             tool_tip="Randomize trials in provided matrix file."
         ).grid(row=15, column=10, padx=5, pady=(5,0), sticky='n')
 
+        # Seed
+        w.LabelInput(
+            lfrm_sentence,
+            label="Seed",
+            var=self.settings['Seed'],
+            input_class=ttk.Entry,
+            tool_tip="Whole number to reproduce a randomized order."
+                + "\nLeave blank for a new order each time."
+        ).grid(row=20, column=5, padx=5, pady=(5,0))
+
+        # Constraints
+        w.LabelInput(
+            lfrm_sentence,
+            label="Constraints",
+            var=self.settings['Constraints'],
+            input_class=ttk.Entry,
+            tool_tip="Optional rules for randomized orders, separated by "
+                + "semicolons, e.g.:"
+                + "\nmax_run speaker 2; no_repeat list_num; balance level 8"
+        ).grid(row=20, column=10, padx=5, pady=(5,0))
+
         #################
         # Noise Widgets #
         #################
@@ -196,6 +235,26 @@ class CreateView(tk.Toplevel):
             tool_tip="Level of the noise."
         ).grid(row=5, column=5, padx=5, pady=(5,0), sticky='n')
 
+        # Noise speaker(s)
+        w.LabelInput(
+            lfrm_noise,
+            label="Speaker(s)",
+            var=self.settings['Noise Speakers'],
+            input_class=w.RequiredEntry,
+            tool_tip="Speaker for each channel of the masker file."
+                + "\nSeparate multiple values with a comma and space: 1, 2, 3"
+        ).grid(row=5, column=10, padx=5, pady=(5,0), sticky='n')
+
+        # Present noise
+        w.LabelInput(
+            lfrm_noise,
+            label="Present Noise",
+            var=self.settings['Present Noise'],
+            input_class=ttk.Checkbutton,
+            input_args={'takefocus': 0},
+            tool_tip="Loop the masker file continuously during the session."
+        ).grid(row=5, column=15, padx=5, pady=(5,0), sticky='n')
+
         #####################
         # File Path Widgets #
         #####################
@@ -208,6 +267,16 @@ class CreateView(tk.Toplevel):
             tool_tip="Path to folder with audio files."
         ).grid(row=5, column=5)
 
+        # Packed stimulus bundle (alternative to a folder)
+        w.AskPathGroup(
+            parent=lfrm_audiopath,
+            var=self.settings['import_audio_path'],
+            title_args={'text': 'Stimulus Bundle'},
+            type='file',
+            tool_tip="Path to a packed stimulus bundle (*.stb)."
+                + "\nUse instead of a folder of audio files."
+        ).grid(row=10, column=5)
+
         # Matrix file path
         w.AskPathGroup(
             parent=lfrm_sentencepath,
@@ -217,6 +286,15 @@ class CreateView(tk.Toplevel):
             tool_tip="Path to CSV file containing sentences."
         ).grid(row=10, column=5)
 
+        # Masker file path
+        w.AskPathGroup(
+            parent=lfrm_maskerpath,
+            var=self.settings['masker_file_path'],
+            title_args={'text': 'Masker File'},
+            type='file',
+            tool_tip="Path to the audio file to loop as a masker."
+        ).grid(row=15, column=5)
+
         #################
         # Submit button #
         #################
@@ -90,6 +90,9 @@ class ImportView(tk.Toplevel):
         # Matrix file browser
         lfrm_matrixpath = ttk.Labelframe(lfrm_path, text='Matrix File Path')
         lfrm_matrixpath.grid(row=10, column=5, **frame_options)
+        # Masker file browser
+        lfrm_maskerpath = ttk.Labelframe(lfrm_path, text='Masker File Path')
+        lfrm_maskerpath.grid(row=15, column=5, **frame_options)
 
         ###################
         # Session Widgets #
@@ -115,6 +118,21 @@ class ImportView(tk.Toplevel):
                 + "\nSeparate words with underscores."
         ).grid(row=5, column=10, **widget_options)
 
+        # Data backend
+        w.LabelInput(
+            lfrm_session,
+            label="Save to Database",
+            var=self.settings['data_backend'],
+            input_class=ttk.Checkbutton,
+            input_args={
+                'onvalue': 'sqlite',
+                'offvalue': 'csv',
+                'takefocus': 0
+            },
+            tool_tip="Write trials to the session database instead "
+                + "of a CSV file per session."
+        ).grid(row=5, column=15, **widget_options, sticky='n')
+
         ###########################
         # Stimulus Option Widgets #
         ###########################
@@ -137,6 +155,27 @@ class ImportView(tk.Toplevel):
             tool_tip="Randomize trials in provided matrix file."
         ).grid(row=5, column=10, **widget_options, sticky='n')
 
+        # Seed
+        w.LabelInput(
+            lfrm_stimulus,
+            label="Seed",
+            var=self.settings['Seed'],
+            input_class=ttk.Entry,
+            tool_tip="Whole number to reproduce a randomized order."
+                + "\nLeave blank for a new order each time."
+        ).grid(row=10, column=5, **widget_options)
+
+        # Constraints
+        w.LabelInput(
+            lfrm_stimulus,
+            label="Constraints",
+            var=self.settings['Constraints'],
+            input_class=ttk.Entry,
+            tool_tip="Optional rules for randomized orders, separated by "
+                + "semicolons, e.g.:"
+                + "\nmax_run speaker 2; no_repeat list_num; balance level 8"
+        ).grid(row=10, column=10, **widget_options)
+
         #################
         # Noise Widgets #
         #################
@@ -149,6 +188,26 @@ class ImportView(tk.Toplevel):
             tool_tip="Level of the noise."
         ).grid(row=5, column=5, **widget_options, sticky='n')
 
+        # Noise speaker(s)
+        w.LabelInput(
+            lfrm_noise,
+            label="Speaker(s)",
+            var=self.settings['Noise Speakers'],
+            input_class=w.RequiredEntry,
+            tool_tip="Speaker for each channel of the masker file."
+                + "\nSeparate multiple values with a comma and space: 1, 2, 3"
+        ).grid(row=5, column=10, **widget_options, sticky='n')
+
+        # Present noise
+        w.LabelInput(
+            lfrm_noise,
+            label="Present Noise",
+            var=self.settings['Present Noise'],
+            input_class=ttk.Checkbutton,
+            input_args={'takefocus': 0},
+            tool_tip="Loop the masker file continuously during the session."
+        ).grid(row=5, column=15, **widget_options, sticky='n')
+
         #####################
         # File Path Widgets #
         #####################
@@ -163,6 +222,16 @@ class ImportView(tk.Toplevel):
             tool_tip="Path to folder with audio files."
         ).grid(row=5, column=5)
 
+        # Packed stimulus bundle (alternative to a folder)
+        w.AskPathGroup(
+            parent=lfrm_audiopath,
+            var=self.settings['import_audio_path'],
+            title_args={'text': 'Stimulus Bundle'},
+            type='file',
+            tool_tip="Path to a packed stimulus bundle (*.stb)."
+                + "\nUse instead of a folder of audio files."
+        ).grid(row=10, column=5)
+
         # Matrix file path
         w.AskPathGroup(
             parent=lfrm_matrixpath,
@@ -172,6 +241,15 @@ class ImportView(tk.Toplevel):
             tool_tip="Path to the matrix file."
         ).grid(row=5, column=5)
 
+        # Masker file path
+        w.AskPathGroup(
+            parent=lfrm_maskerpath,
+            var=self.settings['masker_file_path'],
+            title_args={'text': 'Masker File'},
+            type='file',
+            tool_tip="Path to the audio file to loop as a masker."
+        ).grid(row=5, column=5)
+
         # Save matrix file to CSV
         w.LabelInput(
             lfrm_matrixpath,
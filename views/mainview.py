@@ -12,12 +12,72 @@ import logging
 import tkinter as tk
 from tkinter import ttk
 
+# Custom
+from views.passageview import PassageView
+
 ##########
 # Logger #
 ##########
 # Create new logger
 logger = logging.getLogger(__name__)
 
+#############
+# Constants #
+#############
+SENTENCE_HEIGHT = 90    # Sentence frame height (px)
+PASSAGE_HEIGHT = 240    # Sentence frame height for passages (px)
+
+############
+# WordCell #
+############
+class WordCell:
+    """ A pooled word label with the checkbutton below it. """
+
+    __slots__ = ('label', 'button', 'var', 'word', 'keyword', '_shown')
+
+    def __init__(self, parent, column):
+        self.var = tk.IntVar(value=0)
+        self.label = ttk.Label(parent, text="")
+        self.label.grid(row=5, column=column)
+        self.button = ttk.Checkbutton(
+            parent,
+            text="",
+            takefocus=0,
+            variable=self.var
+            )
+        self.button.grid(row=10, column=column)
+        self.button.grid_remove()
+        self.word = ""
+        self.keyword = False
+        self._shown = True
+
+    def show(self, word, keyword):
+        """ Display a word, with a cleared checkbutton if it is a
+        key word. Only changed options are sent to Tk.
+        """
+        if self.word != word:
+            self.label.configure(text=word)
+            self.word = word
+        if not self._shown:
+            self.label.grid()
+            self._shown = True
+        if keyword:
+            self.var.set(0)
+            if not self.keyword:
+                self.button.grid()
+        elif self.keyword:
+            self.button.grid_remove()
+        self.keyword = keyword
+
+    def hide(self):
+        """ Hide the cell, keeping its widgets for reuse. """
+        if self._shown:
+            self.label.grid_remove()
+            self._shown = False
+        if self.keyword:
+            self.button.grid_remove()
+            self.keyword = False
+
 ############
 # MainView #
 ############
@@ -32,6 +92,10 @@ class MainView(ttk.Frame):
         self.words_dict = {}
         self.buttons_dict = {}
         self.buttonstates_dict = {}
+        # Pooled word cells (see update_main_label)
+        self._cells = []
+        # Whether the passage display is showing
+        self._passage_shown = False
 
         # Draw widgets
         self._draw_widgets()
@@ -55,7 +119,7 @@ class MainView(ttk.Frame):
             text='Sentence:', 
             padding=8, 
             width=500, 
-            height=90
+            height=SENTENCE_HEIGHT
             )
         self.frm_sentence.grid(
             column=5, 
@@ -66,6 +130,14 @@ class MainView(ttk.Frame):
             )
         self.frm_sentence.grid_propagate(0)
 
+        # Passage display for sentences too long for one line
+        # (gridded by update_main_label when needed)
+        self.passage = PassageView(
+            self.frm_sentence,
+            width=500 - 2 * 8,
+            height=PASSAGE_HEIGHT - 60
+            )
+
         # Vertical separator for session info
         sep = ttk.Separator(frm_main, orient='vertical')
         sep.grid(column=20, row=5, rowspan=50, sticky='ns')
@@ -154,46 +226,67 @@ class MainView(ttk.Frame):
     ###########
     # Methods #
     ###########
-    def _reset(self):
-        """ Destroy all labels and checkbuttons in main label. 
-        Reset all dicts to empty.
-        """
-        # Destroy labels
-        for key in self.words_dict.keys():
-            self.words_dict[key].destroy()
-
-        # Destroy boxes
-        for key in self.buttons_dict.keys():
-            self.buttons_dict[key].destroy()
-
-        # Clear dicts
-        self.words_dict = {}
-        self.buttons_dict = {}
-        self.buttonstates_dict = {}
-
     def update_main_label(self, sentence):
         """ Update the main label to display the written sentence
         with checkbuttons below key words.
-        """
-        # Clear main label
-        self._reset()
 
+        Word cells are pooled: the pool grows to the longest
+        sentence seen, cells are re-texted and their IntVars reset
+        in place, and unused cells are hidden (not destroyed).
+        Sentences too wide for one line of cells are shown in the
+        scrollable passage display instead.
+        """
         # Split sentence into list of words
         words = sentence.split()
+        self.words_dict = {}
+        self.buttons_dict = {}
+        self.buttonstates_dict = {}
+
+        if self.passage.natural_width(words) > self.passage.line_width:
+            self._show_passage(sentence)
+            return
+        if self._passage_shown:
+            self.passage.grid_remove()
+            self.frm_sentence.configure(height=SENTENCE_HEIGHT)
+            self._passage_shown = False
+
+        # Grow the pool to the longest sentence seen
+        while len(self._cells) < len(words):
+            self._cells.append(WordCell(self.frm_sentence, len(self._cells)))
 
         # Populate main label
         for ii, word in enumerate(words):
-            self.words_dict[ii] = ttk.Label(self.frm_sentence, text=word)
-            self.words_dict[ii].grid(row=5, column=ii)
-            if word == word.upper():
-                self.buttonstates_dict[ii] = tk.IntVar(value=0)
-                self.buttons_dict[ii] = ttk.Checkbutton(
-                    self.frm_sentence, 
-                    text="",
-                    takefocus=0,
-                    variable=self.buttonstates_dict[ii]
-                    )
-                self.buttons_dict[ii].grid(row=10, column=ii)
+            cell = self._cells[ii]
+            cell.show(word, keyword=word == word.upper())
+            self.words_dict[ii] = cell.label
+            if cell.keyword:
+                self.buttons_dict[ii] = cell.button
+                self.buttonstates_dict[ii] = cell.var
+
+        # Hide cells left over from longer sentences
+        for cell in self._cells[len(words):]:
+            cell.hide()
+
+    def _show_passage(self, sentence):
+        """ Display a long sentence or passage in the passage view.
+        Its words stand in for the labels and IntVars in the dicts.
+        """
+        logger.info("Displaying passage")
+        for cell in self._cells:
+            cell.hide()
+        if not self._passage_shown:
+            self.frm_sentence.configure(height=PASSAGE_HEIGHT)
+            self.passage.grid(row=0, column=0, sticky='nw')
+            self._passage_shown = True
+        for ii, word in enumerate(self.passage.show(sentence)):
+            self.words_dict[ii] = word
+            if word.keyword:
+                self.buttonstates_dict[ii] = word
+
+    def marked_words(self):
+        """ Return the indexes of the key words marked correct. """
+        return {ii for ii, state in self.buttonstates_dict.items()
+                if state.get() == 1}
 
     def enable_user_controls(self, text):
         """ Enable user controls. Set NEXT button text. """
@@ -226,6 +319,8 @@ class MainView(ttk.Frame):
         # Set all checkbutton variables to 1 (i.e., selected)
         for ii in self.buttonstates_dict:
             self.buttonstates_dict[ii].set(1)
+        if self._passage_shown:
+            self.passage.redraw()
 
     def _on_repeat(self):
         """ Repeat the current sentence. """
@@ -0,0 +1,248 @@
+""" Scrollable passage display for long-form stimuli.
+
+    Draws a word-wrapped passage on a canvas, with a checkbox below
+    each key word. Words are laid out by models.PassageLayout and
+    only the lines in view (plus one line either side) have canvas
+    items; the items are pooled and moved as the passage scrolls.
+
+    Created: October 17, 2026
+"""
+
+###########
+# Imports #
+###########
+# Standard library
+import logging
+import tkinter as tk
+from tkinter import font as tkfont
+from tkinter import ttk
+
+# Custom
+from models.passagelayout import PassageLayout
+
+##########
+# Logger #
+##########
+# Create new logger
+logger = logging.getLogger(__name__)
+
+#############
+# Constants #
+#############
+BOX = 13        # Checkbox size (px)
+GAP = 2         # Between a word and its checkbox (px)
+SPACING = 10    # Between words on a line (px)
+LEADING = 8     # Between lines (px)
+
+###############
+# PassageWord #
+###############
+class PassageWord:
+    """ One word of a passage. Answers cget('text') like a label and
+    get()/set() like the IntVar of its checkbox, so ScoreModel can
+    score a passage the same way as a sentence.
+    """
+
+    __slots__ = ('text', 'keyword', 'state')
+
+    def __init__(self, text, keyword):
+        self.text = text
+        self.keyword = keyword
+        self.state = 0
+
+    def cget(self, option):
+        if option != 'text':
+            raise tk.TclError(f'unknown option "-{option}"')
+        return self.text
+
+    def get(self):
+        return self.state
+
+    def set(self, value):
+        self.state = int(value)
+
+###############
+# PassageView #
+###############
+class PassageView(ttk.Frame):
+    def __init__(self, parent, width, height, *args, **kwargs):
+        super().__init__(parent, *args, **kwargs)
+        logger.info("Initializing PassageView")
+
+        # Assign attributes
+        self.font = tkfont.nametofont('TkDefaultFont')
+        self.words = []
+        self.layout = None
+        # Slot width of every word measured so far
+        self._widths = {}
+        # Pooled canvas items
+        self._texts = []
+        self._boxes = []
+        # Box and mark item ids -> word index (items in view only)
+        self._box_words = {}
+
+        # Draw widgets
+        self._draw_widgets(width, height)
+
+    def _draw_widgets(self, width, height):
+        """ Draw widgets. """
+        self.scrollbar = ttk.Scrollbar(self, orient='vertical')
+        self.scrollbar.grid(row=5, column=10, sticky='ns')
+        self.canvas = tk.Canvas(
+            self,
+            width=width - self.scrollbar.winfo_reqwidth(),
+            height=height,
+            highlightthickness=0,
+            yscrollincrement=self.line_height
+            )
+        self.canvas.grid(row=5, column=5, sticky='nsew')
+        self.canvas.configure(yscrollcommand=self._on_yview)
+        self.scrollbar.configure(command=self.canvas.yview)
+
+        # Bindings
+        self.canvas.bind('<Configure>', self._on_configure)
+        self.canvas.bind('<MouseWheel>', self._on_wheel)
+        self.canvas.bind('<Button-4>', self._on_wheel)
+        self.canvas.bind('<Button-5>', self._on_wheel)
+        self.canvas.tag_bind('box', '<Button-1>', self._on_box_click)
+
+    @property
+    def line_height(self):
+        """ Height of a line of words and checkboxes (px). """
+        return self.font.metrics('linespace') + GAP + BOX + LEADING
+
+    ###########
+    # Methods #
+    ###########
+    def natural_width(self, words):
+        """ Return the width of a list of words on one line (px). """
+        return sum(self._slot_width(word) + SPACING for word in words)
+
+    def show(self, sentence):
+        """ Display a passage, scrolled to the top, and return its
+        PassageWord objects.
+        """
+        self.words = [PassageWord(word, word == word.upper())
+                      for word in sentence.split()]
+        self._relayout()
+        self.canvas.yview_moveto(0)
+        self.redraw()
+        return self.words
+
+    def redraw(self):
+        """ Draw the words in view, reusing pooled canvas items. """
+        if self.layout is None:
+            return
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        start, stop = self.layout.visible(
+            top - self.line_height, bottom + self.line_height)
+        text_h = self.font.metrics('linespace')
+        self._box_words = {}
+        n_boxes = 0
+        for n_texts, ii in enumerate(range(start, stop)):
+            word = self.words[ii]
+            center = (int(self.layout.x[ii])
+                      + int(self.layout.widths[ii]) // 2)
+            y = self.layout.y(ii)
+            if n_texts == len(self._texts):
+                self._texts.append(self.canvas.create_text(
+                    0, 0, anchor='n', font=self.font))
+            item = self._texts[n_texts]
+            self.canvas.itemconfigure(item, text=word.text, state='normal')
+            self.canvas.coords(item, center, y)
+            if word.keyword:
+                if n_boxes == len(self._boxes):
+                    self._boxes.append(self._create_box())
+                box, mark = self._boxes[n_boxes]
+                x0 = center - BOX // 2
+                y0 = y + text_h + GAP
+                self.canvas.coords(box, x0, y0, x0 + BOX, y0 + BOX)
+                self.canvas.coords(mark, x0 + 3, y0 + 3,
+                                   x0 + BOX - 3, y0 + BOX - 3)
+                self.canvas.itemconfigure(box, state='normal')
+                self.canvas.itemconfigure(
+                    mark, state='normal' if word.state else 'hidden')
+                self._box_words[box] = ii
+                self._box_words[mark] = ii
+                n_boxes += 1
+        # Hide pooled items not needed for this view
+        for item in self._texts[stop - start:]:
+            self.canvas.itemconfigure(item, state='hidden')
+        for box, mark in self._boxes[n_boxes:]:
+            self.canvas.itemconfigure(box, state='hidden')
+            self.canvas.itemconfigure(mark, state='hidden')
+
+    def _create_box(self):
+        """ Return the (box, mark) items of a new checkbox. """
+        box = self.canvas.create_rectangle(
+            0, 0, 0, 0, outline='gray30', fill='white', tags=('box',))
+        mark = self.canvas.create_rectangle(
+            0, 0, 0, 0, outline='', fill='gray20', tags=('box',))
+        return box, mark
+
+    def _slot_width(self, word):
+        """ Return the (cached) slot width of a word (px). """
+        width = self._widths.get(word)
+        if width is None:
+            width = max(self.font.measure(word), BOX)
+            self._widths[word] = width
+        return width
+
+    @property
+    def line_width(self):
+        """ Width available to a line of words (px). """
+        return max(self.canvas.winfo_width(), int(self.canvas.cget('width')))
+
+    def _relayout(self):
+        """ Wrap the passage to the canvas width. """
+        self.layout = PassageLayout(
+            [self._slot_width(word.text) for word in self.words],
+            line_width=self.line_width,
+            line_height=self.line_height,
+            spacing=SPACING
+            )
+        # Triggers _on_yview, which redraws
+        self.canvas.configure(scrollregion=(
+            0, 0, self.line_width, self.layout.height))
+
+    ############
+    # Bindings #
+    ############
+    def _on_yview(self, first, last):
+        """ Update the scrollbar and draw the words now in view. """
+        self.scrollbar.set(first, last)
+        self.redraw()
+
+    def _on_configure(self, event):
+        """ Re-wrap the passage when the canvas width changes, and
+        fill in lines that came into view when its height changed.
+        """
+        if self.layout is None:
+            return
+        if self.line_width != self.layout.line_width:
+            self._relayout()
+        else:
+            self.redraw()
+
+    def _on_wheel(self, event):
+        """ Scroll by one line per wheel step. """
+        if event.num == 4 or event.delta > 0:
+            self.canvas.yview_scroll(-1, 'units')
+        else:
+            self.canvas.yview_scroll(1, 'units')
+
+    def _on_box_click(self, event):
+        """ Toggle the checkbox under the pointer. """
+        item = self.canvas.find_withtag('current')
+        if not item or item[0] not in self._box_words:
+            return
+        word = self.words[self._box_words[item[0]]]
+        word.set(not word.state)
+        self.redraw()
+
+################
+# Module Guard #
+################
+if __name__ == '__main__':
+    pass